@@ -22,6 +22,9 @@ class Node(object):
     """
     __slots__ = ()
 
+    # Attributes left out of the representation
+    repr_hidden = ()
+
     def __repr__(self):
         """ Generates a python representation of the current node
         """
@@ -29,6 +32,8 @@ class Node(object):
         indent = ''
         separator = ''
         for name in self.__slots__[:-1]:
+            if name in self.repr_hidden:
+                continue
             result += separator
             result += indent
             result += name + '=' + (_repr(getattr(self, name)).replace('\n', '\n  ' + (' ' * (len(name) + len(self.__class__.__name__)))))
@@ -105,6 +110,36 @@ class Program(Node):
     attr_names = ()
 
 
+# Names of the identifiers by symbol id, and the symbol id of each name,
+# for the whole process.  The names are interned: the tokens and IDs with
+# the same name share a single string (see intern_name)
+_names = []
+_symbols = {}
+
+
+def symbol(name):
+    """ Return the symbol id of the identifier name: a dense int,
+        given to it the first time.
+    """
+    try:
+        return _symbols[name]
+    except KeyError:
+        name = sys.intern(name)
+        _symbols[name] = len(_names)
+        _names.append(name)
+        return _symbols[name]
+
+
+def symbol_name(sid):
+    """ Inverse of symbol() """
+    return _names[sid]
+
+
+def intern_name(name):
+    """ Return the string shared by all the identifiers named name """
+    return _names[symbol(name)]
+
+
 class Coord(object):
     """ Coordinates of a syntactic element. Consists of:
             - Line number
@@ -713,9 +748,11 @@ class Return(Node):
 
 
 class ID(Node):
-    __slots__ = ('name', 'coord','type','bind','scope','gen_location','model')
+    __slots__ = ('name', 'symbol', 'coord','type','bind','scope','gen_location','model')
+    repr_hidden = ('symbol',)
     def __init__(self, name, coord=None):
         self.name = name
+        self.symbol = symbol(name)
         self.coord = coord
         self.type = None
         self.bind = None
@@ -0,0 +1,67 @@
+'''
+Benchmark of the code generation of a large, generated, uC program.
+Only GenerateCode is timed; the program is parsed and checked before.
+The generate() of this module makes the programs of the other
+benchmarks too.
+
+    python benchmarks/codegen.py [functions] [repeat]
+'''
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from parser import UCParser
+from uc_code import GenerateCode
+from uc_sema import Visitor
+
+FUNCTION = '''
+int f%(n)d(int a) {
+    int b;
+    int v[3] = {1, 2, 3};
+    b = f%(prev)d(a) * 2 + g;
+    if (b > 10) {
+        b = b - v[1];
+    } else {
+        b = b + 1;
+    }
+    while (b > 100) {
+        b = b / 2;
+    }
+    assert b > 0;
+    return b;
+}
+'''
+
+
+def generate(functions):
+    source = ['int g = 3;\nint f0(int a) {\n    return a;\n}\n']
+    for n in range(1, functions):
+        source.append(FUNCTION % {'n': n, 'prev': n - 1})
+    source.append('int main() {\n    return f%d(1);\n}\n' % (functions - 1))
+    return ''.join(source)
+
+
+def codegen(source):
+    ast = UCParser().parse(source, '', False)
+    Visitor(False).visit(ast)
+    gen = GenerateCode()
+    start = time.perf_counter()
+    gen.visit(ast)
+    return time.perf_counter() - start, gen.text + gen.code
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    source = generate(functions)
+    print("%d functions, %d lines" % (functions, source.count('\n')))
+    elapsed, code = min(codegen(source) for _ in range(repeat))
+    print("GenerateCode: %8.1f ms  %8d instructions  (%.0f functions/s)"
+          % (elapsed * 1000, len(code), functions / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+'''
+Benchmark of the uC lexer backends (see UCLexer.build) on a large,
+generated, uC program, token by token (token()) and in bulk
+(tokenize()).  All the backends are first checked to return the same
+tokens as ply on the testesSusy programs and on the generated one.
+
+Only the bulk path gains: tokenize() fills a TokenArray without making
+a LexToken per token, and LRDriver reads it as it is (see
+benchmarks/parser.py).  The token() of the fast backend still makes a
+LexToken per token, as ply does, which is most of the time of ply's
+token(): it is no faster than ply, from 0.6x to 1.6x of it from run to
+run.  Its tokenize() is 1.4x to 1.8x of ply's token(), and 1.1x to 1.2x
+of the tokenize() of the ply backend, which also skips the LexTokens.
+
+    python benchmarks/lexer.py [functions] [repeat]
+'''
+
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from codegen import generate
+from lexer import UCLexer
+
+
+def lexer(backend):
+    lex = UCLexer(None)
+    lex.build(backend=backend)
+    return lex
+
+
+def by_token(lex, source):
+    lex.reset_lineno()
+    lex.input(source)
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in iter(lex.token, None)]
+
+
+def in_bulk(lex, source):
+    tokens = lex.tokenize(source)
+    return [(tokens.type(i), tokens.value(i), tokens.lines[i], tokens.starts[i]) for i in range(len(tokens))]
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    source = generate(functions)
+    lexers = {backend: lexer(backend) for backend in UCLexer.backends}
+
+    programs = [open(name).read() for name in sorted(glob.glob(os.path.join(ROOT, 'testesSusy', '*.uc')))]
+    for program in programs + [source]:
+        expected = by_token(lexers['ply'], program)
+        for backend, lex in lexers.items():
+            assert by_token(lex, program) == expected, "%s tokens differ from ply's" % backend
+            assert in_bulk(lex, program) == expected, "%s tokenize() differs from ply's tokens" % backend
+    print("%d programs checked, %d functions generated (%d bytes)" % (len(programs), functions, len(source)))
+
+    def token_loop(lex):
+        lex.reset_lineno()
+        lex.input(source)
+        for _ in iter(lex.token, None):
+            pass
+
+    results = []
+    for backend, lex in lexers.items():
+        for name, function, arg in (('token()', token_loop, lex), ('tokenize()', lex.tokenize, source)):
+            results.append((backend, name, min(timed(function, arg) for _ in range(repeat))))
+    baseline = results[0][2]        # ply, token()
+    for backend, name, elapsed in results:
+        print("%-5s %-11s %8.1f ms  (%.2fx)" % (backend, name, elapsed * 1000, baseline / elapsed))
+
+
+if __name__ == '__main__':
+    main()
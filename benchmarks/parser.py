@@ -0,0 +1,78 @@
+'''
+Benchmark of the LR drivers of the uC parser on a large, generated, uC
+program: ply's LRParser and the LRDriver of uc_lr, which UCParser runs
+on the tables built by ply.  The tokens are made before, only the parse
+is timed.  Both are first checked to build the same AST, coordinates
+included, and to report the same syntax errors, on the testesSusy
+programs and on the generated one.
+
+    python benchmarks/parser.py [functions] [repeat]
+'''
+
+import glob
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from codegen import generate
+from lexer import TokenStream
+from parser import UCParser
+
+
+def with_ply(parser, tokens):
+    parser.errors = 0
+    parser.stream = TokenStream(tokens)
+    return parser.parser.parse(lexer=parser.stream, tracking=False)
+
+
+def with_driver(parser, tokens):
+    return parser.parse(tokens)     # A TokenArray goes to the LRDriver
+
+
+def result(driver, parser, tokens):
+    ''' Return the AST shown with its coordinates and the errors '''
+    errors = []
+    parser.error_func = lambda coord, message: errors.append((coord, message))
+    ast = driver(parser, tokens)
+    buf = io.StringIO()
+    if ast is not None:
+        ast.show(buf=buf, showcoord=True)
+    return buf.getvalue(), errors
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    source = generate(functions)
+    parser = UCParser()
+    parser.parse('int main() { return 0; }')       # Builds the lexer and the tables
+
+    programs = [open(name).read() for name in sorted(glob.glob(os.path.join(ROOT, 'testesSusy', '*.uc')))]
+    for program in programs + [source]:
+        tokens = parser.lexer.tokenize(program)
+        assert result(with_driver, parser, tokens) == result(with_ply, parser, tokens), \
+            "LRDriver differs from ply"
+    print("%d programs checked, %d functions generated (%d bytes)" % (len(programs), functions, len(source)))
+
+    parser.error_func = None
+    tokens = parser.lexer.tokenize(source)
+    results = [(name, min(timed(driver, parser, tokens) for _ in range(repeat)))
+               for name, driver in (('ply', with_ply), ('LRDriver', with_driver))]
+    baseline = results[0][1]
+    for name, elapsed in results:
+        print("%-8s %8.1f ms  %8.0f tokens/s  (%.2fx)" % (name, elapsed * 1000, len(tokens) / elapsed,
+                                                         baseline / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+'''
+Benchmark of the start-up of the compiler, which dominates when each file
+is compiled by a process of its own.  Each case runs in a new interpreter
+and is timed from its start until it exits:
+
+    python          an empty Python program, the lower bound
+    -help           main.py -help, which only parses the options
+    first token     importing the lexer, building it and getting a token
+    compile         main.py on a small program, without running it
+    run object      main.py -run-ir on the object file of that program
+
+The bytecode of the modules is cached after the first run, as in a normal
+installation, so each case is run once before it is timed.
+
+    python benchmarks/startup.py [repeat]
+'''
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from codegen import generate
+
+FIRST_TOKEN = '''
+import sys
+sys.path.insert(0, %r)
+from lexer import UCLexer
+lexer = UCLexer(None)
+lexer.build()
+lexer.input('int main() { return 0; }')
+lexer.token()
+''' % ROOT
+
+
+def timed(args, env):
+    start = time.perf_counter()
+    subprocess.run(args, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    main_py = os.path.join(ROOT, 'main.py')
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'small.uc')
+        with open(source, 'w') as f:
+            f.write(generate(10))
+        subprocess.run([sys.executable, main_py, source, '-obj', '-no-run'], env=env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        cases = (
+            ('python', [sys.executable, '-c', 'pass']),
+            ('-help', [sys.executable, main_py, '-help']),
+            ('first token', [sys.executable, '-c', FIRST_TOKEN]),
+            ('compile', [sys.executable, main_py, source, '-no-run', '-no-ast', '-no-ir']),
+            ('run object', [sys.executable, main_py, source, '-run-ir']),
+        )
+        for name, args in cases:
+            timed(args, env)
+            times = sorted(timed(args, env) for _ in range(repeat))
+            print("%-12s %8.1f ms  (min %.1f ms)" % (name, times[len(times) // 2] * 1000, times[0] * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,18 @@
+import os
+import re
+from array import array
 import ply.lex as lex
+from ast import intern_name
+
+# Lexers built from the specification, one for each value of optimize,
+# cloned by UCLexer.build() (see _template)
+_templates = {}
+
+# Master regex of a lexer -> (scanner, kinds), see _scanner
+_scanners = {}
+
+# Kinds of the groups of a scanner that aren't a token type
+_IGNORE, _KEYWORD, _NEWLINE, _ERROR = -1, -2, -3, -4
 
 class UCLexer:
     """ A lexer for the uC language. After building it, set the
@@ -18,13 +32,36 @@ class UCLexer:
         # Keeps track of the last token returned from self.token()
         self.last_token = None
 
-    def build(self, **kwargs):
+    # Scanners build() can use
+    backends = ('ply', 'fast')
+
+    def build(self, optimize=False, backend='ply', **kwargs):
         """ Builds the lexer from the specification. Must be
             called after the lexer object is created.
             This method exists separately, because the PLY
             manual warns against calling lex.lex inside __init__
+
+            Validating the specification and compiling its master
+            regex is done once per process: the lexer is a clone of
+            a template shared by all UCLexers.  With optimize=True,
+            the template is loaded from a precomputed table, written
+            the first time in the cache directory of the user (see
+            _lextab).  Any other option (debug, reflags...) builds a
+            lexer of its own.
+
+            backend='fast' uses a FastScanner, which returns the same
+            tokens, instead of the ply lexer.
         """
-        self.lexer = lex.lex(object=self, **kwargs)
+        if backend not in self.backends:
+            raise ValueError("Unknown lexer backend: %s" % backend)
+        self.backend = backend
+        if backend == 'fast':
+            self.lexer = FastScanner()
+        elif kwargs:
+            self.lexer = lex.lex(object=self, optimize=optimize, **kwargs)
+        else:
+            self.lexer = _template(optimize).clone(self)
+            self.lexer.begin('INITIAL')
 
     def reset_lineno(self):
         """ Resets the internal line number counter of the lexer.
@@ -38,6 +75,51 @@ class UCLexer:
         self.last_token = self.lexer.token()
         return self.last_token
 
+    def tokenize(self, text):
+        """ Splits the whole text in tokens at once and returns them
+            in a TokenArray, which takes much less memory than the
+            LexTokens returned by token() one at a time.  The rules
+            of the specification are applied directly, without calling
+            back the t_ functions.
+        """
+        if self.backend == 'fast':
+            return self.lexer.tokenize(text)
+        if len(self.lexer.lexre) != 1:
+            raise ValueError("tokenize() needs a single master regex")
+        scanner, kinds = _scanner(self.lexer)
+        keyword_ids = _keyword_ids
+        tokens = TokenArray(text)
+        types, starts, lengths, lines = tokens.types, tokens.starts, tokens.lengths, tokens.lines
+        lineno = 1
+        for m in scanner.finditer(text):
+            kind = kinds[m.lastindex]
+            if kind < 0:
+                if kind == _IGNORE:
+                    continue
+                elif kind == _NEWLINE:
+                    lineno += m.end() - m.start()
+                    continue
+                elif kind == _KEYWORD:
+                    kind = keyword_ids.get(m.group(), _id)
+                else:
+                    print("Illegal character '%s'" % m.group())
+                    continue
+            start = m.start()
+            types.append(kind)
+            starts.append(start)
+            lengths.append(m.end() - start)
+            lines.append(lineno)
+        return tokens
+
+    def stream(self, file, chunk_size=1 << 16):
+        """ Generates the tokens of the text read from file, chunk_size
+            characters at a time, so the whole text is never in memory.
+            Whatever the backend, the tokens are scanned by a
+            FastScanner (the same as ply's) and, as there is no lexdata
+            to find it later, they come with their column.
+        """
+        return FastScanner().stream(file, chunk_size)
+
     def find_tok_column(self, token):
         """ Find the column of the token in its line.
         """
@@ -116,6 +198,8 @@ class UCLexer:
     def t_ID(self, t):
         r'[a-zA-Z_][a-zA-Z0-9_]*'
         t.type = self.keyword_map.get(t.value, "ID")
+        if t.type == "ID":
+            t.value = intern_name(t.value)
         return t
 
     def t_FLOAT_CONST(self, t):
@@ -155,6 +239,356 @@ class UCLexer:
         print("Illegal character '%s'" % t.value[0])
         t.lexer.skip(1)
 
+
+# Type ids of the tokens, as stored in TokenArray.types
+_token_ids = {name: i for i, name in enumerate(UCLexer.tokens)}
+_keyword_ids = {value: _token_ids[name] for value, name in UCLexer.keyword_map.items()}
+_id = _token_ids['ID']
+
+
+def _scanner(lexer):
+    """ Returns a regex matching, one after the other, all the tokens,
+        ignored characters and illegal characters of a text, for the
+        ply lexer lexer, and the kind of each of its groups: the type
+        id of the token or a negative _KIND.
+    """
+    master, rules = lexer.lexre[0]
+    try:
+        return _scanners[master]
+    except KeyError:
+        pass
+    scanner = re.compile('([%s]+)|%s|(?P<error>.)' % (re.escape(lexer.lexignore), master.pattern),
+                         master.flags)
+    kinds = [None, _IGNORE]         # Group 1 matches the ignored characters
+    for rule in rules[1:]:
+        if rule is None:
+            kinds.append(_IGNORE)      # A group inside a rule, never the last one
+        elif rule[1] == 'ID':
+            kinds.append(_KEYWORD)
+        elif rule[1] == 'newline':
+            kinds.append(_NEWLINE)
+        elif rule[1] in _token_ids:
+            kinds.append(_token_ids[rule[1]])
+        else:
+            kinds.append(_IGNORE)      # Comments
+    kinds.append(_ERROR)
+    _scanners[master] = (scanner, kinds)
+    return scanner, kinds
+
+
+# Token types of the operators, by their text
+_operators = {
+    '++': 'PLUSPLUS', '+=': 'ASSIGN_PLUS', '+': 'PLUS',
+    '--': 'MINUSMINUS', '-=': 'ASSIGN_MINUS', '-': 'MINUS',
+    '*=': 'ASSIGN_TIMES', '*': 'TIMES', '/=': 'ASSIGN_DIVIDE', '/': 'DIVIDE',
+    '%=': 'ASSIGN_MOD', '%': 'MOD', '==': 'EQ', '=': 'EQUALS',
+    '&&': 'AND', '&': 'ADDRESS', '||': 'OR', '!=': 'DIFF', '!': 'NOT',
+    '<=': 'LE', '<': 'LT', '>=': 'HE', '>': 'HT',
+    '(': 'LPAREN', ')': 'RPAREN', '[': 'LBRACKET', ']': 'RBRACKET',
+    '{': 'LBRACE', '}': 'RBRACE', ',': 'COMMA', ';': 'SEMI',
+}
+
+# Type ids of the operators, by their text
+_operator_ids = {op: _token_ids[name] for op, name in _operators.items()}
+
+
+class FastScanner:
+    """ A hand-written scanner for the uC tokens, the 'fast' backend
+        of UCLexer.build().  The first character of a token selects
+        its class (identifiers, numbers, operators...), matched with
+        a single regex that also skips the blanks after it, so no
+        Python function runs for each rule.  It returns the same
+        tokens as the ply lexer, including its quirks: the newlines in
+        comments and strings aren't counted, and '.' alone is a
+        FLOAT_CONST.  Besides tokenize(), it has the part of the
+        interface of the ply lexer used by UCLexer, whose token()
+        returns the tokens of the whole input, scanned by input().
+        Only tokenize() is faster than ply's token(): token() makes a
+        LexToken of each token, as ply does.
+    """
+
+    # Classes of tokens, by their first character
+    WORD, NUMBER, CHAR, STRING, SLASH, OPERATOR, SPACE, NEWLINE = range(8)
+
+    classes = {}
+    for c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_':
+        classes[c] = WORD
+    for c in '0123456789.':
+        classes[c] = NUMBER
+    for c in '+-*%=&|!<>()[]{},;':
+        classes[c] = OPERATOR
+    classes.update({"'": CHAR, '"': STRING, '/': SLASH, ' ': SPACE, '\t': SPACE, '\n': NEWLINE})
+    del c
+
+    # Group 1 is the token, or the newlines, followed by the blanks
+    regexes = {
+        WORD: re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)[ \t]*'),
+        NUMBER: re.compile(r'((\d*\.\d*)|[0-9]+)[ \t]*'),          # Group 2: FLOAT_CONST
+        CHAR: re.compile(r"('.')[ \t]*"),
+        STRING: re.compile(r'("[^"]*")[ \t]*'),
+        SLASH: re.compile(r'((/\*(?:.|\n)*?\*/|//.*)|/=|/)[ \t]*'),  # Group 2: comment
+        OPERATOR: re.compile(r'(\+\+|\+=|--|-=|\*=|%=|&&|\|\||==|!=|<=|>=|[-+*%=&!<>()\[\]{},;])[ \t]*'),
+        SPACE: re.compile(r'([ \t]+)'),
+        NEWLINE: re.compile(r'(\n+)[ \t]*'),
+    }
+    matchers = {cls: regex.match for cls, regex in regexes.items()}
+
+    def __init__(self):
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lineno = 1
+        self._tokens = TokenArray('')
+        self._next = 0
+
+    def input(self, text):
+        self.lexdata = text
+        self.lexpos = 0
+        self._tokens = self.tokenize(text, self.lineno)
+        self._next = 0
+
+    def token(self):
+        """ Returns the next token as a LexToken, or None at the end """
+        i = self._next
+        if i == len(self._tokens):
+            return None
+        self._next = i + 1
+        tok = self._tokens.token(i)
+        tok.lexer = self
+        self.lexpos = tok.lexpos + len(tok.value)
+        self.lineno = tok.lineno
+        return tok
+
+    def tokenize(self, text, lineno=1):
+        """ Same as UCLexer.tokenize() """
+        tokens = TokenArray(text)
+        add_type, add_start = tokens.types.append, tokens.starts.append
+        add_length, add_line = tokens.lengths.append, tokens.lines.append
+        for type_id, start, stop, line in self._scan(text, 0, lineno):
+            if type_id >= 0:
+                add_type(type_id)
+                add_start(start)
+                add_length(stop - start)
+                add_line(line)
+        return tokens
+
+    def scan(self, text, pos=0, lineno=1):
+        """ Generates the (type id, start, end, line) of the tokens of
+            text from pos, which must not be inside a token or comment,
+            where the line is lineno.  Unlike tokenize(), it can be
+            stopped at any token, and then resumed from its end.  The
+            illegal characters are generated too, with type id -1.
+        """
+        return self._scan(text, pos, lineno)
+
+    def stream(self, file, chunk_size=1 << 16):
+        """ Same as UCLexer.stream() """
+        names = UCLexer.tokens
+        buf = ''
+        base = 0                        # Offset of buf in the text
+        last_cr = -1                    # Offset of the last newline before buf
+        lineno = 1
+        final = False
+        while not final:
+            chunk = file.read(chunk_size)
+            final = not chunk
+            buf += chunk
+            # What follows the last token is scanned again with the next chunk
+            pos = 0
+            for type_id, start, stop, line in self._scan(buf, 0, lineno, final):
+                pos, lineno = stop, line
+                if type_id < 0:
+                    continue
+                tok = lex.LexToken()
+                tok.type = names[type_id]
+                tok.value = buf[start:stop]
+                if type_id == _id:
+                    tok.value = intern_name(tok.value)
+                tok.lineno = line
+                tok.lexpos = base + start
+                cr = buf.rfind('\n', 0, start)
+                tok.column = start - cr if cr >= 0 else base + start - last_cr
+                yield tok
+            cr = buf.rfind('\n', 0, pos)
+            if cr >= 0:
+                last_cr = base + cr
+            buf = buf[pos:]
+            base += pos
+
+    def _scan(self, text, pos, lineno, final=True):
+        """ The scanner of tokenize(), scan() and stream(), generating
+            the tokens as scan() does.  Unless final, text is only the
+            start of the input, and it stops at the first token that
+            could go on after its end.
+        """
+        classes = self.classes.get
+        matchers = self.matchers
+        keyword_ids = _keyword_ids.get
+        operator_ids = _operator_ids
+        id_id, float_id, int_id = _id, _token_ids['FLOAT_CONST'], _token_ids['INT_CONST']
+        char_id, string_id = _token_ids['CHAR_CONST'], _token_ids['STRING']
+        WORD, NUMBER, CHAR, STRING, SLASH, OPERATOR, SPACE, NEWLINE = range(8)
+        end = len(text)
+        while pos < end:
+            c = text[pos]
+            cls = classes(c)
+            if cls is None and c.isdecimal():
+                cls = NUMBER                    # \d matches any decimal digit
+            m = matchers[cls](text, pos) if cls is not None else None
+            if not final and (m.end() == end if m is not None else cls == STRING or end - pos < 3):
+                return
+            if m is None:
+                print("Illegal character '%s'" % c)
+                yield -1, pos, pos + 1, lineno
+                pos += 1
+                continue
+            value = m.group(1)
+            if cls == WORD:
+                type_id = keyword_ids(value, id_id)
+            elif cls == OPERATOR:
+                type_id = operator_ids[value]
+            elif cls == NUMBER:
+                type_id = int_id if m.group(2) is None else float_id
+            elif cls == SLASH and m.group(2) is None:
+                if not final and value == '/' and text.startswith('*', pos + 1):
+                    return                      # A comment not closed yet
+                type_id = operator_ids[value]
+            elif cls == CHAR:
+                type_id = char_id
+            elif cls == STRING:
+                type_id = string_id
+            else:
+                if cls == NEWLINE:
+                    lineno += len(value)
+                pos = m.end()
+                continue
+            yield type_id, pos, pos + len(value), lineno
+            pos = m.end()
+
+
+class TokenArray:
+    """ The tokens of a text, as returned by UCLexer.tokenize(), in
+        parallel arrays: the type id (the index of its name in
+        UCLexer.tokens), the offset, the length and the line of each
+        token.  Their values are only sliced from the text on demand.
+    """
+    __slots__ = ('text', 'types', 'starts', 'lengths', 'lines')
+
+    def __init__(self, text):
+        self.text = text
+        self.types = array('B')
+        self.starts = array('i')
+        self.lengths = array('i')
+        self.lines = array('i')
+
+    def __len__(self):
+        return len(self.types)
+
+    def type(self, i):
+        return UCLexer.tokens[self.types[i]]
+
+    def value(self, i):
+        start = self.starts[i]
+        return self.text[start:start + self.lengths[i]]
+
+    def __iter__(self):
+        return map(self.token, range(len(self.types)))
+
+    def token(self, i):
+        """ Returns the i-th token as a LexToken, like UCLexer.token() """
+        tok = lex.LexToken()
+        tok.type = UCLexer.tokens[self.types[i]]
+        tok.lexpos = start = self.starts[i]
+        tok.value = self.text[start:start + self.lengths[i]]
+        if self.types[i] == _id:
+            tok.value = intern_name(tok.value)
+        tok.lineno = self.lines[i]
+        return tok
+
+
+class TokenStream:
+    """ Adapter feeding tokens to the yacc parser, passed as its lexer:
+
+            parser.parse(lexer=TokenStream(uclexer.tokenize(text)))
+
+        tokens is a TokenArray, or any iterable of LexTokens, such as
+        the generator returned by UCLexer.stream().
+    """
+
+    def __init__(self, tokens):
+        self.tokens = iter(tokens)
+        self.lexdata = getattr(tokens, 'text', None)
+        self.lineno = 1
+        self.lexpos = 0
+
+    def token(self):
+        tok = next(self.tokens, None)
+        if tok is None:
+            return None
+        tok.lexer = self
+        self.lineno = tok.lineno
+        self.lexpos = tok.lexpos
+        return tok
+
+
+def _template(optimize):
+    """ Returns the lexer all the UCLexers are cloned from, building
+        it on the first call.
+    """
+    template = _templates.get(optimize)
+    if template is None:
+        if optimize:
+            template = _optimized_template()
+        else:
+            template = lex.lex(object=UCLexer(None))
+        _templates[optimize] = template
+    return template
+
+
+def _lextab():
+    """ Returns the directory and the module name of the table of the
+        optimized lexer.  It goes in the cache of the user, as the
+        sources may be read-only, and its name has a digest of the
+        rules, as ply can't tell a table that is stale.
+    """
+    import hashlib                  # Only the optimized lexer needs it
+    rules = [lex.__tabversion__, UCLexer.tokens, getattr(UCLexer, 'literals', ''),
+             getattr(UCLexer, 'states', ())]
+    for name, rule in sorted(vars(UCLexer).items()):
+        if name.startswith('t_'):
+            rules.append((name, rule if isinstance(rule, str) else (rule.__doc__, rule.__code__.co_firstlineno)))
+    digest = hashlib.sha1(repr(rules).encode('utf-8')).hexdigest()[:16]
+    cache = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache, 'uc'), 'uc_lextab_' + digest
+
+
+def _optimized_template():
+    """ Returns the template of the optimized lexer, loaded from its
+        table, which is written the first time if the cache can be.
+    """
+    import importlib.util
+    directory, name = _lextab()
+    path = os.path.join(directory, name + '.py')
+    try:
+        spec = importlib.util.spec_from_file_location(name, path)
+        lextab = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(lextab)
+    except (OSError, SyntaxError):
+        lextab = None
+    if lextab is not None:
+        return lex.lex(object=UCLexer(None), optimize=True, lextab=lextab)
+    # Built as without optimize, which doesn't write the table anywhere
+    template = lex.lex(object=UCLexer(None))
+    template.lexoptimize = True
+    try:
+        # Under another name first, not to load a table half written
+        os.makedirs(directory, exist_ok=True)
+        partial = '%s_%d' % (name, os.getpid())
+        template.writetab(partial, directory)
+        os.replace(os.path.join(directory, partial + '.py'), path)
+    except OSError:
+        pass
+    return template
+
 '''
     def scan(self, data):
         self.lexer.input(data)
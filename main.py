@@ -8,13 +8,14 @@
 # the compiler proper.
 # ============================================================
 
+import io
+import os
 import sys
-from contextlib import contextmanager
+import time
+from contextlib import contextmanager, redirect_stdout
 
-from uc_code import GenerateCode
-from uc_interpreter import Interpreter
-from parser import UCParser
-from uc_sema import *
+# The phases of the compiler are only imported when they are first used,
+# as most runs don't need all of them (see benchmarks/startup.py)
 
 """
 One of the most important (and difficult) parts of writing a compiler
@@ -112,16 +113,38 @@ class Compiler:
         facade interface for the compiler itself.
     """
 
-    def __init__(self):
+    def __init__(self, parser=None):
         self.total_errors = 0
         self.total_warnings = 0
+        self.timings = []
+        self.passes = None
+        self.parser = parser        # A UCParser to reuse, as serve() does
+
+    @contextmanager
+    def _phase(self, name):
+        """ Times the compiler phase run inside the with block """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.append((name, time.perf_counter() - start))
+
+    def _report(self, out):
+        """ Writes how long each phase, and each optimization, took """
+        out.write("Phase timings:\n")
+        for name, elapsed in self.timings:
+            out.write("%-12s %8.2f ms\n" % (name, elapsed * 1000))
+            if name == 'optimize':
+                self.passes.report(out)
 
     def _parse(self, susy, ast_file, debug):
         """ Parses the source code. If ast_file != None,
             or running at susy machine,
             prints out the abstract syntax tree.
         """
-        self.parser = UCParser()
+        if self.parser is None:
+            from parser import UCParser
+            self.parser = UCParser(error_func=error)
         self.ast = self.parser.parse(self.code, '', debug)
         '''
         if susy:
@@ -131,46 +154,297 @@ class Compiler:
         '''
         
     def _semantic(self, susy, debug):
+            from uc_sema import Visitor
             self.semantic = Visitor(debug)
             self.semantic.visit(self.ast)
 
-    def _gencode(self, susy, ir_file):
-        self.gen = GenerateCode()
-        self.gen.visit(self.ast)
-        self.gencode = self.gen.text + self.gen.code
-        _str = ''
+    def _gencode(self, susy, ir_file, opt, debug, obj_file=None, ir_format='tuple', keep=True):
+        """ Generates the uCIR, optimizing it with the pipeline opt
+            (see uc_analysis.PassManager) if given. In debug mode,
+            the IR is verified after every optimization. If obj_file
+            != None, also saves it there as a binary object file.
+            The IR is written to ir_file in ir_format (see uc_ir.IRWriter).
+            Unless keep, the IR that is only written to ir_file is not
+            kept in self.gencode, but written as each function is
+            generated.
+        """
+        import uc_ir
+        from uc_code import GenerateCode
+        if not keep and not opt and not susy and ir_file is not None and obj_file is None:
+            import shutil
+            import tempfile
+            # The text is only complete at the end, and goes before the code
+            with self._phase('gencode'), tempfile.TemporaryFile('w+') as code_file:
+                self.gen = GenerateCode()
+                self.gen.stream(self.ast, uc_ir.IRWriter(code_file, ir_format).write)
+                uc_ir.IRWriter(ir_file, ir_format).write_all(self.gen.text)
+                code_file.seek(0)
+                shutil.copyfileobj(code_file, ir_file)
+            self.gencode = None
+            return
+        with self._phase('gencode'):
+            self.gen = GenerateCode()
+            self.gen.visit(self.ast)
+            self.gencode = self.gen.text + self.gen.code
+        if opt:
+            self._optimize(opt, debug)
         if not susy and ir_file is not None:
-            for _code in self.gencode:
-                _str += f"{_code}\n"
-            ir_file.write(_str)
-
-    def _do_compile(self, susy, ast_file, ir_file, debug):
-        """ Compiles the code to the given file object. """
+            uc_ir.IRWriter(ir_file, ir_format).write_all(self.gencode)
+        if not susy and obj_file is not None:
+            uc_ir.Program(self.gencode).write(obj_file)
+
+    def _optimize(self, opt, debug):
+        """ Optimizes the uCIR with the pipeline opt """
+        from uc_analysis import PassManager
+        with self._phase('optimize'):
+            self.passes = PassManager(opt, verify=debug)
+            self.gencode = self.passes.run(self.gencode)
+
+    def _do_compile(self, susy, ast_file, ir_file, debug, opt, obj_file=None, ir_format='tuple', check=False,
+                    keep=True):
+        """ Compiles the code to the given file object. If check,
+            stops after the semantic analysis. For keep, see _gencode.
+        """
         try:
-            self._parse(susy, ast_file, debug)
-            self._semantic(susy, debug)
-            self._gencode(susy, ir_file)
+            with self._phase('parse'):
+                self._parse(susy, ast_file, debug)
+            if self.parser.errors:
+                return
+            with self._phase('semantic'):
+                self._semantic(susy, debug)
+            if not check:
+                self._gencode(susy, ir_file, opt, debug, obj_file, ir_format, keep)
         except AssertionError as e:
             error(None, e)
 
-    def compile(self, code, susy, ast_file, ir_file, run_ir, debug):
-        """ Compiles the given code string """
+    def compile(self, code, susy, ast_file, ir_file, run_ir, debug, opt=None, obj_file=None,
+                ir_format='tuple'):
+        """ Compiles the given code string, or the code read from the
+            file object code, a chunk at a time (see UCLexer.stream)
+        """
         self.code = code
         with subscribe_errors(lambda msg: sys.stderr.write(msg+"\n")):
-            self._do_compile(susy, ast_file, ir_file, debug)
+            self._do_compile(susy, ast_file, ir_file, debug, opt, obj_file, ir_format, keep=run_ir)
+            if debug:
+                self._report(sys.stdout)
             if errors_reported():
                 sys.stderr.write("{} error(s) encountered.".format(errors_reported()))
             elif run_ir:
+                from uc_interpreter import Interpreter
                 self.vm = Interpreter()
                 self.vm.run(self.gencode)
         return 0
 
+    def link(self, units, names, run_ir, debug, opt=None):
+        """ Links the uCIR of units compiled separately (see uc_link),
+            optimizing the whole program with the pipeline opt if given,
+            and runs it.
+        """
+        from uc_link import link
+        with subscribe_errors(lambda msg: sys.stderr.write(msg+"\n")):
+            try:
+                with self._phase('link'):
+                    self.gencode = link(units, names)
+                if opt:
+                    self._optimize(opt, debug)
+            except AssertionError as e:
+                error(None, e)
+            if debug:
+                self._report(sys.stdout)
+            if errors_reported():
+                sys.stderr.write("{} error(s) encountered.".format(errors_reported()))
+            elif run_ir:
+                from uc_interpreter import Interpreter
+                self.vm = Interpreter()
+                self.vm.run(self.gencode)
+        return 0
+
+    def run_object(self, obj_file):
+        """ Runs a program saved as a binary object file,
+            skipping the compilation altogether.
+        """
+        import uc_ir
+        from uc_interpreter import Interpreter
+        try:
+            self.gencode = uc_ir.Program.read(obj_file).to_tuples()
+        except ValueError as e:
+            sys.stderr.write("{}: {}\n".format(obj_file.name, e))
+            return 1
+        self.vm = Interpreter()
+        self.vm.run(self.gencode)
+        return 0
+
+
+def load_object(source_filename):
+    """ Returns the uCIR of the object file of source_filename, if it
+        exists and it is newer than the source, None otherwise.
+    """
+    obj_filename = source_filename[:-3] + '.uco'
+    if (not os.path.exists(obj_filename)
+            or os.path.getmtime(obj_filename) < os.path.getmtime(source_filename)):
+        return None
+    import uc_ir
+    try:
+        with open(obj_filename, 'rb') as obj_file:
+            return uc_ir.Program.read(obj_file).to_tuples()
+    except ValueError:
+        return None
+
+
+def build_units(source_filenames, run_ir, debug, opt, ir_format):
+    """ Compiles each source file to its object file, reusing the
+        objects that are up to date, then links them all in a single
+        program and runs it.
+    """
+    units = []
+    for source_filename in source_filenames:
+        code = load_object(source_filename)
+        if code is not None:
+            print("Reusing the uCIR object %s." % (source_filename[:-3] + '.uco'))
+        else:
+            obj_filename = source_filename[:-3] + '.uco'
+            print("Outputting the uCIR object to %s." % obj_filename)
+            with open(source_filename, 'r') as source:
+                compiler = Compiler()
+                with open(obj_filename, 'wb') as obj_file:
+                    compiler.compile(source.read(), False, None, None, False, debug, None, obj_file,
+                                     ir_format)
+            if errors_reported():
+                os.remove(obj_filename)
+                return 1
+            code = compiler.gencode
+        units.append(code)
+    return Compiler().link(units, source_filenames, run_ir, debug, opt)
+
+
+def watch(source_filename, run_ir, debug, opt, ir_format):
+    """ Compiles source_filename again every time it changes, only
+        regenerating the declarations that changed (see uc_incremental),
+        until interrupted with Ctrl-C.
+    """
+    import uc_ir
+    from uc_incremental import IncrementalCompiler
+    from uc_interpreter import Interpreter
+    incremental = IncrementalCompiler()
+    ir_filename = source_filename[:-3] + '.ir'
+    mtime = None
+    print("Watching %s for changes (Ctrl-C to stop)." % source_filename)
+    try:
+        while True:
+            if not os.path.exists(source_filename) or os.path.getmtime(source_filename) == mtime:
+                time.sleep(0.5)
+                continue
+            mtime = os.path.getmtime(source_filename)
+            with open(source_filename, 'r') as source:
+                code = source.read()
+            clear_errors()
+            compiler = Compiler()
+            with subscribe_errors(lambda msg: sys.stderr.write(msg+"\n")):
+                try:
+                    with compiler._phase('gencode'):
+                        compiler.gencode = incremental.compile(code)
+                    if opt:
+                        compiler._optimize(opt, debug)
+                except AssertionError as e:
+                    error(None, e)
+                if errors_reported():
+                    sys.stderr.write("{} error(s) encountered.\n".format(errors_reported()))
+                    continue
+            with open(ir_filename, 'w') as ir_file:
+                uc_ir.IRWriter(ir_file, ir_format).write_all(compiler.gencode)
+            print("%d of %d declarations regenerated, uCIR written to %s."
+                  % (incremental.regenerated, incremental.total, ir_filename))
+            if debug:
+                compiler._report(sys.stdout)
+            if run_ir:
+                try:
+                    Interpreter().run(compiler.gencode)
+                except SystemExit:
+                    pass
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def serve(socket_path, debug):
+    """ Runs a compile server, answering the JSON-RPC requests (see
+        uc_rpc) of uc_client.py on the Unix socket socket_path, or on
+        stdin/stdout if it is None, until it gets a shutdown request.
+        The parser is built once and reused, so a request only pays for
+        the compilation of its code.  The methods are:
+
+        check(code)                         parses and checks code
+        compile(code, opt, ir_format)       also generates its uCIR, as text
+        run(code, opt, ir_format, input)    also runs it, with input as stdin
+
+        Their result has the error messages ('errors') and what was
+        printed ('output'), plus the uCIR ('ir') or the exit status of
+        the program ('status').
+    """
+    import uc_ir
+    import uc_rpc
+    from parser import UCParser
+    from uc_analysis import passes, pipelines
+    from uc_interpreter import Interpreter
+    parser = UCParser(error_func=error)
+
+    def request(code, opt=None, ir_format='tuple', input=None, check=False):
+        if opt is not None and opt not in pipelines:
+            for name in opt.split(','):
+                if name not in passes:
+                    raise uc_rpc.RPCError(uc_rpc.INVALID_PARAMS, "Unknown optimization: %s" % name)
+        if ir_format not in uc_ir.IRWriter.formats:
+            raise uc_rpc.RPCError(uc_rpc.INVALID_PARAMS, "Unknown IR format: %s" % ir_format)
+        clear_errors()
+        errors = []
+        output = io.StringIO()
+        result = {'errors': errors}
+        compiler = Compiler(parser)
+        compiler.code = code
+        with subscribe_errors(errors.append), redirect_stdout(output):
+            try:
+                compiler._do_compile(True, None, None, debug, opt, check=check)
+                if not errors_reported() and not check:
+                    ir_text = io.StringIO()
+                    uc_ir.IRWriter(ir_text, ir_format).write_all(compiler.gencode)
+                    result['ir'] = ir_text.getvalue()
+                    if input is not None:
+                        stdin = sys.stdin
+                        sys.stdin = io.StringIO(input)
+                        try:
+                            Interpreter().run(compiler.gencode)
+                            result['status'] = 0
+                        except SystemExit as e:
+                            result['status'] = e.code
+                        finally:
+                            sys.stdin = stdin
+            except Exception as e:
+                # Instead of the traceback, as the server keeps running
+                error(None, "Internal compiler error: %s: %s" % (type(e).__name__, e))
+        result['output'] = output.getvalue()
+        return result
+
+    handlers = {
+        'check': lambda code: request(code, check=True),
+        'compile': lambda code, opt=None, ir_format='tuple': request(code, opt, ir_format),
+        'run': lambda code, opt=None, ir_format='tuple', input='': request(code, opt, ir_format, input),
+    }
+    if socket_path is None:
+        uc_rpc.serve_stream(sys.stdin, sys.stdout, handlers)
+    else:
+        print("Serving on %s." % socket_path)
+        uc_rpc.serve_socket(socket_path, handlers)
+    return 0
+
 
 def run_compiler():
     """ Runs the command-line compiler. """
 
+    usage = ("Usage: ./uc.py <source-file> [-at-susy] [-no-ast] [-debug] [-opt]\n"
+             "       [-O0|-O1|-O2] [-passes=p1,p2,...] [-obj] [-run-ir] [-ir-format=tuple|asm]\n"
+             "       [-link] [-watch] [-stream] [-serve[=socket]] [-help]")
     if len(sys.argv) < 2:
-        print("Usage: ./uc.py <source-file> [-at-susy] [-no-ast] [-debug]")
+        print(usage)
         sys.exit(1)
 
     emit_ast = True
@@ -178,13 +452,24 @@ def run_compiler():
     susy = False
     debug = False
     run_ir = True
+    opt = None
+    emit_obj = False
+    run_obj = False
+    ir_format = 'tuple'
+    link_units = False
+    watch_file = False
+    stream = False
+    serve_socket = False
 
     params = sys.argv[1:]
     files = sys.argv[1:]
 
     for param in params:
         if param[0] == '-':
-            if param == '-no-ast':
+            if param in ('-h', '-help', '--help'):
+                print(usage)
+                sys.exit(0)
+            elif param == '-no-ast':
                 emit_ast = False
             elif param == '-no-ir':
                 emit_ir = False
@@ -194,16 +479,65 @@ def run_compiler():
                 susy = True
             elif param == '-debug':
                 debug = True
+            elif param == '-obj':
+                emit_obj = True
+            elif param == '-link':
+                link_units = True
+            elif param == '-stream':
+                stream = True
+            elif param == '-watch':
+                watch_file = True
+            elif param == '-serve':
+                serve_socket = None
+            elif param.startswith('-serve='):
+                serve_socket = param[len('-serve='):]
+            elif param == '-run-ir':
+                run_obj = True
+            elif param.startswith('-ir-format='):
+                ir_format = param[len('-ir-format='):]
+                import uc_ir
+                if ir_format not in uc_ir.IRWriter.formats:
+                    print("Unknown IR format: %s" % ir_format)
+                    sys.exit(1)
+            elif param == '-opt':
+                opt = 'O2'
+            elif param.startswith('-passes='):
+                from uc_analysis import passes
+                opt = param[len('-passes='):]
+                for name in opt.split(','):
+                    if name not in passes:
+                        print("Unknown optimization: %s" % name)
+                        sys.exit(1)
             else:
-                print("Unknown option: %s" % param)
-                sys.exit(1)
+                from uc_analysis import pipelines
+                if param[1:] not in pipelines:
+                    print("Unknown option: %s" % param)
+                    sys.exit(1)
+                opt = param[1:]
             files.remove(param)
 
-    for file in files:
-        if file[-3:] == '.uc':
-            source_filename = file
-        else:
-            source_filename = file + '.uc'
+    if serve_socket is not False:
+        sys.exit(serve(serve_socket, debug))
+
+    source_filenames = [file if file[-3:] == '.uc' else file + '.uc' for file in files]
+    if link_units:
+        sys.exit(build_units(source_filenames, run_ir, debug, opt, ir_format))
+    if watch_file:
+        sys.exit(watch(source_filenames[0], run_ir, debug, opt, ir_format))
+
+    for source_filename in source_filenames:
+
+        if run_obj:
+            obj_filename = source_filename[:-3] + '.uco'
+            try:
+                obj_file = open(obj_filename, 'rb')
+            except OSError as e:
+                sys.stderr.write("{}: {}\n".format(obj_filename, e.strerror or e))
+                retval = 1
+                continue
+            with obj_file:
+                retval = Compiler().run_object(obj_file)
+            continue
 
         open_files = []
         ast_file = None
@@ -220,11 +554,23 @@ def run_compiler():
             ir_file = open(ir_filename, 'w')
             open_files.append(ir_file)
 
+        obj_file = None
+        if emit_obj and not susy:
+            obj_filename = source_filename[:-3] + '.uco'
+            print("Outputting the uCIR object to %s." % obj_filename)
+            obj_file = open(obj_filename, 'wb')
+            open_files.append(obj_file)
+
         source = open(source_filename, 'r')
-        code = source.read()
-        source.close()
+        if stream:
+            code = source
+        else:
+            code = source.read()
+            source.close()
 
-        retval = Compiler().compile(code, susy, ast_file, ir_file, run_ir, debug)
+        retval = Compiler().compile(code, susy, ast_file, ir_file, run_ir, debug, opt, obj_file,
+                                    ir_format)
+        source.close()
         for f in open_files:
             f.close()
         if retval != 0:
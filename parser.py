@@ -1,18 +1,40 @@
+import os
+
 from ast import *
-from lexer import UCLexer
+from lexer import UCLexer, TokenArray, TokenStream
 import ply.yacc as yacc
+from uc_lr import LRDriver, Production
+
+
+class TooManyErrors(Exception):
+    """ Raised by p_error() to stop the parser at UCParser.max_errors """
+    pass
 
 
 class UCParser:
-    def __init__(self):
-        self.errors = 0
+    # Syntax errors after which parse() gives up
+    max_errors = 20
+
+    def __init__(self, backend='ply', error_func=None):
+        self.backend = backend      # Scanner of the lexer, see UCLexer.build()
+        # Called with the coordinates and the message of each syntax error,
+        # as main.error(), which is passed by Compiler; they're printed if None
+        self.error_func = error_func
+        self.errors = 0             # Syntax errors found by the last parse()
         self.warnings = 0
+        self.parser = None
+        self.driver = None
 
     def _token_coord(self, p, token_idx):
-        last_cr = p.lexer.lexdata.rfind('\n', 0, p.lexpos(token_idx))
-        if last_cr < 0:
-            last_cr = -1
-        column = (p.lexpos(token_idx) - (last_cr))
+        if type(p) is Production:
+            return p.coord(token_idx)
+        # The tokens of UCLexer.stream() bring their column, as there is no lexdata
+        column = getattr(p.slice[token_idx], 'column', None)
+        if column is None and p.lexer.lexdata is not None:
+            last_cr = p.lexer.lexdata.rfind('\n', 0, p.lexpos(token_idx))
+            if last_cr < 0:
+                last_cr = -1
+            column = (p.lexpos(token_idx) - (last_cr))
         return Coord(p.lineno(token_idx), column).__str__()
 
     def print_error(self, msg, x, y):
@@ -42,10 +64,26 @@ class UCParser:
             return decl
 
     def p_error(self, p):
+        # ply then recovers with the error rules: the statement or the
+        # declaration with the error is skipped up to its ';', or the block
+        # up to its '}'.  The errors in the next 3 tokens aren't reported
+        self.errors += 1
         if p:
-            print("Error near the symbol %s" % p.value)
+            column = getattr(p, 'column', None)
+            if column is None and p.lexer.lexdata is not None:
+                column = p.lexpos - p.lexer.lexdata.rfind('\n', 0, p.lexpos)
+            coord = p.lineno if column is None else "%d:%d" % (p.lineno, column)
+            message = "Error near the symbol %s" % p.value
+        else:
+            coord, message = self.stream.lineno, "Error at the end of input"
+        if self.errors >= self.max_errors:
+            message += ", too many errors to go on"
+        if self.error_func is None:
+            print("%s: %s" % (coord, message))
         else:
-            print("Error at the end of input")
+            self.error_func(coord, message)
+        if self.errors >= self.max_errors:
+            raise TooManyErrors()
 
     def _build_function_definition(self, spec, decl, param_decls, body):
         declaration = self._build_declarations(spec=spec, decls=[dict(decl=decl, init=None)])[0]
@@ -91,20 +129,48 @@ class UCParser:
             print("Code: {0}".format(code))
             print("Filename: {0}".format(filename))
 
-        self.lexer = UCLexer(self.print_error)
-        self.lexer.build()
-
-        self.tokens = self.lexer.tokens
-        self.precedence = (
-             ('left', 'EQUALS', 'DIFF', 'LT', 'HT', 'LE', 'HE'),
-             ('left', 'OR'),
-             ('left', 'AND'),
-             ('left', 'PLUS', 'MINUS'),
-             ('left', 'TIMES', 'DIVIDE', 'MOD'),
-         )
-
-        parser = yacc.yacc(module=self, write_tables=False)
-        result = parser.parse(code, tracking=False)
+        # The lexer and the parsing tables are built on the first call
+        # and reused by the next ones
+        if self.parser is None:
+            self.lexer = UCLexer(self.print_error)
+            self.lexer.build(backend=self.backend)
+
+            self.tokens = self.lexer.tokens
+            self.precedence = (
+                 ('left', 'EQUALS', 'DIFF', 'LT', 'HT', 'LE', 'HE'),
+                 ('left', 'OR'),
+                 ('left', 'AND'),
+                 ('left', 'PLUS', 'MINUS'),
+                 ('left', 'TIMES', 'DIVIDE', 'MOD'),
+             )
+
+            # The LALR tables are read from parsetab.py, which is only
+            # generated again when the grammar changes
+            self.parser = yacc.yacc(module=self, debug=False, tabmodule='parsetab',
+                                    outputdir=os.path.dirname(os.path.abspath(__file__)))
+            # They're run by an LRDriver, unless the tokens are LexTokens
+            self.driver = LRDriver(self.parser)
+        # The whole code is tokenized at once, see UCLexer.tokenize(),
+        # unless it is a file, which is read and tokenized in chunks, or
+        # it is already tokens (a TokenArray, or LexTokens with their column)
+        if isinstance(code, str):
+            tokens = self.lexer.tokenize(code)
+        elif hasattr(code, 'read'):
+            tokens = self.lexer.stream(code)
+        else:
+            tokens = code
+        self.errors = 0
+        self.stream = TokenStream(tokens)
+        # With syntax errors, the AST lacks the parts with errors
+        try:
+            if isinstance(tokens, TokenArray):
+                if len(tokens):
+                    self.stream.lineno = tokens.lines[-1]   # For the errors at the end
+                result = self.driver.parse(tokens, self.p_error)
+            else:
+                result = self.parser.parse(lexer=self.stream, tracking=False)
+        except TooManyErrors:
+            result = None
 
         return result
 
@@ -118,9 +184,12 @@ class UCParser:
                                     | global_declaration_list global_declaration
         '''
         if len(p) == 2:
-            p[0] = [p[1]]
+            p[0] = [p[1]] if p[1] is not None else []
         else:
-            p[0] = p[1]+[p[2]]
+            # Appended in place, not copied for each declaration
+            if p[2] is not None:
+                p[1].append(p[2])
+            p[0] = p[1]
 
     def p_declarator(self, p):
         ''' declarator : pointer direct_declarator
@@ -146,6 +215,12 @@ class UCParser:
         '''
         p[0] = GlobalDecl(p[1])
 
+    def p_global_declaration_error(self, p):
+        ''' global_declaration : error SEMI
+                               | error RBRACE
+        '''
+        p[0] = None
+
     def p_declaration_list(self, p):
         ''' declaration_list : declaration
                             | declaration_list declaration
@@ -215,6 +290,8 @@ class UCParser:
         '''
         if isinstance(p[1], list):
             p[0] = p[1]
+        elif p[1] is None:
+            p[0] = []               # A statement with errors
         else:
             p[0] = [p[1]]
 
@@ -315,6 +392,11 @@ class UCParser:
         '''
         p[0] = p[1]
 
+    def p_statement_error(self, p):
+        ''' statement : error SEMI
+        '''
+        p[0] = None
+
     def p_postfix_expression1(self, p):
         ''' postfix_expression : primary_expression
         '''
@@ -458,8 +540,7 @@ class UCParser:
         ''' argument_expression_opt : argument_expression_list
                                     | empty
         '''
-        if p[1] is not None:
-            p[0] = p[1]
+        p[0] = p[1]
 
     def p_argument_expression_list(self, p):
         ''' argument_expression_list : assignment_expression
@@ -559,6 +640,12 @@ class UCParser:
         '''
         p[0] = Compound(block_items=p[2], coord=self._token_coord(p, 1))
 
+    def p_compound_statement_error(self, p):
+        ''' compound_statement : LBRACE error RBRACE
+                               | LBRACE block_item_list error RBRACE
+        '''
+        p[0] = Compound(block_items=p[2] if len(p) == 5 else None, coord=self._token_coord(p, 1))
+
     def p_expression_statement(self, p):
         ''' expression_statement : expression_opt SEMI
         '''
@@ -576,8 +663,7 @@ class UCParser:
     def p_expression_1(self, p):
         ''' expression : assignment_expression
         '''
-        if len(p) == 2:
-            p[0] = p[1]
+        p[0] = p[1]
 
     def p_expression_2(self, p):
         ''' expression : expression COMMA assignment_expression
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftORleftANDEQUALSDIFFleftHTHELTLEleftPLUSMINUSleftTIMESDIVIDEMODADDRESS AND ASSERT ASSIGN_DIVIDE ASSIGN_MINUS ASSIGN_MOD ASSIGN_PLUS ASSIGN_TIMES BREAK CHAR COMMA DIFF DIVIDE ELSE EQ EQUALS FLOAT FLOAT_CONST FOR HE HT ID IF INT INT_CONST LBRACE LBRACKET LE LPAREN LT MINUS MINUSMINUS MOD NOT OR PLUS PLUSPLUS PRINT RBRACE RBRACKET READ RETURN RPAREN SEMI STRING TIMES VOID WHILE program  : global_declaration_list\n         global_declaration_list : global_declaration\n                                    | global_declaration_list global_declaration\n         global_declaration  : declaration\n         global_declaration  : function_definition\n         declaration : decl_body SEMI\n         declaration_list    : declaration\n                                | declaration_list declaration\n         declaration_list_opt    : declaration_list\n                                    | empty\n         decl_body  : type_specifier init_declarator_list_opt\n         declarator  : direct_declarator\n         declarator : pointer direct_declarator\n         init_declarator : declarator\n                            | declarator EQ initializer\n         init_declarator_list    : init_declarator\n                                    | init_declarator_list COMMA init_declarator\n         init_declarator_list_opt    : init_declarator_list\n                                        | empty\n         direct_declarator : identifier\n         direct_declarator :  LPAREN declarator RPAREN\n         direct_declarator : direct_declarator LBRACKET constant_expression_opt RBRACKET\n         direct_declarator : direct_declarator LPAREN identifier_list_opt RPAREN\n                              | direct_declarator LPAREN parameter_list RPAREN\n         initializer : assignment_expression\n         initializer : LBRACE initializer_list RBRACE\n                        | LBRACE initializer_list COMMA RBRACE\n         postfix_expression : primary_expression\n         postfix_expression : postfix_expression PLUSPLUS\n                               | postfix_expression MINUSMINUS\n         postfix_expression  : postfix_expression LPAREN RPAREN\n                                | postfix_expression LPAREN argument_expression RPAREN\n         postfix_expression  : postfix_expression LBRACKET expression RBRACKET\n         cast_expression : unary_expression\n         cast_expression : LPAREN type_specifier RPAREN cast_expression\n         identifier : ID\n         identifier_list_opt : identifier_list\n                                | empty\n         identifier_list : identifier\n                            | identifier_list COMMA identifier\n         unary_operator : EQ\n                           | TIMES\n                           | PLUS\n                           | MINUS\n                           | NOT\n         type_specifier : VOID\n                           | CHAR\n                           | INT\n                           | FLOAT\n         constant_expression : binary_expression\n         constant_expression_opt : constant_expression\n                                    | empty\n         constant : INT_CONST\n         constant : FLOAT_CONST\n         constant : STRING\n         block_item  : declaration\n                        | statement\n         block_item_list : block_item\n                            | block_item_list block_item\n         selection_statement : IF LPAREN expression RPAREN statement\n         selection_statement : IF LPAREN expression RPAREN statement ELSE statement\n         initializer_list : initializer\n                             | initializer_list COMMA initializer\n         argument_expression : assignment_expression\n                                | argument_expression COMMA assignment_expression\n         function_definition : type_specifier declarator declaration_list_opt compound_statement\n         function_definition : declarator declaration_list_opt compound_statement\n         assert_statement : ASSERT expression SEMI\n         print_statement : PRINT LPAREN expression_opt RPAREN SEMI\n         read_statement : READ LPAREN argument_expression RPAREN SEMI\n         expression_statement : expression_opt SEMI\n         compound_statement   : LBRACE block_item_list RBRACE\n         statement   : expression_statement\n                        | selection_statement\n                        | jump_statement\n                        | print_statement\n                        | assert_statement\n                        | read_statement\n                        | iteration_statement\n                        | compound_statement\n         jump_statement  : BREAK SEMI\n         jump_statement  : RETURN expression_opt SEMI\n         iteration_statement : WHILE LPAREN expression RPAREN statement\n         iteration_statement : FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN statement\n         iteration_statement : FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN statement\n         pointer : TIMES\n                    | TIMES pointer\n         parameter_declaration  : type_specifier declarator\n         parameter_list  : parameter_declaration\n                            | parameter_list COMMA parameter_declaration\n         expression  : assignment_expression\n         expression  : expression COMMA assignment_expression\n         primary_expression : identifier\n                               | constant\n         primary_expression : LPAREN expression RPAREN\n         expression_opt : expression\n                           | empty\n         assignment_expression   : binary_expression\n                                    | unary_expression assignment_operator assignment_expression\n         assignment_operator : EQ\n                                | ASSIGN_TIMES\n                                | ASSIGN_DIVIDE\n                                | ASSIGN_MOD\n                                | ASSIGN_PLUS\n                                | ASSIGN_MINUS\n         unary_expression : postfix_expression\n         unary_expression    : PLUSPLUS unary_expression\n                                | MINUSMINUS unary_expression\n                                | unary_operator cast_expression\n         binary_expression   : cast_expression\n                                | binary_expression TIMES binary_expression\n                                | binary_expression DIVIDE binary_expression\n                                | binary_expression MOD binary_expression\n                                | binary_expression PLUS binary_expression\n                                | binary_expression MINUS binary_expression\n                                | binary_expression LE binary_expression\n                                | binary_expression LT binary_expression\n                                | binary_expression HE binary_expression\n                                | binary_expression HT binary_expression\n                                | binary_expression EQUALS binary_expression\n                                | binary_expression DIFF binary_expression\n                                | binary_expression AND binary_expression\n                                | binary_expression OR binary_expression\n         empty :\n        '
+_lr_signature = 'leftEQUALSDIFFLTHTLEHEleftORleftANDleftPLUSMINUSleftTIMESDIVIDEMODADDRESS AND ASSERT ASSIGN_DIVIDE ASSIGN_MINUS ASSIGN_MOD ASSIGN_PLUS ASSIGN_TIMES BREAK CHAR CHAR_CONST COMMA DIFF DIVIDE ELSE EQ EQUALS FLOAT FLOAT_CONST FOR HE HT ID IF INT INT_CONST LBRACE LBRACKET LE LPAREN LT MINUS MINUSMINUS MOD NOT OR PLUS PLUSPLUS PRINT RBRACE RBRACKET READ RETURN RPAREN SEMI STRING TIMES VOID WHILE program : global_declaration_list\n         global_declaration_list : global_declaration\n                                    | global_declaration_list global_declaration\n         declarator : pointer direct_declarator\n                       | direct_declarator\n         declaration :  decl_body SEMI\n         global_declaration : function_definition\n         global_declaration : declaration\n         global_declaration : error SEMI\n                               | error RBRACE\n         declaration_list : declaration\n                            | declaration_list declaration\n         declaration_list_opt : declaration_list\n                                 | empty\n         block_item_list_opt : block_item_list\n                                | empty\n         decl_body : type_specifier init_declarator_list_opt\n         init_declarator : declarator\n                            | declarator EQUALS initializer\n         init_declarator_list_opt : init_declarator_list\n                                     | empty\n         init_declarator_list : init_declarator\n         init_declarator_list : init_declarator_list COMMA init_declarator\n         block_item_list : block_item\n                            | block_item_list block_item\n         block_item : statement\n                       | declaration\n         function_definition : type_specifier declarator declaration_list_opt compound_statement\n         function_definition : declarator declaration_list_opt compound_statement\n         direct_declarator : identifier\n         direct_declarator : LPAREN declarator RPAREN\n         direct_declarator : direct_declarator LPAREN parameter_list RPAREN\n         direct_declarator : direct_declarator LBRACKET constant_expression_opt RBRACKET\n         direct_declarator : direct_declarator LPAREN id_list_opt RPAREN\n         initializer : assignment_expression\n         initializer : LBRACE initializer_list RBRACE\n                        | LBRACE initializer_list COMMA RBRACE\n         initializer_list : initializer\n         initializer_list : initializer_list COMMA initializer\n         assert_statement : ASSERT expression SEMI\n         print_statement : PRINT LPAREN expression_opt RPAREN SEMI\n         read_statement : READ LPAREN argument_expression_list RPAREN SEMI\n         statement : expression_statement\n                      | compound_statement\n                      | selection_statement\n                      | iteration_statement\n                      | jump_statement\n                      | assert_statement\n                      | print_statement\n                      | read_statement\n         statement : error SEMI\n         postfix_expression : primary_expression\n         postfix_expression : postfix_expression PLUSPLUS\n                               | postfix_expression MINUSMINUS\n         postfix_expression : postfix_expression LBRACKET expression RBRACKET\n         postfix_expression : postfix_expression LPAREN argument_expression_opt RPAREN\n         cast_expression : unary_expression\n         cast_expression : LPAREN type_specifier RPAREN cast_expression\n         identifier : ID\n         unary_operator : ADDRESS\n                           | TIMES\n                           | PLUS\n                           | MINUS\n                           | NOT\n         unary_expression : postfix_expression\n         unary_expression : PLUSPLUS unary_expression\n                             | MINUSMINUS unary_expression\n                             | unary_operator cast_expression\n         constant_expression : binary_expression\n         constant_expression_opt : constant_expression\n                                    | empty\n         binary_expression : cast_expression\n         binary_expression : binary_expression TIMES binary_expression\n                              | binary_expression DIVIDE binary_expression\n                              | binary_expression MOD binary_expression\n                              | binary_expression PLUS binary_expression\n                              | binary_expression MINUS binary_expression\n                              | binary_expression LT binary_expression\n                              | binary_expression LE binary_expression\n                              | binary_expression HT binary_expression\n                              | binary_expression HE binary_expression\n                              | binary_expression EQ binary_expression\n                              | binary_expression DIFF binary_expression\n                              | binary_expression AND binary_expression\n                              | binary_expression OR binary_expression\n         type_specifier : VOID\n                           | INT\n                           | FLOAT\n                           | CHAR\n         constant : INT_CONST\n         constant : FLOAT_CONST\n         constant : CHAR_CONST\n         selection_statement : IF LPAREN expression RPAREN statement\n                                | IF LPAREN expression RPAREN statement ELSE statement\n         iteration_statement : WHILE LPAREN expression RPAREN statement\n         iteration_statement : FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN statement\n         iteration_statement : FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN statement\n         argument_expression_opt : argument_expression_list\n                                    | empty\n         argument_expression_list : assignment_expression\n                                     | argument_expression_list COMMA assignment_expression\n         primary_expression : identifier\n                               | constant\n                               | string_literal\n         primary_expression : LPAREN expression RPAREN\n         assignment_operator : EQUALS\n                               | ASSIGN_TIMES\n                               | ASSIGN_DIVIDE\n                               | ASSIGN_MOD\n                               | ASSIGN_PLUS\n                               | ASSIGN_MINUS\n         assignment_expression : binary_expression\n         assignment_expression : unary_expression assignment_operator assignment_expression\n         jump_statement : BREAK SEMI\n         jump_statement : RETURN expression SEMI\n         jump_statement : RETURN SEMI\n         parameter_list : parameter_declaration\n         parameter_list : parameter_list COMMA parameter_declaration\n         id_list_opt : id_list\n                        | empty\n         id_list : identifier\n                    | id_list identifier\n         parameter_declaration : type_specifier declarator\n         compound_statement : LBRACE block_item_list_opt RBRACE\n         compound_statement : LBRACE error RBRACE\n                               | LBRACE block_item_list error RBRACE\n         expression_statement : expression_opt SEMI\n         expression_opt : expression\n                           | empty\n         expression : assignment_expression\n         expression : expression COMMA assignment_expression\n         string_literal : STRING\n         pointer : TIMES pointer\n         pointer : TIMES\n         empty :'
     
-_lr_action_items = {'ASSIGN_DIVIDE':([12,39,40,41,43,44,48,52,60,75,80,83,84,85,90,144,147,178,179,181,],[-36,-94,-34,-54,-53,-106,-55,-28,-93,133,-29,-30,-109,-107,-108,-31,-95,-33,-32,-35,]),'RETURN':([30,69,110,116,117,118,119,120,121,122,126,127,129,131,170,171,172,174,183,186,196,199,200,201,202,205,208,210,211,212,213,214,],[-6,111,-73,-76,-79,-77,-80,-74,-57,-78,-56,111,-75,-58,-71,-72,-59,-81,-82,-68,111,111,-70,-69,-83,-60,111,111,-61,111,-85,-84,]),'READ':([30,69,110,116,117,118,119,120,121,122,126,127,129,131,170,171,172,174,183,186,196,199,200,201,202,205,208,210,211,212,213,214,],[-6,112,-73,-76,-79,-77,-80,-74,-57,-78,-56,112,-75,-58,-71,-72,-59,-81,-82,-68,112,112,-70,-69,-83,-60,112,112,-61,112,-85,-84,]),'VOID':([0,1,5,8,11,12,13,17,18,19,23,25,27,30,33,34,53,68,69,70,72,74,104,105,106,107,110,116,117,118,119,120,121,122,126,127,129,131,169,170,171,172,174,183,186,200,201,202,205,211,213,214,],[2,-2,2,-12,-4,-36,-5,2,-20,-13,2,-3,2,-6,2,-7,2,-21,2,-67,-8,-66,-22,-23,-24,2,-73,-76,-79,-77,-80,-74,-57,-78,-56,2,-75,-58,2,-71,-72,-59,-81,-82,-68,-70,-69,-83,-60,-61,-85,-84,]),'ASSIGN_MINUS':([12,39,40,41,43,44,48,52,60,75,80,83,84,85,90,144,147,178,179,181,],[-36,-94,-34,-54,-53,-106,-55,-28,-93,136,-29,-30,-109,-107,-108,-31,-95,-33,-32,-35,]),'LBRACKET':([8,12,18,19,39,41,43,44,48,52,60,68,80,83,104,105,106,144,147,178,179,],[26,-36,-20,26,-94,-54,-53,81,-55,-28,-93,-21,-29,-30,-22,-23,-24,-31,-95,-33,-32,]),'WHILE':([30,69,110,116,117,118,119,120,121,122,126,127,129,131,170,171,172,174,183,186,196,199,200,201,202,205,208,210,211,212,213,214,],[-6,115,-73,-76,-79,-77,-80,-74,-57,-78,-56,115,-75,-58,-71,-72,-59,-81,-82,-68,115,115,-70,-69,-83,-60,115,115,-61,115,-85,-84,]),'FLOAT_CONST':([26,30,38,42,45,46,50,51,53,54,55,59,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,110,111,114,116,117,118,119,120,121,122,126,127,129,131,133,134,135,136,137,138,139,146,148,165,166,168,169,170,171,172,173,174,176,180,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[41,-6,41,-44,-43,41,41,-42,41,41,-41,-45,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-73,41,41,-76,-79,-77,-80,-74,-57,-78,-56,41,-75,-58,-102,-103,-104,-105,-101,41,-100,41,41,41,41,41,41,-71,-72,-59,41,-81,41,41,-82,-68,41,41,41,41,-70,-69,-83,41,-60,41,41,41,-61,41,-85,-84,]),'PRINT':([30,69,110,116,117,118,119,120,121,122,126,127,129,131,170,171,172,174,183,186,196,199,200,201,202,205,208,210,211,212,213,214,],[-6,113,-73,-76,-79,-77,-80,-74,-57,-78,-56,113,-75,-58,-71,-72,-59,-81,-82,-68,113,113,-70,-69,-83,-60,113,113,-61,113,-85,-84,]),'DIFF':([12,39,40,41,43,44,47,48,52,56,60,75,79,80,83,84,85,90,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,178,179,181,],[-36,-94,-34,-54,-53,-106,-110,-55,-28,100,-93,-34,100,-29,-30,-109,-107,-108,-31,-95,-122,100,-116,-112,-120,-119,-111,-117,-114,-121,-118,-115,-113,-33,-32,-35,]),'MINUS':([12,26,30,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,59,60,69,75,78,79,80,81,82,83,84,85,86,90,91,92,93,94,95,96,97,98,99,100,101,102,103,110,111,114,116,117,118,119,120,121,122,126,127,129,131,133,134,135,136,137,138,139,144,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,165,166,168,169,170,171,172,173,174,176,178,179,180,181,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[-36,42,-6,42,-94,-34,-54,-44,-53,-106,-43,42,-110,-55,42,-42,-28,42,42,-41,102,-45,-93,42,-34,42,102,-29,42,42,-30,-109,-107,42,-108,42,42,42,42,42,42,42,42,42,42,42,42,42,-73,42,42,-76,-79,-77,-80,-74,-57,-78,-56,42,-75,-58,-102,-103,-104,-105,-101,42,-100,-31,42,-95,42,102,102,102,-112,102,102,-111,102,-114,102,102,-115,-113,42,42,42,42,-71,-72,-59,42,-81,42,-33,-32,42,-35,-82,-68,42,42,42,42,-70,-69,-83,42,-60,42,42,42,-61,42,-85,-84,]),'HE':([12,39,40,41,43,44,47,48,52,56,60,75,79,80,83,84,85,90,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,178,179,181,],[-36,-94,-34,-54,-53,-106,-110,-55,-28,101,-93,-34,101,-29,-30,-109,-107,-108,-31,-95,101,101,-116,-112,101,-119,-111,-117,-114,101,-118,-115,-113,-33,-32,-35,]),'ASSIGN_PLUS':([12,39,40,41,43,44,48,52,60,75,80,83,84,85,90,144,147,178,179,181,],[-36,-94,-34,-54,-53,-106,-55,-28,-93,135,-29,-30,-109,-107,-108,-31,-95,-33,-32,-35,]),'INT_CONST':([26,30,38,42,45,46,50,51,53,54,55,59,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,110,111,114,116,117,118,119,120,121,122,126,127,129,131,133,134,135,136,137,138,139,146,148,165,166,168,169,170,171,172,173,174,176,180,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[43,-6,43,-44,-43,43,43,-42,43,43,-41,-45,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-73,43,43,-76,-79,-77,-80,-74,-57,-78,-56,43,-75,-58,-102,-103,-104,-105,-101,43,-100,43,43,43,43,43,43,-71,-72,-59,43,-81,43,43,-82,-68,43,43,43,43,-70,-69,-83,43,-60,43,43,43,-61,43,-85,-84,]),'LE':([12,39,40,41,43,44,47,48,52,56,60,75,79,80,83,84,85,90,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,178,179,181,],[-36,-94,-34,-54,-53,-106,-110,-55,-28,93,-93,-34,93,-29,-30,-109,-107,-108,-31,-95,93,93,-116,-112,93,-119,-111,-117,-114,93,-118,-115,-113,-33,-32,-35,]),'RPAREN':([2,7,8,12,14,16,18,19,27,29,39,40,41,43,44,47,48,52,60,61,62,63,64,66,67,68,75,79,80,82,83,84,85,87,88,89,90,104,105,106,108,123,132,143,144,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,166,175,178,179,181,182,184,185,187,190,193,204,206,207,209,],[-46,-47,-12,-36,-48,-49,-20,-13,-124,68,-94,-34,-54,-53,-106,-110,-55,-28,-93,105,-39,106,-89,-37,-38,-21,-34,-98,-29,144,-30,-109,-107,-91,146,147,-108,-22,-23,-24,-88,-97,-96,-64,-31,179,-95,-122,-123,-116,-112,-120,-119,-111,-117,-114,-121,-118,-115,-113,-90,-40,-124,-99,-33,-32,-35,-92,194,195,196,199,-65,-124,-124,210,212,]),'SEMI':([2,4,7,8,12,14,15,16,18,19,20,21,22,23,24,30,32,39,40,41,43,44,47,48,52,60,68,69,71,73,75,76,77,79,80,83,84,85,87,90,104,105,106,110,111,116,117,118,119,120,121,122,123,125,126,127,129,130,131,132,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,164,167,169,170,171,172,174,175,177,178,179,181,182,183,186,188,189,192,194,195,196,197,198,199,200,201,202,203,205,208,210,211,212,213,214,],[-46,-124,-47,-12,-36,-48,30,-49,-20,-13,-18,-11,-19,-14,-16,-6,-124,-94,-34,-54,-53,-106,-110,-55,-28,-93,-21,-124,-14,-17,-34,-15,-25,-98,-29,-30,-109,-107,-91,-108,-22,-23,-24,-73,-124,-76,-79,-77,-80,-74,-57,-78,-97,170,-56,-124,-75,174,-58,-96,-31,-95,-122,-123,-116,-112,-120,-119,-111,-117,-114,-121,-118,-115,-113,183,186,-124,-71,-72,-59,-81,-99,-26,-33,-32,-35,-92,-82,-68,197,-124,-27,200,201,-124,-124,204,-124,-70,-69,-83,206,-60,-124,-124,-61,-124,-85,-84,]),'LT':([12,39,40,41,43,44,47,48,52,56,60,75,79,80,83,84,85,90,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,178,179,181,],[-36,-94,-34,-54,-53,-106,-110,-55,-28,98,-93,-34,98,-29,-30,-109,-107,-108,-31,-95,98,98,-116,-112,98,-119,-111,-117,-114,98,-118,-115,-113,-33,-32,-35,]),'COMMA':([8,12,18,19,20,23,24,39,40,41,43,44,47,48,52,60,62,63,64,66,68,71,73,75,76,77,79,80,83,84,85,87,89,90,104,105,106,108,132,140,141,142,143,144,145,147,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,167,175,177,178,179,181,182,184,187,190,191,192,193,],[-12,-36,-20,-13,36,-14,-16,-94,-34,-54,-53,-106,-110,-55,-28,-93,-39,107,-89,109,-21,-14,-17,-34,-15,-25,-98,-29,-30,-109,-107,-91,148,-108,-22,-23,-24,-88,148,-62,176,148,-64,-31,180,-95,-122,-123,-116,-112,-120,-119,-111,-117,-114,-121,-118,-115,-113,-90,-40,148,-99,-26,-33,-32,-35,-92,180,148,148,-63,-27,-65,]),'PLUS':([12,26,30,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,59,60,69,75,78,79,80,81,82,83,84,85,86,90,91,92,93,94,95,96,97,98,99,100,101,102,103,110,111,114,116,117,118,119,120,121,122,126,127,129,131,133,134,135,136,137,138,139,144,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,165,166,168,169,170,171,172,173,174,176,178,179,180,181,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[-36,45,-6,45,-94,-34,-54,-44,-53,-106,-43,45,-110,-55,45,-42,-28,45,45,-41,99,-45,-93,45,-34,45,99,-29,45,45,-30,-109,-107,45,-108,45,45,45,45,45,45,45,45,45,45,45,45,45,-73,45,45,-76,-79,-77,-80,-74,-57,-78,-56,45,-75,-58,-102,-103,-104,-105,-101,45,-100,-31,45,-95,45,99,99,99,-112,99,99,-111,99,-114,99,99,-115,-113,45,45,45,45,-71,-72,-59,45,-81,45,-33,-32,45,-35,-82,-68,45,45,45,45,-70,-69,-83,45,-60,45,45,45,-61,45,-85,-84,]),'STRING':([26,30,38,42,45,46,50,51,53,54,55,59,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,110,111,114,116,117,118,119,120,121,122,126,127,129,131,133,134,135,136,137,138,139,146,148,165,166,168,169,170,171,172,173,174,176,180,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[48,-6,48,-44,-43,48,48,-42,48,48,-41,-45,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-73,48,48,-76,-79,-77,-80,-74,-57,-78,-56,48,-75,-58,-102,-103,-104,-105,-101,48,-100,48,48,48,48,48,48,-71,-72,-59,48,-81,48,48,-82,-68,48,48,48,48,-70,-69,-83,48,-60,48,48,48,-61,48,-85,-84,]),'$end':([1,5,6,11,13,25,30,70,74,171,],[-2,-1,0,-4,-5,-3,-6,-67,-66,-72,]),'ASSIGN_MOD':([12,39,40,41,43,44,48,52,60,75,80,83,84,85,90,144,147,178,179,181,],[-36,-94,-34,-54,-53,-106,-55,-28,-93,134,-29,-30,-109,-107,-108,-31,-95,-33,-32,-35,]),'DIVIDE':([12,39,40,41,43,44,47,48,52,56,60,75,79,80,83,84,85,90,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,178,179,181,],[-36,-94,-34,-54,-53,-106,-110,-55,-28,94,-93,-34,94,-29,-30,-109,-107,-108,-31,-95,94,94,94,-112,94,94,-111,94,94,94,94,94,-113,-33,-32,-35,]),'FOR':([30,69,110,116,117,118,119,120,121,122,126,127,129,131,170,171,172,174,183,186,196,199,200,201,202,205,208,210,211,212,213,214,],[-6,124,-73,-76,-79,-77,-80,-74,-57,-78,-56,124,-75,-58,-71,-72,-59,-81,-82,-68,124,124,-70,-69,-83,-60,124,124,-61,124,-85,-84,]),'PLUSPLUS':([12,26,30,38,39,41,42,43,44,45,46,48,50,51,52,53,54,55,59,60,69,78,80,81,82,83,86,91,92,93,94,95,96,97,98,99,100,101,102,103,110,111,114,116,117,118,119,120,121,122,126,127,129,131,133,134,135,136,137,138,139,144,146,147,148,165,166,168,169,170,171,172,173,174,176,178,179,180,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[-36,50,-6,50,-94,-54,-44,-53,80,-43,50,-55,50,-42,-28,50,50,-41,-45,-93,50,50,-29,50,50,-30,50,50,50,50,50,50,50,50,50,50,50,50,50,50,-73,50,50,-76,-79,-77,-80,-74,-57,-78,-56,50,-75,-58,-102,-103,-104,-105,-101,50,-100,-31,50,-95,50,50,50,50,50,-71,-72,-59,50,-81,50,-33,-32,50,-82,-68,50,50,50,50,-70,-69,-83,50,-60,50,50,50,-61,50,-85,-84,]),'EQUALS':([12,39,40,41,43,44,47,48,52,56,60,75,79,80,83,84,85,90,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,178,179,181,],[-36,-94,-34,-54,-53,-106,-110,-55,-28,95,-93,-34,95,-29,-30,-109,-107,-108,-31,-95,-122,95,-116,-112,-120,-119,-111,-117,-114,-121,-118,-115,-113,-33,-32,-35,]),'RBRACE':([12,30,39,40,41,43,44,47,48,52,60,75,77,79,80,83,84,85,90,110,116,117,118,119,120,121,122,126,127,129,131,140,141,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,170,171,172,174,175,176,177,178,179,181,183,186,191,192,200,201,202,205,211,213,214,],[-36,-6,-94,-34,-54,-53,-106,-110,-55,-28,-93,-34,-25,-98,-29,-30,-109,-107,-108,-73,-76,-79,-77,-80,-74,-57,-78,-56,171,-75,-58,-62,177,-31,-95,-122,-123,-116,-112,-120,-119,-111,-117,-114,-121,-118,-115,-113,-71,-72,-59,-81,-99,192,-26,-33,-32,-35,-82,-68,-63,-27,-70,-69,-83,-60,-61,-85,-84,]),'TIMES':([0,1,2,4,5,7,9,10,11,12,13,14,16,25,26,30,32,36,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,59,60,65,69,70,74,75,78,79,80,81,82,83,84,85,86,90,91,92,93,94,95,96,97,98,99,100,101,102,103,110,111,114,116,117,118,119,120,121,122,126,127,129,131,133,134,135,136,137,138,139,144,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,165,166,168,169,170,171,172,173,174,176,178,179,180,181,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[9,-2,-46,9,9,-47,9,9,-4,-36,-5,-48,-49,-3,51,-6,9,9,51,-94,-34,-54,-44,-53,-106,-43,51,-110,-55,51,-42,-28,51,51,-41,97,-45,-93,9,51,-67,-66,-34,51,97,-29,51,51,-30,-109,-107,51,-108,51,51,51,51,51,51,51,51,51,51,51,51,51,-73,51,51,-76,-79,-77,-80,-74,-57,-78,-56,51,-75,-58,-102,-103,-104,-105,-101,51,-100,-31,51,-95,51,97,97,97,-112,97,97,-111,97,97,97,97,97,-113,51,51,51,51,-71,-72,-59,51,-81,51,-33,-32,51,-35,-82,-68,51,51,51,51,-70,-69,-83,51,-60,51,51,51,-61,51,-85,-84,]),'ASSERT':([30,69,110,116,117,118,119,120,121,122,126,127,129,131,170,171,172,174,183,186,196,199,200,201,202,205,208,210,211,212,213,214,],[-6,114,-73,-76,-79,-77,-80,-74,-57,-78,-56,114,-75,-58,-71,-72,-59,-81,-82,-68,114,114,-70,-69,-83,-60,114,114,-61,114,-85,-84,]),'ASSIGN_TIMES':([12,39,40,41,43,44,48,52,60,75,80,83,84,85,90,144,147,178,179,181,],[-36,-94,-34,-54,-53,-106,-55,-28,-93,137,-29,-30,-109,-107,-108,-31,-95,-33,-32,-35,]),'HT':([12,39,40,41,43,44,47,48,52,56,60,75,79,80,83,84,85,90,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,178,179,181,],[-36,-94,-34,-54,-53,-106,-110,-55,-28,96,-93,-34,96,-29,-30,-109,-107,-108,-31,-95,96,96,-116,-112,96,-119,-111,-117,-114,96,-118,-115,-113,-33,-32,-35,]),'LPAREN':([0,1,2,3,4,5,7,8,9,10,11,12,13,14,16,18,19,25,26,28,30,32,36,38,39,41,42,43,44,45,46,48,50,51,52,53,54,55,59,60,65,68,69,70,74,78,80,81,82,83,86,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,111,112,113,114,115,116,117,118,119,120,121,122,124,126,127,128,129,131,133,134,135,136,137,138,139,144,146,147,148,165,166,168,169,170,171,172,173,174,176,178,179,180,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[10,-2,-46,10,10,10,-47,27,-86,10,-4,-36,-5,-48,-49,-20,27,-3,53,-87,-6,10,10,53,-94,-54,-44,-53,82,-43,53,-55,86,-42,-28,53,86,-41,-45,-93,10,-21,53,-67,-66,53,-29,53,53,-30,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-22,-23,-24,-73,53,165,166,53,168,-76,-79,-77,-80,-74,-57,-78,169,-56,53,173,-75,-58,-102,-103,-104,-105,-101,53,-100,-31,53,-95,53,53,53,53,53,-71,-72,-59,53,-81,53,-33,-32,53,-82,-68,53,53,53,53,-70,-69,-83,53,-60,53,53,53,-61,53,-85,-84,]),'MINUSMINUS':([12,26,30,38,39,41,42,43,44,45,46,48,50,51,52,53,54,55,59,60,69,78,80,81,82,83,86,91,92,93,94,95,96,97,98,99,100,101,102,103,110,111,114,116,117,118,119,120,121,122,126,127,129,131,133,134,135,136,137,138,139,144,146,147,148,165,166,168,169,170,171,172,173,174,176,178,179,180,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[-36,54,-6,54,-94,-54,-44,-53,83,-43,54,-55,54,-42,-28,54,54,-41,-45,-93,54,54,-29,54,54,-30,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-73,54,54,-76,-79,-77,-80,-74,-57,-78,-56,54,-75,-58,-102,-103,-104,-105,-101,54,-100,-31,54,-95,54,54,54,54,54,-71,-72,-59,54,-81,54,-33,-32,54,-82,-68,54,54,54,54,-70,-69,-83,54,-60,54,54,54,-61,54,-85,-84,]),'ELSE':([110,116,117,118,119,120,122,129,170,171,174,183,186,200,201,202,205,211,213,214,],[-73,-76,-79,-77,-80,-74,-78,-75,-71,-72,-81,-82,-68,-70,-69,-83,208,-61,-85,-84,]),'EQ':([8,12,18,19,23,26,30,38,39,40,41,42,43,44,45,46,48,50,51,52,53,54,55,59,60,68,69,71,75,78,80,81,82,83,84,85,86,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,111,114,116,117,118,119,120,121,122,126,127,129,131,133,134,135,136,137,138,139,144,146,147,148,165,166,168,169,170,171,172,173,174,176,178,179,180,181,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[-12,-36,-20,-13,38,55,-6,55,-94,-34,-54,-44,-53,-106,-43,55,-55,55,-42,-28,55,55,-41,-45,-93,-21,55,38,139,55,-29,55,55,-30,-109,-107,55,-108,55,55,55,55,55,55,55,55,55,55,55,55,55,-22,-23,-24,-73,55,55,-76,-79,-77,-80,-74,-57,-78,-56,55,-75,-58,-102,-103,-104,-105,-101,55,-100,-31,55,-95,55,55,55,55,55,-71,-72,-59,55,-81,55,-33,-32,55,-35,-82,-68,55,55,55,55,-70,-69,-83,55,-60,55,55,55,-61,55,-85,-84,]),'ID':([0,1,2,3,4,5,7,9,10,11,13,14,16,25,26,27,28,30,32,36,38,42,45,46,50,51,53,54,55,59,65,69,70,74,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,109,110,111,114,116,117,118,119,120,121,122,126,127,129,131,133,134,135,136,137,138,139,146,148,165,166,168,169,170,171,172,173,174,176,180,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[12,-2,-46,12,12,12,-47,-86,12,-4,-5,-48,-49,-3,12,12,-87,-6,12,12,12,-44,-43,12,12,-42,12,12,-41,-45,12,12,-67,-66,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,-73,12,12,-76,-79,-77,-80,-74,-57,-78,-56,12,-75,-58,-102,-103,-104,-105,-101,12,-100,12,12,12,12,12,12,-71,-72,-59,12,-81,12,12,-82,-68,12,12,12,12,-70,-69,-83,12,-60,12,12,12,-61,12,-85,-84,]),'IF':([30,69,110,116,117,118,119,120,121,122,126,127,129,131,170,171,172,174,183,186,196,199,200,201,202,205,208,210,211,212,213,214,],[-6,128,-73,-76,-79,-77,-80,-74,-57,-78,-56,128,-75,-58,-71,-72,-59,-81,-82,-68,128,128,-70,-69,-83,-60,128,128,-61,128,-85,-84,]),'AND':([12,39,40,41,43,44,47,48,52,56,60,75,79,80,83,84,85,90,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,178,179,181,],[-36,-94,-34,-54,-53,-106,-110,-55,-28,91,-93,-34,91,-29,-30,-109,-107,-108,-31,-95,-122,91,-116,-112,-120,-119,-111,-117,-114,-121,-118,-115,-113,-33,-32,-35,]),'CHAR':([0,1,5,8,11,12,13,17,18,19,23,25,27,30,33,34,53,68,69,70,72,74,104,105,106,107,110,116,117,118,119,120,121,122,126,127,129,131,169,170,171,172,174,183,186,200,201,202,205,211,213,214,],[7,-2,7,-12,-4,-36,-5,7,-20,-13,7,-3,7,-6,7,-7,7,-21,7,-67,-8,-66,-22,-23,-24,7,-73,-76,-79,-77,-80,-74,-57,-78,-56,7,-75,-58,7,-71,-72,-59,-81,-82,-68,-70,-69,-83,-60,-61,-85,-84,]),'LBRACE':([8,12,17,18,19,23,30,31,33,34,35,37,38,68,69,72,78,104,105,106,110,116,117,118,119,120,121,122,126,127,129,131,170,171,172,174,176,183,186,196,199,200,201,202,205,208,210,211,212,213,214,],[-12,-36,-124,-20,-13,-124,-6,69,-9,-7,-10,69,78,-21,69,-8,78,-22,-23,-24,-73,-76,-79,-77,-80,-74,-57,-78,-56,69,-75,-58,-71,-72,-59,-81,78,-82,-68,69,69,-70,-69,-83,-60,69,69,-61,69,-85,-84,]),'INT':([0,1,5,8,11,12,13,17,18,19,23,25,27,30,33,34,53,68,69,70,72,74,104,105,106,107,110,116,117,118,119,120,121,122,126,127,129,131,169,170,171,172,174,183,186,200,201,202,205,211,213,214,],[14,-2,14,-12,-4,-36,-5,14,-20,-13,14,-3,14,-6,14,-7,14,-21,14,-67,-8,-66,-22,-23,-24,14,-73,-76,-79,-77,-80,-74,-57,-78,-56,14,-75,-58,14,-71,-72,-59,-81,-82,-68,-70,-69,-83,-60,-61,-85,-84,]),'FLOAT':([0,1,5,8,11,12,13,17,18,19,23,25,27,30,33,34,53,68,69,70,72,74,104,105,106,107,110,116,117,118,119,120,121,122,126,127,129,131,169,170,171,172,174,183,186,200,201,202,205,211,213,214,],[16,-2,16,-12,-4,-36,-5,16,-20,-13,16,-3,16,-6,16,-7,16,-21,16,-67,-8,-66,-22,-23,-24,16,-73,-76,-79,-77,-80,-74,-57,-78,-56,16,-75,-58,16,-71,-72,-59,-81,-82,-68,-70,-69,-83,-60,-61,-85,-84,]),'BREAK':([30,69,110,116,117,118,119,120,121,122,126,127,129,131,170,171,172,174,183,186,196,199,200,201,202,205,208,210,211,212,213,214,],[-6,130,-73,-76,-79,-77,-80,-74,-57,-78,-56,130,-75,-58,-71,-72,-59,-81,-82,-68,130,130,-70,-69,-83,-60,130,130,-61,130,-85,-84,]),'NOT':([26,30,38,42,45,46,50,51,53,54,55,59,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,110,111,114,116,117,118,119,120,121,122,126,127,129,131,133,134,135,136,137,138,139,146,148,165,166,168,169,170,171,172,173,174,176,180,183,186,189,196,197,199,200,201,202,204,205,206,208,210,211,212,213,214,],[59,-6,59,-44,-43,59,59,-42,59,59,-41,-45,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-73,59,59,-76,-79,-77,-80,-74,-57,-78,-56,59,-75,-58,-102,-103,-104,-105,-101,59,-100,59,59,59,59,59,59,-71,-72,-59,59,-81,59,59,-82,-68,59,59,59,59,-70,-69,-83,59,-60,59,59,59,-61,59,-85,-84,]),'RBRACKET':([12,26,39,40,41,43,44,47,48,49,52,56,57,58,60,75,79,80,83,84,85,87,90,142,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,175,178,179,181,182,],[-36,-124,-94,-34,-54,-53,-106,-110,-55,-51,-28,-50,104,-52,-93,-34,-98,-29,-30,-109,-107,-91,-108,178,-31,-95,-122,-123,-116,-112,-120,-119,-111,-117,-114,-121,-118,-115,-113,-99,-33,-32,-35,-92,]),'OR':([12,39,40,41,43,44,47,48,52,56,60,75,79,80,83,84,85,90,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,178,179,181,],[-36,-94,-34,-54,-53,-106,-110,-55,-28,92,-93,-34,92,-29,-30,-109,-107,-108,-31,-95,-122,-123,-116,-112,-120,-119,-111,-117,-114,-121,-118,-115,-113,-33,-32,-35,]),'MOD':([12,39,40,41,43,44,47,48,52,56,60,75,79,80,83,84,85,90,144,147,149,150,151,152,153,154,155,156,157,158,159,160,161,178,179,181,],[-36,-94,-34,-54,-53,-106,-110,-55,-28,103,-93,-34,103,-29,-30,-109,-107,-108,-31,-95,103,103,103,-112,103,103,-111,103,103,103,103,103,-113,-33,-32,-35,]),}
+_lr_action_items = {'error':([0,2,3,4,5,20,21,22,33,42,43,78,87,89,90,91,92,93,94,95,96,97,98,99,149,150,151,153,155,160,162,190,196,197,206,207,213,215,218,219,220,223,225,226,227,228,],[6,6,-2,-7,-8,-3,-9,-10,-6,-29,86,-28,152,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-124,-125,-51,-25,-127,-114,-116,-126,-115,-40,214,214,-93,-95,-41,-42,214,-94,214,214,-97,-96,]),'VOID':([0,2,3,4,5,8,15,17,19,20,21,22,23,29,31,33,34,35,42,43,44,62,77,78,87,89,90,91,92,93,94,95,96,97,98,99,111,112,113,116,149,150,151,153,155,159,160,162,190,196,197,213,215,218,219,223,227,228,],[10,10,-2,-7,-8,10,-5,-30,-59,-3,-9,-10,10,10,-11,-6,-4,10,-29,10,-12,10,-31,-28,10,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-32,10,-34,-33,-124,-125,-51,-25,-127,10,-114,-116,-126,-115,-40,-93,-95,-41,-42,-94,-97,-96,]),'INT':([0,2,3,4,5,8,15,17,19,20,21,22,23,29,31,33,34,35,42,43,44,62,77,78,87,89,90,91,92,93,94,95,96,97,98,99,111,112,113,116,149,150,151,153,155,159,160,162,190,196,197,213,215,218,219,223,227,228,],[11,11,-2,-7,-8,11,-5,-30,-59,-3,-9,-10,11,11,-11,-6,-4,11,-29,11,-12,11,-31,-28,11,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-32,11,-34,-33,-124,-125,-51,-25,-127,11,-114,-116,-126,-115,-40,-93,-95,-41,-42,-94,-97,-96,]),'FLOAT':([0,2,3,4,5,8,15,17,19,20,21,22,23,29,31,33,34,35,42,43,44,62,77,78,87,89,90,91,92,93,94,95,96,97,98,99,111,112,113,116,149,150,151,153,155,159,160,162,190,196,197,213,215,218,219,223,227,228,],[12,12,-2,-7,-8,12,-5,-30,-59,-3,-9,-10,12,12,-11,-6,-4,12,-29,12,-12,12,-31,-28,12,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-32,12,-34,-33,-124,-125,-51,-25,-127,12,-114,-116,-126,-115,-40,-93,-95,-41,-42,-94,-97,-96,]),'CHAR':([0,2,3,4,5,8,15,17,19,20,21,22,23,29,31,33,34,35,42,43,44,62,77,78,87,89,90,91,92,93,94,95,96,97,98,99,111,112,113,116,149,150,151,153,155,159,160,162,190,196,197,213,215,218,219,223,227,228,],[13,13,-2,-7,-8,13,-5,-30,-59,-3,-9,-10,13,13,-11,-6,-4,13,-29,13,-12,13,-31,-28,13,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-32,13,-34,-33,-124,-125,-51,-25,-127,13,-114,-116,-126,-115,-40,-93,-95,-41,-42,-94,-97,-96,]),'TIMES':([0,2,3,4,5,7,10,11,12,13,16,18,19,20,21,22,32,33,36,40,41,42,43,51,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,78,81,82,83,87,89,90,91,92,93,94,95,96,97,98,99,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,132,133,134,135,136,137,138,139,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,188,190,195,196,197,200,201,202,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[16,16,-2,-7,-8,16,-86,-87,-88,-89,16,16,-59,-3,-9,-10,16,-6,58,58,16,-29,58,16,117,-72,-61,-62,-63,-57,58,-65,58,58,58,-52,-60,-64,-102,-103,-104,-90,-91,-92,-132,-28,58,117,-57,58,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-53,-54,58,58,-66,58,-67,-68,58,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,58,58,58,58,-114,-116,58,58,-73,-74,-75,117,117,117,117,117,117,117,117,117,117,58,-105,58,-126,58,-115,-40,-58,-55,-56,58,58,58,58,-93,-95,58,-41,-42,58,58,-94,58,58,-97,-96,]),'LPAREN':([0,2,3,4,5,7,10,11,12,13,14,15,16,17,18,19,20,21,22,32,33,34,36,37,40,41,42,43,51,58,59,60,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,81,87,89,90,91,92,93,94,95,96,97,98,99,101,103,104,106,107,108,109,111,113,116,117,118,119,120,121,122,123,124,125,126,127,128,129,132,133,134,135,137,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,180,181,188,190,195,196,197,201,202,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[18,18,-2,-7,-8,18,-86,-87,-88,-89,18,35,-134,-30,18,-59,-3,-9,-10,18,-6,35,62,-133,62,18,-29,62,18,-61,-62,-63,62,135,137,137,62,-52,-60,-64,-102,-103,-104,-90,-91,-92,-132,-31,-28,62,62,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,156,158,159,62,62,164,165,-32,-34,-33,62,62,62,62,62,62,62,62,62,62,62,62,62,-53,-54,62,62,62,62,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,62,62,62,62,-114,-116,62,62,62,-105,62,-126,62,-115,-40,-55,-56,62,62,62,62,-93,-95,62,-41,-42,62,62,-94,62,62,-97,-96,]),'ID':([0,2,3,4,5,7,10,11,12,13,14,16,18,19,20,21,22,32,33,35,36,37,40,41,42,43,49,51,52,58,59,60,62,64,65,66,68,69,78,81,87,89,90,91,92,93,94,95,96,97,98,99,106,107,114,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,180,188,190,195,196,197,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[19,19,-2,-7,-8,19,-86,-87,-88,-89,19,-134,19,-59,-3,-9,-10,19,-6,19,19,-133,19,19,-29,19,19,19,-121,-61,-62,-63,19,19,19,19,-60,-64,-28,19,19,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,19,19,-122,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,19,19,19,19,-114,-116,19,19,19,19,-126,19,-115,-40,19,19,19,19,-93,-95,19,-41,-42,19,19,-94,19,19,-97,-96,]),'$end':([1,2,3,4,5,20,21,22,33,42,78,149,150,190,],[0,-1,-2,-7,-8,-3,-9,-10,-6,-29,-28,-124,-125,-126,]),'SEMI':([6,7,9,10,11,12,13,15,17,19,23,24,25,26,27,32,33,34,43,45,57,61,63,67,70,71,72,73,74,75,76,77,79,80,82,83,84,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,102,105,106,110,111,113,116,132,133,136,138,139,149,150,151,152,153,154,155,159,160,161,162,163,167,168,169,170,171,172,173,174,175,176,177,178,179,181,187,189,190,192,194,195,196,197,200,201,202,204,206,207,208,209,210,211,213,214,215,216,218,219,220,223,225,226,227,228,],[21,-135,33,-86,-87,-88,-89,-5,-30,-59,-18,-17,-20,-21,-22,-135,-6,-4,-135,-18,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,-31,-19,-35,-112,-57,-23,151,-135,-129,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,155,-128,160,162,-130,-32,-34,-33,-53,-54,-66,-67,-68,-124,-125,-51,151,-25,-129,-127,-135,-114,196,-116,197,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-105,-36,-113,-126,-131,208,-135,-115,-40,-58,-55,-56,-37,-135,-135,-135,217,218,219,-93,151,-95,221,-41,-42,-135,-94,-135,-135,-97,-96,]),'RBRACE':([6,19,33,43,57,61,63,67,70,71,72,73,74,75,76,80,82,83,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,132,133,136,138,139,140,141,149,150,151,152,153,155,160,162,167,168,169,170,171,172,173,174,175,176,177,178,179,181,187,188,189,190,196,197,200,201,202,204,205,213,215,218,219,223,227,228,],[22,-59,-6,-135,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,-35,-112,-57,149,150,-15,-16,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-53,-54,-66,-67,-68,187,-38,-124,-125,-51,190,-25,-127,-114,-116,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-105,-36,204,-113,-126,-115,-40,-58,-55,-56,-37,-39,-93,-95,-41,-42,-94,-97,-96,]),'LBRACE':([8,15,17,19,23,28,29,30,31,33,34,39,40,43,44,77,81,87,89,90,91,92,93,94,95,96,97,98,99,111,113,116,149,150,151,153,155,160,162,188,190,196,197,206,207,213,215,218,219,220,223,225,226,227,228,],[-135,-5,-30,-59,-135,43,-13,-14,-11,-6,-4,43,81,43,-12,-31,81,43,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-32,-34,-33,-124,-125,-51,-25,-127,-114,-116,81,-126,-115,-40,43,43,-93,-95,-41,-42,43,-94,43,43,-97,-96,]),'RPAREN':([10,11,12,13,15,17,19,34,35,38,46,47,48,49,50,52,57,61,63,67,70,71,72,73,74,75,76,77,82,83,102,110,111,113,114,115,116,130,131,132,133,135,136,138,139,154,164,166,167,168,169,170,171,172,173,174,175,176,177,178,179,181,183,184,185,186,189,191,192,193,198,199,200,201,202,212,217,221,222,224,],[-86,-87,-88,-89,-5,-30,-59,-4,-135,77,111,113,-117,-119,-120,-121,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,-31,-112,-57,-128,-130,-32,-34,-122,-123,-33,180,181,-53,-54,-135,-66,-67,-68,-129,-135,-118,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-105,202,-98,-99,-100,-113,206,-131,207,210,211,-58,-55,-56,-101,-135,-135,225,226,]),'EQUALS':([15,17,19,23,34,45,61,63,67,70,71,72,73,74,75,76,77,83,111,113,116,132,133,136,138,139,181,200,201,202,],[-5,-30,-59,40,-4,40,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,-31,143,-32,-34,-33,-53,-54,-66,-67,-68,-105,-58,-55,-56,]),'COMMA':([15,17,19,23,25,27,34,45,46,48,57,61,63,67,70,71,72,73,74,75,76,77,79,80,82,83,84,102,110,111,113,115,116,131,132,133,136,138,139,140,141,161,163,166,167,168,169,170,171,172,173,174,175,176,177,178,179,181,182,184,186,187,189,191,192,193,199,200,201,202,204,205,212,],[-5,-30,-59,-18,41,-22,-4,-18,112,-117,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,-31,-19,-35,-112,-57,-23,157,-130,-32,-34,-123,-33,157,-53,-54,-66,-67,-68,188,-38,157,157,-118,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-105,157,203,-100,-36,-113,157,-131,157,203,-58,-55,-56,-37,-39,-101,]),'LBRACKET':([15,17,19,34,63,67,70,71,72,73,74,75,76,77,111,113,116,132,133,181,201,202,],[36,-30,-59,36,134,-52,-102,-103,-104,-90,-91,-92,-132,-31,-32,-34,-33,-53,-54,-105,-55,-56,]),'PLUSPLUS':([19,33,36,40,43,58,59,60,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,81,87,89,90,91,92,93,94,95,96,97,98,99,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,132,133,134,135,137,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,180,181,188,190,195,196,197,201,202,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[-59,-6,64,64,64,-61,-62,-63,64,132,64,64,64,-52,-60,-64,-102,-103,-104,-90,-91,-92,-132,64,64,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-53,-54,64,64,64,64,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,64,64,64,64,-114,-116,64,64,64,-105,64,-126,64,-115,-40,-55,-56,64,64,64,64,-93,-95,64,-41,-42,64,64,-94,64,64,-97,-96,]),'MINUSMINUS':([19,33,36,40,43,58,59,60,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,81,87,89,90,91,92,93,94,95,96,97,98,99,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,132,133,134,135,137,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,180,181,188,190,195,196,197,201,202,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[-59,-6,65,65,65,-61,-62,-63,65,133,65,65,65,-52,-60,-64,-102,-103,-104,-90,-91,-92,-132,65,65,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-53,-54,65,65,65,65,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,65,65,65,65,-114,-116,65,65,65,-105,65,-126,65,-115,-40,-55,-56,65,65,65,65,-93,-95,65,-41,-42,65,65,-94,65,65,-97,-96,]),'DIVIDE':([19,56,57,61,63,67,70,71,72,73,74,75,76,82,83,132,133,136,138,139,167,168,169,170,171,172,173,174,175,176,177,178,179,181,200,201,202,],[-59,118,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,118,-57,-53,-54,-66,-67,-68,-73,-74,-75,118,118,118,118,118,118,118,118,118,118,-105,-58,-55,-56,]),'MOD':([19,56,57,61,63,67,70,71,72,73,74,75,76,82,83,132,133,136,138,139,167,168,169,170,171,172,173,174,175,176,177,178,179,181,200,201,202,],[-59,119,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,119,-57,-53,-54,-66,-67,-68,-73,-74,-75,119,119,119,119,119,119,119,119,119,119,-105,-58,-55,-56,]),'PLUS':([19,33,36,40,43,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,81,82,83,87,89,90,91,92,93,94,95,96,97,98,99,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,132,133,134,135,136,137,138,139,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,188,190,195,196,197,200,201,202,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[-59,-6,59,59,59,120,-72,-61,-62,-63,-57,59,-65,59,59,59,-52,-60,-64,-102,-103,-104,-90,-91,-92,-132,59,120,-57,59,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-53,-54,59,59,-66,59,-67,-68,59,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,59,59,59,59,-114,-116,59,59,-73,-74,-75,-76,-77,120,120,120,120,120,120,120,120,59,-105,59,-126,59,-115,-40,-58,-55,-56,59,59,59,59,-93,-95,59,-41,-42,59,59,-94,59,59,-97,-96,]),'MINUS':([19,33,36,40,43,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,81,82,83,87,89,90,91,92,93,94,95,96,97,98,99,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,132,133,134,135,136,137,138,139,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,188,190,195,196,197,200,201,202,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[-59,-6,60,60,60,121,-72,-61,-62,-63,-57,60,-65,60,60,60,-52,-60,-64,-102,-103,-104,-90,-91,-92,-132,60,121,-57,60,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-53,-54,60,60,-66,60,-67,-68,60,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,60,60,60,60,-114,-116,60,60,-73,-74,-75,-76,-77,121,121,121,121,121,121,121,121,60,-105,60,-126,60,-115,-40,-58,-55,-56,60,60,60,60,-93,-95,60,-41,-42,60,60,-94,60,60,-97,-96,]),'LT':([19,56,57,61,63,67,70,71,72,73,74,75,76,82,83,132,133,136,138,139,167,168,169,170,171,172,173,174,175,176,177,178,179,181,200,201,202,],[-59,122,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,122,-57,-53,-54,-66,-67,-68,-73,-74,-75,-76,-77,-78,-79,-80,-81,122,-83,-84,-85,-105,-58,-55,-56,]),'LE':([19,56,57,61,63,67,70,71,72,73,74,75,76,82,83,132,133,136,138,139,167,168,169,170,171,172,173,174,175,176,177,178,179,181,200,201,202,],[-59,123,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,123,-57,-53,-54,-66,-67,-68,-73,-74,-75,-76,-77,-78,-79,-80,-81,123,-83,-84,-85,-105,-58,-55,-56,]),'HT':([19,56,57,61,63,67,70,71,72,73,74,75,76,82,83,132,133,136,138,139,167,168,169,170,171,172,173,174,175,176,177,178,179,181,200,201,202,],[-59,124,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,124,-57,-53,-54,-66,-67,-68,-73,-74,-75,-76,-77,-78,-79,-80,-81,124,-83,-84,-85,-105,-58,-55,-56,]),'HE':([19,56,57,61,63,67,70,71,72,73,74,75,76,82,83,132,133,136,138,139,167,168,169,170,171,172,173,174,175,176,177,178,179,181,200,201,202,],[-59,125,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,125,-57,-53,-54,-66,-67,-68,-73,-74,-75,-76,-77,-78,-79,-80,-81,125,-83,-84,-85,-105,-58,-55,-56,]),'EQ':([19,56,57,61,63,67,70,71,72,73,74,75,76,82,83,132,133,136,138,139,167,168,169,170,171,172,173,174,175,176,177,178,179,181,200,201,202,],[-59,126,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,126,-57,-53,-54,-66,-67,-68,-73,-74,-75,-76,-77,-78,-79,-80,-81,126,-83,-84,-85,-105,-58,-55,-56,]),'DIFF':([19,56,57,61,63,67,70,71,72,73,74,75,76,82,83,132,133,136,138,139,167,168,169,170,171,172,173,174,175,176,177,178,179,181,200,201,202,],[-59,127,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,127,-57,-53,-54,-66,-67,-68,-73,-74,-75,-76,-77,-78,-79,-80,-81,127,-83,-84,-85,-105,-58,-55,-56,]),'AND':([19,56,57,61,63,67,70,71,72,73,74,75,76,82,83,132,133,136,138,139,167,168,169,170,171,172,173,174,175,176,177,178,179,181,200,201,202,],[-59,128,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,128,-57,-53,-54,-66,-67,-68,-73,-74,-75,-76,-77,128,128,128,128,128,128,-84,128,-105,-58,-55,-56,]),'OR':([19,56,57,61,63,67,70,71,72,73,74,75,76,82,83,132,133,136,138,139,167,168,169,170,171,172,173,174,175,176,177,178,179,181,200,201,202,],[-59,129,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,129,-57,-53,-54,-66,-67,-68,-73,-74,-75,-76,-77,129,129,129,129,129,129,-84,-85,-105,-58,-55,-56,]),'RBRACKET':([19,36,53,54,55,56,57,61,63,67,70,71,72,73,74,75,76,82,83,110,132,133,136,138,139,167,168,169,170,171,172,173,174,175,176,177,178,179,181,182,189,192,200,201,202,],[-59,-135,116,-70,-71,-69,-72,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,-112,-57,-130,-53,-54,-66,-67,-68,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-105,201,-113,-131,-58,-55,-56,]),'ASSIGN_TIMES':([19,61,63,67,70,71,72,73,74,75,76,83,132,133,136,138,139,181,200,201,202,],[-59,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,144,-53,-54,-66,-67,-68,-105,-58,-55,-56,]),'ASSIGN_DIVIDE':([19,61,63,67,70,71,72,73,74,75,76,83,132,133,136,138,139,181,200,201,202,],[-59,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,145,-53,-54,-66,-67,-68,-105,-58,-55,-56,]),'ASSIGN_MOD':([19,61,63,67,70,71,72,73,74,75,76,83,132,133,136,138,139,181,200,201,202,],[-59,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,146,-53,-54,-66,-67,-68,-105,-58,-55,-56,]),'ASSIGN_PLUS':([19,61,63,67,70,71,72,73,74,75,76,83,132,133,136,138,139,181,200,201,202,],[-59,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,147,-53,-54,-66,-67,-68,-105,-58,-55,-56,]),'ASSIGN_MINUS':([19,61,63,67,70,71,72,73,74,75,76,83,132,133,136,138,139,181,200,201,202,],[-59,-57,-65,-52,-102,-103,-104,-90,-91,-92,-132,148,-53,-54,-66,-67,-68,-105,-58,-55,-56,]),'IF':([33,43,87,89,90,91,92,93,94,95,96,97,98,99,149,150,151,153,155,160,162,190,196,197,206,207,213,215,218,219,220,223,225,226,227,228,],[-6,101,101,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-124,-125,-51,-25,-127,-114,-116,-126,-115,-40,101,101,-93,-95,-41,-42,101,-94,101,101,-97,-96,]),'WHILE':([33,43,87,89,90,91,92,93,94,95,96,97,98,99,149,150,151,153,155,160,162,190,196,197,206,207,213,215,218,219,220,223,225,226,227,228,],[-6,103,103,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-124,-125,-51,-25,-127,-114,-116,-126,-115,-40,103,103,-93,-95,-41,-42,103,-94,103,103,-97,-96,]),'FOR':([33,43,87,89,90,91,92,93,94,95,96,97,98,99,149,150,151,153,155,160,162,190,196,197,206,207,213,215,218,219,220,223,225,226,227,228,],[-6,104,104,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-124,-125,-51,-25,-127,-114,-116,-126,-115,-40,104,104,-93,-95,-41,-42,104,-94,104,104,-97,-96,]),'BREAK':([33,43,87,89,90,91,92,93,94,95,96,97,98,99,149,150,151,153,155,160,162,190,196,197,206,207,213,215,218,219,220,223,225,226,227,228,],[-6,105,105,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-124,-125,-51,-25,-127,-114,-116,-126,-115,-40,105,105,-93,-95,-41,-42,105,-94,105,105,-97,-96,]),'RETURN':([33,43,87,89,90,91,92,93,94,95,96,97,98,99,149,150,151,153,155,160,162,190,196,197,206,207,213,215,218,219,220,223,225,226,227,228,],[-6,106,106,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-124,-125,-51,-25,-127,-114,-116,-126,-115,-40,106,106,-93,-95,-41,-42,106,-94,106,106,-97,-96,]),'ASSERT':([33,43,87,89,90,91,92,93,94,95,96,97,98,99,149,150,151,153,155,160,162,190,196,197,206,207,213,215,218,219,220,223,225,226,227,228,],[-6,107,107,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-124,-125,-51,-25,-127,-114,-116,-126,-115,-40,107,107,-93,-95,-41,-42,107,-94,107,107,-97,-96,]),'PRINT':([33,43,87,89,90,91,92,93,94,95,96,97,98,99,149,150,151,153,155,160,162,190,196,197,206,207,213,215,218,219,220,223,225,226,227,228,],[-6,108,108,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-124,-125,-51,-25,-127,-114,-116,-126,-115,-40,108,108,-93,-95,-41,-42,108,-94,108,108,-97,-96,]),'READ':([33,43,87,89,90,91,92,93,94,95,96,97,98,99,149,150,151,153,155,160,162,190,196,197,206,207,213,215,218,219,220,223,225,226,227,228,],[-6,109,109,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,-124,-125,-51,-25,-127,-114,-116,-126,-115,-40,109,109,-93,-95,-41,-42,109,-94,109,109,-97,-96,]),'ADDRESS':([33,36,40,43,58,59,60,62,64,65,66,68,69,81,87,89,90,91,92,93,94,95,96,97,98,99,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,180,188,190,195,196,197,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[-6,68,68,68,-61,-62,-63,68,68,68,68,-60,-64,68,68,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,68,68,68,68,-114,-116,68,68,68,68,-126,68,-115,-40,68,68,68,68,-93,-95,68,-41,-42,68,68,-94,68,68,-97,-96,]),'NOT':([33,36,40,43,58,59,60,62,64,65,66,68,69,81,87,89,90,91,92,93,94,95,96,97,98,99,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,180,188,190,195,196,197,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[-6,69,69,69,-61,-62,-63,69,69,69,69,-60,-64,69,69,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,69,69,69,69,-114,-116,69,69,69,69,-126,69,-115,-40,69,69,69,69,-93,-95,69,-41,-42,69,69,-94,69,69,-97,-96,]),'INT_CONST':([33,36,40,43,58,59,60,62,64,65,66,68,69,81,87,89,90,91,92,93,94,95,96,97,98,99,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,180,188,190,195,196,197,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[-6,73,73,73,-61,-62,-63,73,73,73,73,-60,-64,73,73,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,73,73,73,73,-114,-116,73,73,73,73,-126,73,-115,-40,73,73,73,73,-93,-95,73,-41,-42,73,73,-94,73,73,-97,-96,]),'FLOAT_CONST':([33,36,40,43,58,59,60,62,64,65,66,68,69,81,87,89,90,91,92,93,94,95,96,97,98,99,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,180,188,190,195,196,197,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[-6,74,74,74,-61,-62,-63,74,74,74,74,-60,-64,74,74,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,74,74,74,74,-114,-116,74,74,74,74,-126,74,-115,-40,74,74,74,74,-93,-95,74,-41,-42,74,74,-94,74,74,-97,-96,]),'CHAR_CONST':([33,36,40,43,58,59,60,62,64,65,66,68,69,81,87,89,90,91,92,93,94,95,96,97,98,99,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,180,188,190,195,196,197,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[-6,75,75,75,-61,-62,-63,75,75,75,75,-60,-64,75,75,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,75,75,75,75,-114,-116,75,75,75,75,-126,75,-115,-40,75,75,75,75,-93,-95,75,-41,-42,75,75,-94,75,75,-97,-96,]),'STRING':([33,36,40,43,58,59,60,62,64,65,66,68,69,81,87,89,90,91,92,93,94,95,96,97,98,99,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,143,144,145,146,147,148,149,150,151,153,155,156,157,158,159,160,162,164,165,180,188,190,195,196,197,203,206,207,208,213,215,217,218,219,220,221,223,225,226,227,228,],[-6,76,76,76,-61,-62,-63,76,76,76,76,-60,-64,76,76,-24,-26,-27,-43,-44,-45,-46,-47,-48,-49,-50,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,-106,-107,-108,-109,-110,-111,-124,-125,-51,-25,-127,76,76,76,76,-114,-116,76,76,76,76,-126,76,-115,-40,76,76,76,76,-93,-95,76,-41,-42,76,76,-94,76,76,-97,-96,]),'ELSE':([92,93,94,95,96,97,98,99,149,150,151,155,160,162,190,196,197,213,215,218,219,223,227,228,],[-43,-44,-45,-46,-47,-48,-49,-50,-124,-125,-51,-127,-114,-116,-126,-115,-40,220,-95,-41,-42,-94,-97,-96,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'expression_statement':([69,127,196,199,208,210,212,],[110,110,110,110,110,110,110,]),'identifier_list_opt':([27,],[61,]),'constant':([26,38,46,50,53,54,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,111,114,127,138,146,148,165,166,168,169,173,176,180,189,196,197,199,204,206,208,210,212,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'unary_expression':([26,38,46,50,53,54,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,111,114,127,138,146,148,165,166,168,169,173,176,180,189,196,197,199,204,206,208,210,212,],[40,75,40,85,75,90,75,75,75,75,75,40,40,40,40,40,40,40,40,40,40,40,40,40,75,75,75,75,40,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'initializer':([38,78,176,],[76,140,191,]),'init_declarator_list':([4,32,],[20,20,]),'init_declarator_list_opt':([4,32,],[21,21,]),'print_statement':([69,127,196,199,208,210,212,],[116,116,116,116,116,116,116,]),'pointer':([0,4,5,9,10,32,36,65,],[3,3,3,28,3,3,3,3,]),'argument_expression':([82,165,],[145,184,]),'type_specifier':([0,5,17,23,27,33,53,69,107,127,169,],[4,4,32,32,65,32,88,32,65,32,32,]),'assert_statement':([69,127,196,199,208,210,212,],[118,118,118,118,118,118,118,]),'compound_statement':([31,37,69,127,196,199,208,210,212,],[70,74,119,119,119,119,119,119,119,]),'iteration_statement':([69,127,196,199,208,210,212,],[117,117,117,117,117,117,117,]),'selection_statement':([69,127,196,199,208,210,212,],[120,120,120,120,120,120,120,]),'postfix_expression':([26,38,46,50,53,54,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,111,114,127,138,146,148,165,166,168,169,173,176,180,189,196,197,199,204,206,208,210,212,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'global_declaration_list':([0,],[5,]),'program':([0,],[6,]),'statement':([69,127,196,199,208,210,212,],[121,121,202,205,211,213,214,]),'read_statement':([69,127,196,199,208,210,212,],[122,122,122,122,122,122,122,]),'cast_expression':([26,38,46,53,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,111,114,127,138,146,148,165,166,168,169,173,176,180,189,196,197,199,204,206,208,210,212,],[47,47,84,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,181,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'initializer_list':([78,],[141,]),'empty':([4,17,23,26,27,32,69,111,127,166,169,189,196,197,199,204,206,208,210,212,],[22,35,35,58,67,22,123,123,123,123,123,123,123,123,123,123,123,123,123,123,]),'assignment_operator':([75,],[138,]),'assignment_expression':([38,53,69,78,81,82,86,111,114,127,138,148,165,166,168,169,173,176,180,189,196,197,199,204,206,208,210,212,],[77,87,87,77,87,143,87,87,87,87,175,182,143,87,87,87,87,77,193,87,87,87,87,87,87,87,87,87,]),'parameter_declaration':([27,107,],[64,162,]),'direct_declarator':([0,3,4,5,10,32,36,65,],[8,19,8,8,8,8,8,8,]),'init_declarator':([4,32,36,],[24,24,73,]),'expression_opt':([69,111,127,166,169,189,196,197,199,204,206,208,210,212,],[125,164,125,185,188,198,125,203,125,207,209,125,125,125,]),'constant_expression':([26,],[49,]),'primary_expression':([26,38,46,50,53,54,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,111,114,127,138,146,148,165,166,168,169,173,176,180,189,196,197,199,204,206,208,210,212,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'global_declaration':([0,5,],[1,25,]),'declaration':([0,5,17,23,33,69,127,169,],[11,11,34,34,72,126,126,189,]),'identifier_list':([27,],[66,]),'block_item_list':([69,],[127,]),'jump_statement':([69,127,196,199,208,210,212,],[129,129,129,129,129,129,129,]),'declaration_list_opt':([17,23,],[31,37,]),'function_definition':([0,5,],[13,13,]),'binary_expression':([26,38,53,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,111,114,127,138,148,165,166,168,169,173,176,180,189,196,197,199,204,206,208,210,212,],[56,79,79,79,79,79,79,79,149,150,151,152,153,154,155,156,157,158,159,160,161,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'parameter_list':([27,],[63,]),'decl_body':([0,5,17,23,33,69,127,169,],[15,15,15,15,15,15,15,15,]),'constant_expression_opt':([26,],[57,]),'declaration_list':([17,23,],[33,33,]),'block_item':([69,127,],[131,172,]),'unary_operator':([26,38,46,50,53,54,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,111,114,127,138,146,148,165,166,168,169,173,176,180,189,196,197,199,204,206,208,210,212,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'declarator':([0,4,5,10,32,36,65,],[17,23,17,29,71,71,108,]),'identifier':([0,3,4,5,10,26,27,32,36,38,46,50,53,54,65,69,78,81,82,86,91,92,93,94,95,96,97,98,99,100,101,102,103,109,111,114,127,138,146,148,165,166,168,169,173,176,180,189,196,197,199,204,206,208,210,212,],[18,18,18,18,18,60,62,18,18,60,60,60,60,60,18,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,163,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'expression':([53,69,81,86,111,114,127,166,168,169,173,189,196,197,199,204,206,208,210,212,],[89,132,142,89,132,167,132,132,187,132,190,132,132,132,132,132,132,132,132,132,]),}
+_lr_goto_items = {'program':([0,],[1,]),'global_declaration_list':([0,],[2,]),'global_declaration':([0,2,],[3,20,]),'function_definition':([0,2,],[4,4,]),'declaration':([0,2,8,23,29,43,87,159,],[5,5,31,31,44,91,91,195,]),'type_specifier':([0,2,8,23,29,35,43,62,87,112,159,],[7,7,32,32,32,51,32,130,32,51,32,]),'declarator':([0,2,7,18,32,41,51,],[8,8,23,38,45,45,115,]),'decl_body':([0,2,8,23,29,43,87,159,],[9,9,9,9,9,9,9,9,]),'pointer':([0,2,7,16,18,32,41,51,],[14,14,14,37,14,14,14,14,]),'direct_declarator':([0,2,7,14,18,32,41,51,],[15,15,15,34,15,15,15,15,]),'identifier':([0,2,7,14,18,32,35,36,40,41,43,49,51,62,64,65,66,81,87,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,156,157,158,159,164,165,180,188,195,203,206,207,208,217,220,221,225,226,],[17,17,17,17,17,17,52,70,70,17,70,114,17,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'init_declarator_list_opt':([7,32,],[24,24,]),'init_declarator_list':([7,32,],[25,25,]),'empty':([7,8,23,32,35,36,43,87,135,159,164,195,206,207,208,217,220,221,225,226,],[26,30,30,26,50,55,88,154,185,154,154,154,154,154,154,154,154,154,154,154,]),'init_declarator':([7,32,41,],[27,27,84,]),'declaration_list_opt':([8,23,],[28,39,]),'declaration_list':([8,23,],[29,29,]),'compound_statement':([28,39,43,87,206,207,220,225,226,],[42,78,93,93,93,93,93,93,93,]),'parameter_list':([35,],[46,]),'id_list_opt':([35,],[47,]),'parameter_declaration':([35,112,],[48,166,]),'id_list':([35,],[49,]),'constant_expression_opt':([36,],[53,]),'constant_expression':([36,],[54,]),'binary_expression':([36,40,43,62,81,87,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,156,157,158,159,164,165,188,195,203,206,207,208,217,220,221,225,226,],[56,82,82,82,82,82,82,82,167,168,169,170,171,172,173,174,175,176,177,178,179,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,]),'cast_expression':([36,40,43,62,66,81,87,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,156,157,158,159,164,165,180,188,195,203,206,207,208,217,220,221,225,226,],[57,57,57,57,139,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,200,57,57,57,57,57,57,57,57,57,57,57,]),'unary_expression':([36,40,43,62,64,65,66,81,87,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,156,157,158,159,164,165,180,188,195,203,206,207,208,217,220,221,225,226,],[61,83,83,83,136,138,61,83,83,83,83,61,61,61,61,61,61,61,61,61,61,61,61,61,83,83,83,83,83,83,83,83,83,83,61,83,83,83,83,83,83,83,83,83,83,83,]),'postfix_expression':([36,40,43,62,64,65,66,81,87,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,156,157,158,159,164,165,180,188,195,203,206,207,208,217,220,221,225,226,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'unary_operator':([36,40,43,62,64,65,66,81,87,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,156,157,158,159,164,165,180,188,195,203,206,207,208,217,220,221,225,226,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'primary_expression':([36,40,43,62,64,65,66,81,87,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,156,157,158,159,164,165,180,188,195,203,206,207,208,217,220,221,225,226,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'constant':([36,40,43,62,64,65,66,81,87,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,156,157,158,159,164,165,180,188,195,203,206,207,208,217,220,221,225,226,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,]),'string_literal':([36,40,43,62,64,65,66,81,87,106,107,117,118,119,120,121,122,123,124,125,126,127,128,129,134,135,137,142,156,157,158,159,164,165,180,188,195,203,206,207,208,217,220,221,225,226,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'initializer':([40,81,188,],[79,141,205,]),'assignment_expression':([40,43,62,81,87,106,107,134,135,137,142,156,157,158,159,164,165,188,195,203,206,207,208,217,220,221,225,226,],[80,110,110,80,110,110,110,110,186,110,189,110,192,110,110,110,186,80,110,212,110,110,110,110,110,110,110,110,]),'block_item_list_opt':([43,],[85,]),'block_item_list':([43,],[87,]),'block_item':([43,87,],[89,153,]),'statement':([43,87,206,207,220,225,226,],[90,90,213,215,223,227,228,]),'expression_statement':([43,87,206,207,220,225,226,],[92,92,92,92,92,92,92,]),'selection_statement':([43,87,206,207,220,225,226,],[94,94,94,94,94,94,94,]),'iteration_statement':([43,87,206,207,220,225,226,],[95,95,95,95,95,95,95,]),'jump_statement':([43,87,206,207,220,225,226,],[96,96,96,96,96,96,96,]),'assert_statement':([43,87,206,207,220,225,226,],[97,97,97,97,97,97,97,]),'print_statement':([43,87,206,207,220,225,226,],[98,98,98,98,98,98,98,]),'read_statement':([43,87,206,207,220,225,226,],[99,99,99,99,99,99,99,]),'expression_opt':([43,87,159,164,195,206,207,208,217,220,221,225,226,],[100,100,194,198,209,100,100,216,222,100,224,100,100,]),'expression':([43,62,87,106,107,134,137,156,158,159,164,195,206,207,208,217,220,221,225,226,],[102,131,102,161,163,182,131,191,193,102,102,102,102,102,102,102,102,102,102,102,]),'initializer_list':([81,],[140,]),'assignment_operator':([83,],[142,]),'argument_expression_opt':([135,],[183,]),'argument_expression_list':([135,165,],[184,199,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,128 +27,139 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> global_declaration_list','program',1,'p_program','parser.py',137),
-  ('global_declaration_list -> global_declaration','global_declaration_list',1,'p_global_declaration_list','parser.py',143),
-  ('global_declaration_list -> global_declaration_list global_declaration','global_declaration_list',2,'p_global_declaration_list','parser.py',144),
-  ('global_declaration -> declaration','global_declaration',1,'p_global_declaration1','parser.py',149),
-  ('global_declaration -> function_definition','global_declaration',1,'p_global_declaration2','parser.py',154),
-  ('declaration -> decl_body SEMI','declaration',2,'p_declaration','parser.py',159),
-  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','parser.py',164),
-  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','parser.py',165),
-  ('declaration_list_opt -> declaration_list','declaration_list_opt',1,'p_declaration_list_opt','parser.py',170),
-  ('declaration_list_opt -> empty','declaration_list_opt',1,'p_declaration_list_opt','parser.py',171),
-  ('decl_body -> type_specifier init_declarator_list_opt','decl_body',2,'p_decl_body','parser.py',176),
-  ('declarator -> direct_declarator','declarator',1,'p_declarator','parser.py',185),
-  ('declarator -> pointer direct_declarator','declarator',2,'p_declarator2','parser.py',190),
-  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','parser.py',195),
-  ('init_declarator -> declarator EQ initializer','init_declarator',3,'p_init_declarator','parser.py',196),
-  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list','parser.py',201),
-  ('init_declarator_list -> init_declarator_list COMMA init_declarator','init_declarator_list',3,'p_init_declarator_list','parser.py',202),
-  ('init_declarator_list_opt -> init_declarator_list','init_declarator_list_opt',1,'p_init_declarator_list_opt','parser.py',207),
-  ('init_declarator_list_opt -> empty','init_declarator_list_opt',1,'p_init_declarator_list_opt','parser.py',208),
-  ('direct_declarator -> identifier','direct_declarator',1,'p_direct_declarator1','parser.py',213),
-  ('direct_declarator -> LPAREN declarator RPAREN','direct_declarator',3,'p_direct_declarator2','parser.py',218),
-  ('direct_declarator -> direct_declarator LBRACKET constant_expression_opt RBRACKET','direct_declarator',4,'p_direct_declarator3','parser.py',223),
-  ('direct_declarator -> direct_declarator LPAREN identifier_list_opt RPAREN','direct_declarator',4,'p_direct_declarator4','parser.py',230),
-  ('direct_declarator -> direct_declarator LPAREN parameter_list RPAREN','direct_declarator',4,'p_direct_declarator4','parser.py',231),
-  ('initializer -> assignment_expression','initializer',1,'p_initializer1','parser.py',237),
-  ('initializer -> LBRACE initializer_list RBRACE','initializer',3,'p_initializer2','parser.py',242),
-  ('initializer -> LBRACE initializer_list COMMA RBRACE','initializer',4,'p_initializer2','parser.py',243),
-  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression1','parser.py',251),
-  ('postfix_expression -> postfix_expression PLUSPLUS','postfix_expression',2,'p_postfix_expression2','parser.py',256),
-  ('postfix_expression -> postfix_expression MINUSMINUS','postfix_expression',2,'p_postfix_expression2','parser.py',257),
-  ('postfix_expression -> postfix_expression LPAREN RPAREN','postfix_expression',3,'p_postfix_expression3','parser.py',262),
-  ('postfix_expression -> postfix_expression LPAREN argument_expression RPAREN','postfix_expression',4,'p_postfix_expression3','parser.py',263),
-  ('postfix_expression -> postfix_expression LBRACKET expression RBRACKET','postfix_expression',4,'p_postfix_expression4','parser.py',269),
-  ('cast_expression -> unary_expression','cast_expression',1,'p_cast_expression1','parser.py',274),
-  ('cast_expression -> LPAREN type_specifier RPAREN cast_expression','cast_expression',4,'p_cast_expression2','parser.py',279),
-  ('identifier -> ID','identifier',1,'p_identifier','parser.py',284),
-  ('identifier_list_opt -> identifier_list','identifier_list_opt',1,'p_identifier_list_opt','parser.py',290),
-  ('identifier_list_opt -> empty','identifier_list_opt',1,'p_identifier_list_opt','parser.py',291),
-  ('identifier_list -> identifier','identifier_list',1,'p_identifier_list','parser.py',296),
-  ('identifier_list -> identifier_list COMMA identifier','identifier_list',3,'p_identifier_list','parser.py',297),
-  ('unary_operator -> EQ','unary_operator',1,'p_unary_operator','parser.py',306),
-  ('unary_operator -> TIMES','unary_operator',1,'p_unary_operator','parser.py',307),
-  ('unary_operator -> PLUS','unary_operator',1,'p_unary_operator','parser.py',308),
-  ('unary_operator -> MINUS','unary_operator',1,'p_unary_operator','parser.py',309),
-  ('unary_operator -> NOT','unary_operator',1,'p_unary_operator','parser.py',310),
-  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier','parser.py',315),
-  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','parser.py',316),
-  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','parser.py',317),
-  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','parser.py',318),
-  ('constant_expression -> binary_expression','constant_expression',1,'p_constant_expression','parser.py',324),
-  ('constant_expression_opt -> constant_expression','constant_expression_opt',1,'p_constant_expression_opt','parser.py',329),
-  ('constant_expression_opt -> empty','constant_expression_opt',1,'p_constant_expression_opt','parser.py',330),
-  ('constant -> INT_CONST','constant',1,'p_constant1','parser.py',335),
-  ('constant -> FLOAT_CONST','constant',1,'p_constant2','parser.py',341),
-  ('constant -> STRING','constant',1,'p_constant3','parser.py',347),
-  ('block_item -> declaration','block_item',1,'p_block_item','parser.py',353),
-  ('block_item -> statement','block_item',1,'p_block_item','parser.py',354),
-  ('block_item_list -> block_item','block_item_list',1,'p_block_item_list','parser.py',359),
-  ('block_item_list -> block_item_list block_item','block_item_list',2,'p_block_item_list','parser.py',360),
-  ('selection_statement -> IF LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement1','parser.py',365),
-  ('selection_statement -> IF LPAREN expression RPAREN statement ELSE statement','selection_statement',7,'p_selection_statement2','parser.py',371),
-  ('initializer_list -> initializer','initializer_list',1,'p_initializer_list','parser.py',376),
-  ('initializer_list -> initializer_list COMMA initializer','initializer_list',3,'p_initializer_list','parser.py',377),
-  ('argument_expression -> assignment_expression','argument_expression',1,'p_argument_expression','parser.py',386),
-  ('argument_expression -> argument_expression COMMA assignment_expression','argument_expression',3,'p_argument_expression','parser.py',387),
-  ('function_definition -> type_specifier declarator declaration_list_opt compound_statement','function_definition',4,'p_function_definition1','parser.py',398),
-  ('function_definition -> declarator declaration_list_opt compound_statement','function_definition',3,'p_function_definition2','parser.py',405),
-  ('assert_statement -> ASSERT expression SEMI','assert_statement',3,'p_assert_statement','parser.py',411),
-  ('print_statement -> PRINT LPAREN expression_opt RPAREN SEMI','print_statement',5,'p_print_statement','parser.py',416),
-  ('read_statement -> READ LPAREN argument_expression RPAREN SEMI','read_statement',5,'p_read_statement','parser.py',421),
-  ('expression_statement -> expression_opt SEMI','expression_statement',2,'p_expression_statement','parser.py',426),
-  ('compound_statement -> LBRACE block_item_list RBRACE','compound_statement',3,'p_compound_statement','parser.py',434),
-  ('statement -> expression_statement','statement',1,'p_statement','parser.py',439),
-  ('statement -> selection_statement','statement',1,'p_statement','parser.py',440),
-  ('statement -> jump_statement','statement',1,'p_statement','parser.py',441),
-  ('statement -> print_statement','statement',1,'p_statement','parser.py',442),
-  ('statement -> assert_statement','statement',1,'p_statement','parser.py',443),
-  ('statement -> read_statement','statement',1,'p_statement','parser.py',444),
-  ('statement -> iteration_statement','statement',1,'p_statement','parser.py',445),
-  ('statement -> compound_statement','statement',1,'p_statement','parser.py',446),
-  ('jump_statement -> BREAK SEMI','jump_statement',2,'p_jump_statement1','parser.py',451),
-  ('jump_statement -> RETURN expression_opt SEMI','jump_statement',3,'p_jump_statement2','parser.py',456),
-  ('iteration_statement -> WHILE LPAREN expression RPAREN statement','iteration_statement',5,'p_iteration_statement1','parser.py',461),
-  ('iteration_statement -> FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN statement','iteration_statement',9,'p_iteration_statement2','parser.py',466),
-  ('iteration_statement -> FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN statement','iteration_statement',8,'p_iteration_statement3','parser.py',471),
-  ('pointer -> TIMES','pointer',1,'p_pointer','parser.py',476),
-  ('pointer -> TIMES pointer','pointer',2,'p_pointer','parser.py',477),
-  ('parameter_declaration -> type_specifier declarator','parameter_declaration',2,'p_parameter_declaration','parser.py',492),
-  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list','parser.py',498),
-  ('parameter_list -> parameter_list COMMA parameter_declaration','parameter_list',3,'p_parameter_list','parser.py',499),
-  ('expression -> assignment_expression','expression',1,'p_expression1','parser.py',508),
-  ('expression -> expression COMMA assignment_expression','expression',3,'p_expression2','parser.py',513),
-  ('primary_expression -> identifier','primary_expression',1,'p_primary_expression1','parser.py',521),
-  ('primary_expression -> constant','primary_expression',1,'p_primary_expression1','parser.py',522),
-  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression2','parser.py',527),
-  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','parser.py',532),
-  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','parser.py',533),
-  ('assignment_expression -> binary_expression','assignment_expression',1,'p_assignment_expression','parser.py',538),
-  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression','parser.py',539),
-  ('assignment_operator -> EQ','assignment_operator',1,'p_assignment_operator','parser.py',547),
-  ('assignment_operator -> ASSIGN_TIMES','assignment_operator',1,'p_assignment_operator','parser.py',548),
-  ('assignment_operator -> ASSIGN_DIVIDE','assignment_operator',1,'p_assignment_operator','parser.py',549),
-  ('assignment_operator -> ASSIGN_MOD','assignment_operator',1,'p_assignment_operator','parser.py',550),
-  ('assignment_operator -> ASSIGN_PLUS','assignment_operator',1,'p_assignment_operator','parser.py',551),
-  ('assignment_operator -> ASSIGN_MINUS','assignment_operator',1,'p_assignment_operator','parser.py',552),
-  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression1','parser.py',557),
-  ('unary_expression -> PLUSPLUS unary_expression','unary_expression',2,'p_unary_expression2','parser.py',562),
-  ('unary_expression -> MINUSMINUS unary_expression','unary_expression',2,'p_unary_expression2','parser.py',563),
-  ('unary_expression -> unary_operator cast_expression','unary_expression',2,'p_unary_expression2','parser.py',564),
-  ('binary_expression -> cast_expression','binary_expression',1,'p_binary_expression','parser.py',569),
-  ('binary_expression -> binary_expression TIMES binary_expression','binary_expression',3,'p_binary_expression','parser.py',570),
-  ('binary_expression -> binary_expression DIVIDE binary_expression','binary_expression',3,'p_binary_expression','parser.py',571),
-  ('binary_expression -> binary_expression MOD binary_expression','binary_expression',3,'p_binary_expression','parser.py',572),
-  ('binary_expression -> binary_expression PLUS binary_expression','binary_expression',3,'p_binary_expression','parser.py',573),
-  ('binary_expression -> binary_expression MINUS binary_expression','binary_expression',3,'p_binary_expression','parser.py',574),
-  ('binary_expression -> binary_expression LE binary_expression','binary_expression',3,'p_binary_expression','parser.py',575),
-  ('binary_expression -> binary_expression LT binary_expression','binary_expression',3,'p_binary_expression','parser.py',576),
-  ('binary_expression -> binary_expression HE binary_expression','binary_expression',3,'p_binary_expression','parser.py',577),
-  ('binary_expression -> binary_expression HT binary_expression','binary_expression',3,'p_binary_expression','parser.py',578),
-  ('binary_expression -> binary_expression EQUALS binary_expression','binary_expression',3,'p_binary_expression','parser.py',579),
-  ('binary_expression -> binary_expression DIFF binary_expression','binary_expression',3,'p_binary_expression','parser.py',580),
-  ('binary_expression -> binary_expression AND binary_expression','binary_expression',3,'p_binary_expression','parser.py',581),
-  ('binary_expression -> binary_expression OR binary_expression','binary_expression',3,'p_binary_expression','parser.py',582),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',590),
+  ('program -> global_declaration_list','program',1,'p_program','parser.py',167),
+  ('global_declaration_list -> global_declaration','global_declaration_list',1,'p_global_declaration_list','parser.py',172),
+  ('global_declaration_list -> global_declaration_list global_declaration','global_declaration_list',2,'p_global_declaration_list','parser.py',173),
+  ('declarator -> pointer direct_declarator','declarator',2,'p_declarator','parser.py',181),
+  ('declarator -> direct_declarator','declarator',1,'p_declarator','parser.py',182),
+  ('declaration -> decl_body SEMI','declaration',2,'p_declaration','parser.py',190),
+  ('global_declaration -> function_definition','global_declaration',1,'p_global_declaration1','parser.py',195),
+  ('global_declaration -> declaration','global_declaration',1,'p_global_declaration2','parser.py',200),
+  ('global_declaration -> error SEMI','global_declaration',2,'p_global_declaration_error','parser.py',205),
+  ('global_declaration -> error RBRACE','global_declaration',2,'p_global_declaration_error','parser.py',206),
+  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','parser.py',211),
+  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','parser.py',212),
+  ('declaration_list_opt -> declaration_list','declaration_list_opt',1,'p_declaration_list_opt','parser.py',220),
+  ('declaration_list_opt -> empty','declaration_list_opt',1,'p_declaration_list_opt','parser.py',221),
+  ('block_item_list_opt -> block_item_list','block_item_list_opt',1,'p_block_item_list_opt','parser.py',226),
+  ('block_item_list_opt -> empty','block_item_list_opt',1,'p_block_item_list_opt','parser.py',227),
+  ('decl_body -> type_specifier init_declarator_list_opt','decl_body',2,'p_decl_body','parser.py',232),
+  ('init_declarator -> declarator','init_declarator',1,'p_init_declarator','parser.py',240),
+  ('init_declarator -> declarator EQUALS initializer','init_declarator',3,'p_init_declarator','parser.py',241),
+  ('init_declarator_list_opt -> init_declarator_list','init_declarator_list_opt',1,'p_init_declarator_list_opt','parser.py',249),
+  ('init_declarator_list_opt -> empty','init_declarator_list_opt',1,'p_init_declarator_list_opt','parser.py',250),
+  ('init_declarator_list -> init_declarator','init_declarator_list',1,'p_init_declarator_list1','parser.py',255),
+  ('init_declarator_list -> init_declarator_list COMMA init_declarator','init_declarator_list',3,'p_init_declarator_list2','parser.py',260),
+  ('block_item_list -> block_item','block_item_list',1,'p_block_item_list','parser.py',265),
+  ('block_item_list -> block_item_list block_item','block_item_list',2,'p_block_item_list','parser.py',266),
+  ('block_item -> statement','block_item',1,'p_block_item','parser.py',274),
+  ('block_item -> declaration','block_item',1,'p_block_item','parser.py',275),
+  ('function_definition -> type_specifier declarator declaration_list_opt compound_statement','function_definition',4,'p_function_definition_1','parser.py',285),
+  ('function_definition -> declarator declaration_list_opt compound_statement','function_definition',3,'p_function_definition_2','parser.py',290),
+  ('direct_declarator -> identifier','direct_declarator',1,'p_direct_declarator1','parser.py',296),
+  ('direct_declarator -> LPAREN declarator RPAREN','direct_declarator',3,'p_direct_declarator2','parser.py',301),
+  ('direct_declarator -> direct_declarator LPAREN parameter_list RPAREN','direct_declarator',4,'p_direct_declarator3','parser.py',306),
+  ('direct_declarator -> direct_declarator LBRACKET constant_expression_opt RBRACKET','direct_declarator',4,'p_direct_declarator4','parser.py',313),
+  ('direct_declarator -> direct_declarator LPAREN id_list_opt RPAREN','direct_declarator',4,'p_direct_declarator5','parser.py',319),
+  ('initializer -> assignment_expression','initializer',1,'p_initializer1','parser.py',326),
+  ('initializer -> LBRACE initializer_list RBRACE','initializer',3,'p_initializer2','parser.py',331),
+  ('initializer -> LBRACE initializer_list COMMA RBRACE','initializer',4,'p_initializer2','parser.py',332),
+  ('initializer_list -> initializer','initializer_list',1,'p_initializer_list1','parser.py',340),
+  ('initializer_list -> initializer_list COMMA initializer','initializer_list',3,'p_initializer_list2','parser.py',346),
+  ('assert_statement -> ASSERT expression SEMI','assert_statement',3,'p_assert_statement','parser.py',352),
+  ('print_statement -> PRINT LPAREN expression_opt RPAREN SEMI','print_statement',5,'p_print_statement','parser.py',357),
+  ('read_statement -> READ LPAREN argument_expression_list RPAREN SEMI','read_statement',5,'p_read_statement','parser.py',365),
+  ('statement -> expression_statement','statement',1,'p_statement','parser.py',370),
+  ('statement -> compound_statement','statement',1,'p_statement','parser.py',371),
+  ('statement -> selection_statement','statement',1,'p_statement','parser.py',372),
+  ('statement -> iteration_statement','statement',1,'p_statement','parser.py',373),
+  ('statement -> jump_statement','statement',1,'p_statement','parser.py',374),
+  ('statement -> assert_statement','statement',1,'p_statement','parser.py',375),
+  ('statement -> print_statement','statement',1,'p_statement','parser.py',376),
+  ('statement -> read_statement','statement',1,'p_statement','parser.py',377),
+  ('statement -> error SEMI','statement',2,'p_statement_error','parser.py',382),
+  ('postfix_expression -> primary_expression','postfix_expression',1,'p_postfix_expression1','parser.py',387),
+  ('postfix_expression -> postfix_expression PLUSPLUS','postfix_expression',2,'p_postfix_expression2','parser.py',392),
+  ('postfix_expression -> postfix_expression MINUSMINUS','postfix_expression',2,'p_postfix_expression2','parser.py',393),
+  ('postfix_expression -> postfix_expression LBRACKET expression RBRACKET','postfix_expression',4,'p_postfix_expression3','parser.py',399),
+  ('postfix_expression -> postfix_expression LPAREN argument_expression_opt RPAREN','postfix_expression',4,'p_postfix_expression4','parser.py',404),
+  ('cast_expression -> unary_expression','cast_expression',1,'p_cast_expression1','parser.py',409),
+  ('cast_expression -> LPAREN type_specifier RPAREN cast_expression','cast_expression',4,'p_cast_expression2','parser.py',414),
+  ('identifier -> ID','identifier',1,'p_identifier','parser.py',419),
+  ('unary_operator -> ADDRESS','unary_operator',1,'p_unary_operator','parser.py',424),
+  ('unary_operator -> TIMES','unary_operator',1,'p_unary_operator','parser.py',425),
+  ('unary_operator -> PLUS','unary_operator',1,'p_unary_operator','parser.py',426),
+  ('unary_operator -> MINUS','unary_operator',1,'p_unary_operator','parser.py',427),
+  ('unary_operator -> NOT','unary_operator',1,'p_unary_operator','parser.py',428),
+  ('unary_expression -> postfix_expression','unary_expression',1,'p_unary_expression1','parser.py',433),
+  ('unary_expression -> PLUSPLUS unary_expression','unary_expression',2,'p_unary_expression2','parser.py',438),
+  ('unary_expression -> MINUSMINUS unary_expression','unary_expression',2,'p_unary_expression2','parser.py',439),
+  ('unary_expression -> unary_operator cast_expression','unary_expression',2,'p_unary_expression2','parser.py',440),
+  ('constant_expression -> binary_expression','constant_expression',1,'p_constant_expression','parser.py',445),
+  ('constant_expression_opt -> constant_expression','constant_expression_opt',1,'p_constant_expression_opt','parser.py',450),
+  ('constant_expression_opt -> empty','constant_expression_opt',1,'p_constant_expression_opt','parser.py',451),
+  ('binary_expression -> cast_expression','binary_expression',1,'p_binary_expression1','parser.py',456),
+  ('binary_expression -> binary_expression TIMES binary_expression','binary_expression',3,'p_binary_expression2','parser.py',461),
+  ('binary_expression -> binary_expression DIVIDE binary_expression','binary_expression',3,'p_binary_expression2','parser.py',462),
+  ('binary_expression -> binary_expression MOD binary_expression','binary_expression',3,'p_binary_expression2','parser.py',463),
+  ('binary_expression -> binary_expression PLUS binary_expression','binary_expression',3,'p_binary_expression2','parser.py',464),
+  ('binary_expression -> binary_expression MINUS binary_expression','binary_expression',3,'p_binary_expression2','parser.py',465),
+  ('binary_expression -> binary_expression LT binary_expression','binary_expression',3,'p_binary_expression2','parser.py',466),
+  ('binary_expression -> binary_expression LE binary_expression','binary_expression',3,'p_binary_expression2','parser.py',467),
+  ('binary_expression -> binary_expression HT binary_expression','binary_expression',3,'p_binary_expression2','parser.py',468),
+  ('binary_expression -> binary_expression HE binary_expression','binary_expression',3,'p_binary_expression2','parser.py',469),
+  ('binary_expression -> binary_expression EQ binary_expression','binary_expression',3,'p_binary_expression2','parser.py',470),
+  ('binary_expression -> binary_expression DIFF binary_expression','binary_expression',3,'p_binary_expression2','parser.py',471),
+  ('binary_expression -> binary_expression AND binary_expression','binary_expression',3,'p_binary_expression2','parser.py',472),
+  ('binary_expression -> binary_expression OR binary_expression','binary_expression',3,'p_binary_expression2','parser.py',473),
+  ('type_specifier -> VOID','type_specifier',1,'p_type_specifier','parser.py',479),
+  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','parser.py',480),
+  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','parser.py',481),
+  ('type_specifier -> CHAR','type_specifier',1,'p_type_specifier','parser.py',482),
+  ('constant -> INT_CONST','constant',1,'p_constant1','parser.py',487),
+  ('constant -> FLOAT_CONST','constant',1,'p_constant2','parser.py',492),
+  ('constant -> CHAR_CONST','constant',1,'p_constant3','parser.py',497),
+  ('selection_statement -> IF LPAREN expression RPAREN statement','selection_statement',5,'p_selection_statement','parser.py',502),
+  ('selection_statement -> IF LPAREN expression RPAREN statement ELSE statement','selection_statement',7,'p_selection_statement','parser.py',503),
+  ('iteration_statement -> WHILE LPAREN expression RPAREN statement','iteration_statement',5,'p_iteration_statement1','parser.py',511),
+  ('iteration_statement -> FOR LPAREN expression_opt SEMI expression_opt SEMI expression_opt RPAREN statement','iteration_statement',9,'p_iteration_statement2','parser.py',516),
+  ('iteration_statement -> FOR LPAREN declaration expression_opt SEMI expression_opt RPAREN statement','iteration_statement',8,'p_iteration_statement3','parser.py',521),
+  ('argument_expression_opt -> argument_expression_list','argument_expression_opt',1,'p_argument_expression_opt','parser.py',526),
+  ('argument_expression_opt -> empty','argument_expression_opt',1,'p_argument_expression_opt','parser.py',527),
+  ('argument_expression_list -> assignment_expression','argument_expression_list',1,'p_argument_expression_list','parser.py',533),
+  ('argument_expression_list -> argument_expression_list COMMA assignment_expression','argument_expression_list',3,'p_argument_expression_list','parser.py',534),
+  ('primary_expression -> identifier','primary_expression',1,'p_primary_expression1','parser.py',546),
+  ('primary_expression -> constant','primary_expression',1,'p_primary_expression1','parser.py',547),
+  ('primary_expression -> string_literal','primary_expression',1,'p_primary_expression1','parser.py',548),
+  ('primary_expression -> LPAREN expression RPAREN','primary_expression',3,'p_primary_expression2','parser.py',553),
+  ('assignment_operator -> EQUALS','assignment_operator',1,'p_assignment_operator','parser.py',558),
+  ('assignment_operator -> ASSIGN_TIMES','assignment_operator',1,'p_assignment_operator','parser.py',559),
+  ('assignment_operator -> ASSIGN_DIVIDE','assignment_operator',1,'p_assignment_operator','parser.py',560),
+  ('assignment_operator -> ASSIGN_MOD','assignment_operator',1,'p_assignment_operator','parser.py',561),
+  ('assignment_operator -> ASSIGN_PLUS','assignment_operator',1,'p_assignment_operator','parser.py',562),
+  ('assignment_operator -> ASSIGN_MINUS','assignment_operator',1,'p_assignment_operator','parser.py',563),
+  ('assignment_expression -> binary_expression','assignment_expression',1,'p_assignment_expression1','parser.py',568),
+  ('assignment_expression -> unary_expression assignment_operator assignment_expression','assignment_expression',3,'p_assignment_expression2','parser.py',573),
+  ('jump_statement -> BREAK SEMI','jump_statement',2,'p_jump_statement1','parser.py',578),
+  ('jump_statement -> RETURN expression SEMI','jump_statement',3,'p_jump_statement2','parser.py',583),
+  ('jump_statement -> RETURN SEMI','jump_statement',2,'p_jump_statement_3','parser.py',588),
+  ('parameter_list -> parameter_declaration','parameter_list',1,'p_parameter_list_1','parser.py',593),
+  ('parameter_list -> parameter_list COMMA parameter_declaration','parameter_list',3,'p_parameter_list_2','parser.py',598),
+  ('id_list_opt -> id_list','id_list_opt',1,'p_id_list_opt','parser.py',604),
+  ('id_list_opt -> empty','id_list_opt',1,'p_id_list_opt','parser.py',605),
+  ('id_list -> identifier','id_list',1,'p_id_list','parser.py',610),
+  ('id_list -> id_list identifier','id_list',2,'p_id_list','parser.py',611),
+  ('parameter_declaration -> type_specifier declarator','parameter_declaration',2,'p_parameter_declaration','parser.py',619),
+  ('compound_statement -> LBRACE block_item_list_opt RBRACE','compound_statement',3,'p_compound_statement','parser.py',626),
+  ('compound_statement -> LBRACE error RBRACE','compound_statement',3,'p_compound_statement_error','parser.py',631),
+  ('compound_statement -> LBRACE block_item_list error RBRACE','compound_statement',4,'p_compound_statement_error','parser.py',632),
+  ('expression_statement -> expression_opt SEMI','expression_statement',2,'p_expression_statement','parser.py',637),
+  ('expression_opt -> expression','expression_opt',1,'p_expression_opt','parser.py',645),
+  ('expression_opt -> empty','expression_opt',1,'p_expression_opt','parser.py',646),
+  ('expression -> assignment_expression','expression',1,'p_expression_1','parser.py',651),
+  ('expression -> expression COMMA assignment_expression','expression',3,'p_expression_2','parser.py',657),
+  ('string_literal -> STRING','string_literal',1,'p_string_literal','parser.py',666),
+  ('pointer -> TIMES pointer','pointer',2,'p_pointer_1','parser.py',671),
+  ('pointer -> TIMES','pointer',1,'p_pointer_2','parser.py',680),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',685),
 ]
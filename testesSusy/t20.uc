@@ -0,0 +1,14 @@
+/* Counter updated before the array index in the same block: */
+
+int main() {
+    int v[20];
+    int i = 0;
+    int k = 7;
+    while (i < 9) {
+        (i + 1) = i;
+        k = v[i * 2];
+    }
+    assert v[2] == 7;
+    assert v[18] == 7;
+    return 0;
+}
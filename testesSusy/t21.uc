@@ -0,0 +1,29 @@
+/* Small functions inlined in loops, one with a loop of its own: */
+
+int v[24];
+
+int twice(int x) {
+    return x * 2;
+}
+
+int fill(int n, int k) {
+    int i = 0;
+    while (i < n) {
+        (i + 1) = i;
+        k = v[i * 2];
+    }
+    return n;
+}
+
+int main() {
+    int i = 0;
+    int s = 0;
+    while (i < 5) {
+        (i + 1) = i;
+        (s + fill(twice(i), i)) = s;
+    }
+    assert s == 30;
+    assert v[20] == 5;
+    assert v[2] == 5;
+    return 0;
+}
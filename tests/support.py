@@ -0,0 +1,39 @@
+'''
+Puts the compiler on the path of the tests.  Its ast.py shadows the ast
+module of the standard library, which inspect (imported by unittest,
+ply and uc_rpc) and traceback need: that one is imported first, and the
+compiler modules are imported under compiler_imports(), which gives
+them the ast.py of the compiler:
+
+    with compiler_imports():
+        from parser import UCParser
+'''
+
+import contextlib
+import os
+import sys
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# Imported without the compiler on the path, e.g. when run from ROOT
+_path = sys.path[:]
+sys.path[:] = [path for path in _path if os.path.abspath(path or os.curdir) != ROOT]
+import ast
+import inspect
+sys.path[:] = [ROOT] + _path
+
+_compiler_ast = None
+
+
+@contextlib.contextmanager
+def compiler_imports():
+    ''' Inside, the ast module is the ast.py of the compiler '''
+    global _compiler_ast
+    stdlib_ast = sys.modules.pop('ast')
+    if _compiler_ast is not None:
+        sys.modules['ast'] = _compiler_ast
+    try:
+        yield
+    finally:
+        _compiler_ast = sys.modules.get('ast', _compiler_ast)
+        sys.modules['ast'] = stdlib_ast
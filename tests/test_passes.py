@@ -0,0 +1,145 @@
+'''
+Tests of the optimizations of uc_analysis on testesSusy programs: each
+one must run as without optimizations, and pass verify(), under -O1,
+-O2 and each pass alone.  Some passes are also checked on the code they
+must leave alone or rewrite.
+
+    python -m unittest discover tests
+
+On Python 3.10 to 3.12, unittest itself doesn't start with the ast.py
+of the compiler in the current directory, so run them from tests:
+
+    cd tests && python -m unittest
+'''
+
+import contextlib
+import io
+import os
+import unittest
+
+from support import ROOT, compiler_imports
+
+with compiler_imports():
+    from parser import UCParser
+    from uc_analysis import PassManager, passes
+    from uc_block import CFG, split_functions
+    from uc_code import GenerateCode
+    from uc_interpreter import Interpreter
+    from uc_sema import Visitor
+
+# The programs compiled and run, covering:
+#   t10, t12  plain loops and a call inlined
+#   t14       a recursive function, never inlined in itself
+#   t20       an induction variable updated before the array index
+#   t21       calls inlined in a loop, one with a loop of its own
+PROGRAMS = ['t10', 't12', 't14', 't20', 't21']
+
+PIPELINES = ['O1', 'O2', 'licm,iv', 'inline,licm,iv'] + sorted(passes)
+
+
+def generate(name):
+    ''' Return the uCIR of the testesSusy program name '''
+    with open(os.path.join(ROOT, 'testesSusy', name + '.uc')) as source:
+        return compile_source(source.read())
+
+
+def compile_source(source):
+    ''' Return the uCIR of the uC code source '''
+    ast = UCParser().parse(source, '', False)
+    Visitor(False).visit(ast)
+    gen = GenerateCode()
+    gen.visit(ast)
+    return gen.text + gen.code
+
+
+def run(ircode):
+    ''' Return the output and the exit code of ircode '''
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        try:
+            Interpreter().run(ircode)
+            status = None
+        except SystemExit as e:
+            status = e.code
+    return out.getvalue(), status
+
+
+def loop_instructions(ircode):
+    ''' Return the instructions of the only loop of the only function of ircode '''
+    _, (code,) = split_functions(ircode)
+    cfg = CFG(code)
+    (loop,) = cfg.loops()
+    return [inst for block in cfg.blocks if block in loop.body for inst in block.instructions]
+
+
+class PassesTest(unittest.TestCase):
+
+    def test_programs(self):
+        for name in PROGRAMS:
+            ircode = generate(name)
+            expected = run(ircode)
+            for pipeline in PIPELINES:
+                with self.subTest(program=name, pipeline=pipeline):
+                    # verify() raises an AssertionError on broken IR
+                    optimized = PassManager(pipeline, verify=True).run(list(ircode))
+                    self.assertEqual(run(optimized), expected)
+
+    def test_licm_guarded_division(self):
+        # n / d only runs if d != 0: hoisted, it would divide by zero
+        ircode = compile_source('''
+            int main() {
+                int i = 0;
+                int n = 10;
+                int d = 0;
+                int s = 0;
+                while (i < 5) {
+                    if (d != 0) {
+                        (n / d) = s;
+                    }
+                    (i + 1) = i;
+                }
+                return s;
+            }
+        ''')
+        licm = PassManager('licm', verify=True)
+        optimized = licm.run(list(ircode))
+        self.assertGreater(licm.stats[0][4], 0)
+        self.assertIn('div_int', [inst[0] for inst in loop_instructions(optimized)])
+        self.assertEqual(run(optimized), run(ircode))
+
+    def test_iv_index(self):
+        # The index i * 2 of v becomes a register added 2 on every iteration,
+        # once licm has taken the step 1 and the factor 2 out of the loop
+        ircode = PassManager('licm', verify=True).run(generate('t20'))
+        self.assertIn('mul_int', [inst[0] for inst in loop_instructions(ircode)])
+        optimized = PassManager('iv', verify=True).run(list(ircode))
+        loop = loop_instructions(optimized)
+        (elem,) = [inst for inst in loop if inst[0].startswith('elem')]
+        index = [inst for inst in loop if elem[2] in inst[1:3]]
+        self.assertEqual([inst[0] for inst in index], ['add_int', 'elem_int'])
+        self.assertEqual(index[0][3], elem[2])
+        optimized = PassManager('dce', verify=True).run(optimized)
+        self.assertNotIn('mul_int', [inst[0] for inst in loop_instructions(optimized)])
+        self.assertEqual(run(optimized), run(ircode))
+
+    def test_dce_global_store(self):
+        # x + 1 is dead, but not the store to g, even if nothing reads it
+        ircode = compile_source('''
+            int g;
+
+            int main() {
+                int x = 3;
+                x + 1;
+                x = g;
+                return 0;
+            }
+        ''')
+        dce = PassManager('dce', verify=True)
+        optimized = dce.run(list(ircode))
+        self.assertGreater(dce.stats[0][4], 0)
+        self.assertIn('@g', [inst[2] for inst in optimized if inst[0] == 'store_int'])
+        self.assertEqual(run(optimized), run(ircode))
+
+
+if __name__ == '__main__':
+    unittest.main()
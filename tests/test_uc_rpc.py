@@ -0,0 +1,56 @@
+'''
+Tests of the JSON-RPC server loop of uc_rpc, fed from a string.
+
+    python -m unittest discover tests
+'''
+
+import io
+import json
+import unittest
+
+import support                  # Puts the compiler on the path
+from uc_rpc import INVALID_REQUEST, METHOD_NOT_FOUND, PARSE_ERROR, serve_stream
+
+
+def serve(*lines):
+    ''' Return the responses of serve_stream to lines and whether it was shut down '''
+    wfile = io.StringIO()
+    done = serve_stream(io.StringIO(''.join(line + '\n' for line in lines)), wfile,
+                        {'echo': lambda text: text})
+    return [json.loads(line) for line in wfile.getvalue().splitlines()], done
+
+
+class ServeStreamTest(unittest.TestCase):
+
+    def test_request(self):
+        responses, done = serve('{"jsonrpc": "2.0", "id": 1, "method": "echo", "params": {"text": "a"}}')
+        self.assertEqual(responses, [{'jsonrpc': '2.0', 'id': 1, 'result': 'a'}])
+        self.assertFalse(done)
+
+    def test_notification(self):
+        responses, _ = serve('{"jsonrpc": "2.0", "method": "echo", "params": {"text": "a"}}')
+        self.assertEqual(responses, [])
+
+    def test_not_an_object(self):
+        # Answered as invalid, and the requests after them still are
+        responses, _ = serve('5', '"id"', '[1, 2]', 'null',
+                             '{"jsonrpc": "2.0", "id": 2, "method": "echo", "params": {"text": "b"}}')
+        self.assertEqual([response.get('error', {}).get('code') for response in responses],
+                         [INVALID_REQUEST] * 4 + [None])
+        self.assertEqual([response['id'] for response in responses], [None] * 4 + [2])
+        self.assertEqual(responses[-1]['result'], 'b')
+
+    def test_errors(self):
+        responses, _ = serve('{"jsonrpc": "2.0", "id": 3, "method": "nope"}', '{')
+        self.assertEqual([(response['id'], response['error']['code']) for response in responses],
+                         [(3, METHOD_NOT_FOUND), (None, PARSE_ERROR)])
+
+    def test_shutdown(self):
+        responses, done = serve('{"jsonrpc": "2.0", "id": 4, "method": "shutdown"}',
+                                '{"jsonrpc": "2.0", "id": 5, "method": "echo", "params": {"text": "c"}}')
+        self.assertEqual(responses, [{'jsonrpc': '2.0', 'id': 4, 'result': None}])
+        self.assertTrue(done)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,1007 @@
+'''
+Optimizations over the uC intermediate representation.
+
+Every optimization is a class with a run() method that takes a whole
+uCIR program (the list of tuples built by GenerateCode) and returns the
+optimized program, in the same format, so that they can be chained and
+the result handed to the Interpreter or written to the .ir file.
+'''
+
+import time
+from itertools import count
+
+from uc_block import *
+
+
+class Optimization(object):
+    '''
+    Base class of the optimizations.  By default, run() transforms each
+    function independently through optimize_function(), which subclasses
+    must implement.  The number of changes performed is kept in
+    self.changes.
+    '''
+    name = None
+
+    def __init__(self):
+        self.changes = 0
+
+    def run(self, ircode):
+        text, functions = split_functions(ircode)
+        return join_functions(text, [self.optimize_function(code) for code in functions])
+
+    def optimize_function(self, code):
+        raise NotImplementedError
+
+
+def count_defs(cfg):
+    ''' Map each register to the number of instructions writing to it '''
+    defs = {}
+    for inst in cfg.instructions():
+        for target in get_defs(inst):
+            defs[target] = defs.get(target, 0) + 1
+    return defs
+
+
+class LoopInvariantCodeMotion(Optimization):
+    '''
+    Move computations whose value does not change between the iterations
+    of a loop into a preheader block, executed once before the loop.
+    Loops are handled from the innermost to the outermost, so a value
+    hoisted out of an inner loop may be hoisted again out of the outer one.
+    '''
+    name = 'licm'
+
+    # Operations without side effects that can't fail when executed
+    # speculatively, i.e., even if the loop would not execute them.
+    speculable = {'literal', 'add', 'sub', 'mul', 'lt', 'le', 'gt', 'ge', 'eq', 'ne',
+                  'and', 'or', 'not', 'sitofp', 'fptosi', 'elem', 'get'}
+
+    def optimize_function(self, code):
+        done = set()
+        while True:
+            cfg = CFG(code)
+            dom = cfg.dominators()
+            loops = [loop for loop in cfg.loops(dom) if loop.header.label not in done]
+            if not loops:
+                return code
+            # innermost loops first
+            loop = min(loops, key=lambda l: len(l.body))
+            done.add(loop.header.label)
+            hoisted = self._invariants(cfg, loop, dom)
+            if hoisted:
+                self._hoist(cfg, loop, hoisted)
+                self.changes += len(hoisted)
+                code = cfg.code()
+
+    def _invariants(self, cfg, loop, dom):
+        ''' Return the invariant instructions of loop, in a valid execution order '''
+        defs = count_defs(cfg)
+        body = [b for b in cfg.blocks if b in loop.body]
+        written = set()
+        clobbers = False
+        for block in body:
+            for inst in block.instructions:
+                written.update(get_defs(inst))
+                if inst[0] == 'call' or (inst[0].startswith('store') and is_deref(inst[0])):
+                    clobbers = True
+        # Locals whose address is taken may be written through pointers
+        escaped = {inst[1] for inst in cfg.instructions() if inst[0].startswith('get')}
+        exits = loop.exits()
+
+        invariant = []
+        invariant_defs = set()
+        marked = set()
+        changed = True
+        while changed:
+            changed = False
+            for block in body:
+                for index, inst in enumerate(block.instructions):
+                    if (block, index) in marked or not self._is_candidate(inst, block, exits, dom):
+                        continue
+                    target = get_defs(inst)[0]
+                    if defs.get(target) != 1:
+                        continue
+                    if inst[0].startswith('load'):
+                        source = inst[1]
+                        if clobbers and (source.startswith('@') or source in escaped):
+                            continue
+                    if all(u not in written or u in invariant_defs for u in get_uses(inst)):
+                        invariant.append((block, index))
+                        invariant_defs.add(target)
+                        marked.add((block, index))
+                        changed = True
+        return invariant
+
+    def _is_candidate(self, inst, block, exits, dom):
+        if is_label(inst):
+            return False
+        op, _, modifiers = split_opcode(inst[0])
+        if op in self.speculable:
+            return True
+        if op == 'load':
+            # scalar loads only: no arrays and no pointers
+            return not modifiers
+        if op in {'div', 'mod'}:
+            # may fail (division by zero), so it must be executed on every
+            # iteration anyway, i.e., dominate all the exits of the loop.
+            return bool(exits) and all(block in dom[e] for e in exits)
+        return False
+
+    def _hoist(self, cfg, loop, positions):
+        hoisted = [block.instructions[index] for block, index in positions]
+        positions = set(positions)
+        for block in loop.body:
+            block.instructions = [inst for index, inst in enumerate(block.instructions)
+                                  if (block, index) not in positions]
+        cfg.preheader(loop).append(hoisted)
+
+
+class InductionVariables(Optimization):
+    '''
+    Strength reduction of array indexing.  A basic induction variable is a
+    variable updated once per iteration as 'v = v + step', with a loop
+    invariant step.  An array index computed in the loop as an affine
+    function of v involving a multiplication (e.g., 'i * 10 + j' when
+    lowering a[i][j]) is replaced by a new register, initialized in the
+    preheader and incremented right after v is updated.
+
+    After that, element addresses computed twice inside a block from the
+    same array and index (reads and writes of a[i][j] in 'a[i][j] += 1')
+    are computed only once.
+    '''
+    name = 'iv'
+
+    def optimize_function(self, code):
+        done = set()
+        while True:
+            cfg = CFG(code)
+            dom = cfg.dominators()
+            loops = [loop for loop in cfg.loops(dom) if loop.header.label not in done]
+            if not loops:
+                break
+            loop = min(loops, key=lambda l: len(l.body))
+            done.add(loop.header.label)
+            self._reduce(cfg, loop)
+            code = cfg.code()
+        cfg = CFG(code)
+        self._share_addresses(cfg)
+        return cfg.code()
+
+    def _basic_ivs(self, cfg, loop, body, loop_defs):
+        ''' Map each basic induction variable of loop to its update '''
+        escaped = {inst[1] for inst in cfg.instructions() if inst[0].startswith('get')}
+        ivs = {}
+        for block in body:
+            for index, inst in enumerate(block.instructions):
+                if inst[0] != 'store_int' or inst[2].startswith('@') or inst[2] in escaped:
+                    continue
+                var = inst[2]
+                if loop_defs.get(var) != 1 or inst[1] not in loop_defs.get(None, {}):
+                    continue
+                update = loop_defs[None][inst[1]]
+                if update[0] not in {'add_int', 'sub_int'}:
+                    continue
+                for value, step in ((update[1], update[2]), (update[2], update[1])):
+                    source = loop_defs[None].get(value)
+                    if source == ('load_int', var, value) and step not in loop_defs:
+                        ivs[var] = (block, index, update[0], step)
+                        break
+                    if update[0] == 'sub_int':
+                        break
+        return ivs
+
+    def _affine(self, name, block, end, ivs, loop_defs):
+        '''
+        If name is computed in block, before position end, as an affine
+        function of a basic induction variable, return the variable, the
+        instructions computing name and the loop invariant factors of the
+        variable.  Return None otherwise.
+        '''
+        chain = []
+        factors = []
+        for index in range(end - 1, -1, -1):
+            inst = block.instructions[index]
+            if name not in get_defs(inst):
+                continue
+            op, _, modifiers = split_opcode(inst[0])
+            if inst[0] == 'load_int' and inst[1] in ivs:
+                var = inst[1]
+                # v must not be updated between the load and its use
+                for later in block.instructions[index:end]:
+                    if var in get_defs(later):
+                        return None
+                chain.append(inst)
+                chain.reverse()
+                return var, chain, factors
+            if op not in {'add', 'sub', 'mul'} or modifiers:
+                return None
+            left, right = inst[1], inst[2]
+            if left in loop_defs and right not in loop_defs:
+                name, invariant = left, right
+            elif right in loop_defs and left not in loop_defs and op != 'sub':
+                name, invariant = right, left
+            else:
+                return None
+            if op == 'mul':
+                factors.append(invariant)
+            chain.append(inst)
+        return None
+
+    def _reduce(self, cfg, loop):
+        body = [b for b in cfg.blocks if b in loop.body]
+        defs = count_defs(cfg)
+        loop_defs = {None: {}}
+        for block in body:
+            for inst in block.instructions:
+                for target in get_defs(inst):
+                    loop_defs[target] = loop_defs.get(target, 0) + 1
+                    if defs[target] == 1:
+                        loop_defs[None][target] = inst
+        ivs = self._basic_ivs(cfg, loop, body, loop_defs)
+        if not ivs:
+            return
+
+        # Constants are compared by value, as each use gets its own literal
+        literals = {}
+        for inst in cfg.instructions():
+            if inst[0].startswith('literal') and defs[inst[2]] == 1:
+                literals[inst[2]] = inst[:2]
+
+        reduced = {}
+        increments = []
+        for block in body:
+            for index, inst in enumerate(block.instructions):
+                if not inst[0].startswith('elem'):
+                    continue
+                affine = self._affine(inst[2], block, index, ivs, loop_defs)
+                if affine is None or len(affine[1]) < 2:
+                    continue
+                key = self._chain_key(affine[1], literals)
+                if key not in reduced:
+                    reduced[key], delta = self._new_iv(cfg, loop, ivs, *affine)
+                    increments.append((affine[0], reduced[key], delta))
+                block.instructions[index] = (inst[0], inst[1], reduced[key], inst[3])
+                self.changes += 1
+
+        # The increments go in only now, not to move the instructions of the
+        # blocks while they are rewritten
+        for var, register, delta in increments:
+            self._increment(loop, ivs[var][2], var, register, delta)
+
+    def _chain_key(self, chain, literals):
+        ''' Return a key telling apart the chains computing different values '''
+        targets = {get_defs(inst)[0] for inst in chain}
+        key = [chain[0][:2]]
+        for inst in chain[1:]:
+            key.append((inst[0],) + tuple(None if arg in targets else literals.get(arg, arg)
+                                          for arg in inst[1:3]))
+        return tuple(key)
+
+    def _new_iv(self, cfg, loop, ivs, var, chain, factors):
+        '''
+        Create the register replacing chain, initialized in the preheader,
+        and return its name and its increment
+        '''
+        step = ivs[var][3]
+        register = cfg.new_temp()
+        # Initial value: the whole chain, evaluated before the loop
+        init = []
+        rename = {}
+        for inst in chain:
+            target = get_defs(inst)[0]
+            rename[target] = register if inst is chain[-1] else cfg.new_temp()
+            inst = rename_uses(inst, rename)
+            init.append(inst[:-1] + (rename[target],))
+        # Increment: step times the product of the factors
+        delta = step
+        for factor in factors:
+            product = cfg.new_temp()
+            init.append(('mul_int', delta, factor, product))
+            delta = product
+        cfg.preheader(loop).append(init)
+        return register, delta
+
+    def _increment(self, loop, update, var, register, delta):
+        ''' Add delta to register right after the update of var '''
+        for block in loop.body:
+            for index, inst in enumerate(block.instructions):
+                if inst[0] == 'store_int' and inst[2] == var:
+                    block.instructions.insert(index + 1, (update, register, delta, register))
+                    return
+
+    def _share_addresses(self, cfg):
+        defs = count_defs(cfg)
+        rename = {}
+        for block in cfg.blocks:
+            available = {}
+            instructions = []
+            for inst in block.instructions:
+                inst = rename_uses(inst, rename)
+                if inst[0].startswith('elem') and defs.get(inst[3]) == 1:
+                    key = inst[:3]
+                    if key in available:
+                        rename[inst[3]] = available[key]
+                        self.changes += 1
+                        continue
+                for target in get_defs(inst):
+                    for key in [k for k in available if target in k[1:]]:
+                        del available[key]
+                if inst[0].startswith('elem') and defs.get(inst[3]) == 1:
+                    available[inst[:3]] = inst[3]
+                instructions.append(inst)
+            block.instructions = instructions
+        for block in cfg.blocks:
+            block.instructions = [rename_uses(inst, rename) for inst in block.instructions]
+
+
+class ValueNumbering(Optimization):
+    '''
+    Common subexpression elimination.  Inside each basic block, every value
+    gets a number, and an instruction computing a value already held by a
+    register (the same arithmetic over the same values, a load from a
+    variable whose value is known, the same element address...) is removed
+    and its result replaced by that register.  With global_cse, pure
+    computations are also reused in the blocks dominated by the one that
+    computed them first.  self.changes counts the instructions removed.
+    '''
+    name = 'cse'
+
+    pure = {'literal', 'add', 'sub', 'mul', 'div', 'mod', 'lt', 'le', 'gt', 'ge', 'eq', 'ne',
+            'and', 'or', 'not', 'sitofp', 'fptosi', 'elem'}
+    commutative = {'add', 'mul', 'eq', 'ne', 'and', 'or'}
+
+    def __init__(self, global_cse=True):
+        super(ValueNumbering, self).__init__()
+        self.global_cse = global_cse
+
+    def optimize_function(self, code):
+        cfg = CFG(code)
+        self.defs = count_defs(cfg)
+        self.escaped = {inst[1] for inst in cfg.instructions() if inst[0].startswith('get')}
+        self.stored = {inst[2] for inst in cfg.instructions() if inst[0].startswith('store')}
+        self.rename = {}
+        for block in cfg.blocks:
+            self._local(block)
+        if self.global_cse:
+            self._global(cfg)
+        for block in cfg.blocks:
+            block.instructions = [rename_uses(inst, self.rename) for inst in block.instructions]
+        return cfg.code()
+
+    def _stable(self, register):
+        ''' True if register always holds the same value once written '''
+        if register.startswith('@') or register in self.stored:
+            return False
+        return self.defs.get(register, 0) <= 1
+
+    def _key(self, inst, values):
+        ''' Return the key identifying the value computed by inst '''
+        op = split_opcode(inst[0])[0]
+        if op == 'literal':
+            return inst[:2]
+        operands = [values(arg) for arg in get_uses(inst)]
+        if op in self.commutative:
+            operands.sort()
+        return (inst[0],) + tuple(operands)
+
+    def _replace(self, target, register):
+        self.rename[target] = self.rename.get(register, register)
+        self.changes += 1
+
+    def _local(self, block):
+        numbers = {}                # register -> value number
+        holders = {}                # value number -> stable register holding it
+        expressions = {}            # key -> value number
+        new_number = count()
+
+        def number(register):
+            if register not in numbers:
+                numbers[register] = next(new_number)
+                if self._stable(register):
+                    holders[numbers[register]] = register
+            return numbers[register]
+
+        def define(register, value):
+            numbers[register] = value
+            if value not in holders and self._stable(register):
+                holders[value] = register
+
+        instructions = []
+        for inst in block.instructions:
+            inst = rename_uses(inst, self.rename)
+            op, _, modifiers = split_opcode(inst[0])
+            if op in self.pure or (op == 'load' and not modifiers):
+                target = get_defs(inst)[0]
+                if op == 'load':
+                    value = number(inst[1])
+                else:
+                    key = self._key(inst, number)
+                    if key not in expressions:
+                        expressions[key] = next(new_number)
+                    value = expressions[key]
+                if value in holders and self.defs.get(target) == 1:
+                    self._replace(target, holders[value])
+                    numbers[target] = value
+                    continue
+                define(target, value)
+            elif op == 'store' and not modifiers:
+                define(inst[2], number(inst[1]))
+            else:
+                if inst[0] == 'call' or (op == 'store' and '*' in modifiers):
+                    # memory may have been written through a pointer
+                    for register in [r for r in numbers if r.startswith('@') or r in self.escaped]:
+                        del numbers[register]
+                for target in get_defs(inst):
+                    numbers.pop(target, None)
+                    number(target)
+            instructions.append(inst)
+        block.instructions = instructions
+
+    def _global(self, cfg):
+        dom = cfg.dominators()
+        children = {block: [] for block in dom}
+        for block, dominators in dom.items():
+            if block is not cfg.entry():
+                idom = max((d for d in dominators if d is not block), key=lambda d: len(dom[d]))
+                children[idom].append(block)
+
+        stack = [(cfg.entry(), {})]
+        while stack:
+            block, available = stack.pop()
+            available = dict(available)
+            instructions = []
+            for inst in block.instructions:
+                inst = rename_uses(inst, self.rename)
+                if split_opcode(inst[0])[0] in self.pure:
+                    target = get_defs(inst)[0]
+                    if self.defs.get(target) == 1 and all(self._stable(u) for u in get_uses(inst)):
+                        key = self._key(inst, lambda register: register)
+                        if key in available:
+                            self._replace(target, available[key])
+                            continue
+                        available[key] = target
+                instructions.append(inst)
+            block.instructions = instructions
+            for child in children[block]:
+                stack.append((child, available))
+
+
+class DeadCodeElimination(Optimization):
+    '''
+    Remove the instructions without side effects whose results are never
+    used, e.g., the index computations left behind by InductionVariables.
+    '''
+    name = 'dce'
+
+    pure = LoopInvariantCodeMotion.speculable | {'load'}
+
+    def optimize_function(self, code):
+        cfg = CFG(code)
+        defs = count_defs(cfg)
+        changed = True
+        while changed:
+            changed = False
+            used = set()
+            for inst in cfg.instructions():
+                used.update(get_uses(inst))
+            for block in cfg.blocks:
+                instructions = []
+                for inst in block.instructions:
+                    targets = get_defs(inst)
+                    if (targets and split_opcode(inst[0])[0] in self.pure
+                            and defs.get(targets[0]) == 1 and targets[0] not in used):
+                        self.changes += 1
+                        changed = True
+                        continue
+                    instructions.append(inst)
+                block.instructions = instructions
+        return cfg.code()
+
+
+class Inliner(Optimization):
+    '''
+    Replace the calls to small, non recursive, functions by a copy of their
+    bodies.  The parameters of the callee (%0, %1, ...) become the
+    registers passed by the caller, its return register gets a fresh name
+    initialized with 0 (as Interpreter._push does) and every return_*
+    stores the returned value in the target of the call and jumps to the
+    end of the inlined code.  Functions are handled bottom-up in the call
+    graph, so a callee is inlined with its own calls already inlined.
+    '''
+    name = 'inline'
+
+    def __init__(self, threshold=40):
+        super(Inliner, self).__init__()
+        self.threshold = threshold      # Maximum size of an inlined function
+
+    def run(self, ircode):
+        text, functions = split_functions(ircode)
+        self.codes = {code[0][1]: code for code in functions}
+        graph = call_graph(functions)
+        self.arity = self._arity(functions)
+
+        # Post order of the call graph: callees before their callers
+        order = []
+        visited = set()
+        for root in graph:
+            stack = [(root, iter(graph[root]))]
+            visited.add(root)
+            while stack:
+                fname, callees = stack[-1]
+                callee = next(callees, None)
+                if callee is None:
+                    order.append(fname)
+                    stack.pop()
+                elif callee in graph and callee not in visited:
+                    visited.add(callee)
+                    stack.append((callee, iter(graph[callee])))
+
+        self.recursive = set()
+        for fname in graph:
+            seen = set()
+            stack = list(graph[fname])
+            while stack:
+                callee = stack.pop()
+                if callee == fname:
+                    self.recursive.add(fname)
+                    break
+                if callee in graph and callee not in seen:
+                    seen.add(callee)
+                    stack.extend(graph[callee])
+
+        for fname in order:
+            self.codes[fname] = self._inline_calls(self.codes[fname])
+        return join_functions(text, [self.codes[code[0][1]] for code in functions])
+
+    def _arity(self, functions):
+        ''' Map each function to the number of arguments of its calls, or None if it varies '''
+        arity = {}
+        for code in functions:
+            params = 0
+            for inst in code:
+                if inst[0] == 'call' and inst[1].startswith('@'):
+                    if arity.setdefault(inst[1], params) != params:
+                        arity[inst[1]] = None
+                if inst[0].startswith('param'):
+                    params += 1
+                elif inst[0] != 'call' or inst[1].startswith('@'):
+                    params = 0
+        return arity
+
+    def _inlinable(self, fname, callee):
+        if callee not in self.codes or callee == '@main' or callee == fname:
+            return False
+        if callee in self.recursive or self.arity.get(callee) is None:
+            return False
+        code = self.codes[callee]
+        size = 0
+        params = {'%' + str(i) for i in range(self.arity[callee])}
+        for inst in code[1:]:
+            if not is_label(inst):
+                size += 1
+            op, _, modifiers = split_opcode(inst[0])
+            # arrays would be allocated again on every inlined call
+            if op == 'alloc' and modifiers:
+                return False
+            if params.intersection(get_defs(inst)):
+                return False
+        return size <= self.threshold
+
+    def _inline_calls(self, code):
+        fname = code[0][1]
+        self.last = last_name(code)
+        defs = {}
+        used = set()
+        for inst in code:
+            used.update(get_uses(inst))
+            for target in get_defs(inst):
+                defs[target] = defs.get(target, 0) + 1
+        escaped = {inst[1] for inst in code if inst[0].startswith('get')}
+        self.stable = {r for r, n in defs.items() if n == 1 and r not in escaped}
+
+        new_code = []
+        for inst in code:
+            if inst[0] == 'call' and self._inlinable(fname, inst[1]):
+                callee = self.codes[inst[1]]
+                void = any(i[0] == 'return_void' for i in callee)
+                if not void or inst[2] not in used:
+                    args = []
+                    for _ in range(self.arity[inst[1]]):
+                        args.insert(0, new_code.pop())
+                    new_code.extend(self._expand(callee, args, inst[2], void))
+                    self.changes += 1
+                    continue
+            new_code.append(inst)
+        return new_code
+
+    def _new_name(self):
+        self.last += 1
+        return str(self.last)
+
+    def _expand(self, callee, args, target, void):
+        ''' Return the body of callee, renamed to be placed in the caller '''
+        body = []
+        mapping = {}
+        for i, param in enumerate(args):
+            if param[1] in self.stable:
+                mapping['%' + str(i)] = param[1]
+            else:
+                # the argument may change in the callee, so copy its value
+                copy = '%' + self._new_name()
+                body.append(('load_' + split_opcode(param[0])[1], param[1], copy))
+                mapping['%' + str(i)] = copy
+        returned = '%' + str(len(args))
+        if not void:
+            mapping[returned] = '%' + self._new_name()
+            body.append(('literal_int', 0, mapping[returned]))
+        end = self._new_name()
+
+        def rename(arg):
+            if arg not in mapping:
+                mapping[arg] = '%' + self._new_name()
+            return mapping[arg]
+
+        for i, inst in enumerate(callee[1:], 1):
+            if is_label(inst):
+                body.append((rename('%' + inst[0])[1:],))
+                continue
+            op, typename, _ = split_opcode(inst[0])
+            if op == 'return':
+                if len(inst) > 1:
+                    body.append(('load_' + typename, rename(inst[1]), target))
+                if i < len(callee) - 1:
+                    body.append(('jump', '%' + end))
+                continue
+            start = 2 if op == 'literal' else 1
+            body.append(inst[:start] + tuple(rename(arg) if is_name(arg) else arg
+                                             for arg in inst[start:]))
+        body.append((end,))
+        return body
+
+
+class TailCalls(Optimization):
+    '''
+    Turn self recursive tail calls into loops.  A call of a function to
+    itself whose result is just stored in the return register before
+    jumping to the return label:
+
+        param_int %7
+        call @f %8
+        store_int %8 %1
+        jump %2
+
+    is replaced by stores of the arguments in the local variables holding
+    the parameters and a jump back to the code following the stores of
+    the parameters (%0, %1...) in these variables, at the beginning of
+    the function.  Deep recursions then run without growing the
+    interpreter stacks.
+    '''
+    name = 'tailcall'
+
+    def optimize_function(self, code):
+        fname = code[0][1]
+        if fname == '@main':
+            return code
+        cfg = CFG(code)
+        uses = {}
+        for inst in cfg.instructions():
+            for register in get_uses(inst):
+                uses[register] = uses.get(register, 0) + 1
+        start = None
+        for block in cfg.blocks:
+            tail = self._tail_call(cfg, block, fname, uses)
+            if tail is None:
+                continue
+            index, args, void = tail
+            if start is None:
+                start = self._split_entry(cfg, len(args))
+                if start is None:
+                    return code
+                start, params = start
+            if len(params) != len(args):
+                return code
+            copies = []
+            if set(params).intersection(arg for _, arg in args):
+                # the arguments read the parameters: copy them all first
+                staged = []
+                for opcode, arg in args:
+                    temp = cfg.new_temp()
+                    copies.append(('load_' + split_opcode(opcode)[1], arg, temp))
+                    staged.append((opcode, temp))
+                args = staged
+            for (opcode, arg), param in zip(args, params):
+                copies.append(('store_' + split_opcode(opcode)[1], arg, param))
+            if not void:
+                # the return register starts with 0 in a new activation
+                copies.append(('literal_int', 0, '%' + str(len(args))))
+            copies.append(('jump', '%' + start.label))
+            block.instructions[index - len(args):] = copies
+            self.changes += 1
+        return cfg.code()
+
+    def _tail_call(self, cfg, block, fname, uses):
+        '''
+        If block ends with a tail call to fname, return the position of the
+        call, its arguments (the param instructions) and whether the
+        function returns void.  Return None otherwise.
+        '''
+        insts = block.instructions
+        for index, inst in enumerate(insts):
+            if inst[0] == 'call' and inst[1] == fname:
+                break
+        else:
+            return None
+        args = []
+        while index - len(args) > 0 and insts[index - len(args) - 1][0].startswith('param'):
+            args.insert(0, insts[index - len(args) - 1])
+        result = insts[index][2]
+        returned = '%' + str(len(args))
+        rest = insts[index + 1:]
+
+        term = block.terminator()
+        if term is not None and term[0] == 'jump':
+            rest = rest[:-1]
+            target = cfg.label_map[term[1][1:]]
+        elif term is None and cfg.blocks.index(block) + 1 < len(cfg.blocks):
+            target = cfg.blocks[cfg.blocks.index(block) + 1]
+        else:
+            return None
+
+        ret = target.instructions
+        if ret == [('return_void',)]:
+            if rest or uses.get(result):
+                return None
+            return index, args, True
+        if (len(rest) == 1 and rest[0][0].startswith('store') and rest[0][1:] == (result, returned)
+                and uses.get(result) == 1 and len(ret) == 2 and ret[0][0].startswith('load')
+                and ret[0][1] == returned and ret[1][0].startswith('return') and ret[1][1:] == ret[0][2:]):
+            return index, args, False
+        return None
+
+    def _split_entry(self, cfg, nparams):
+        '''
+        Add a label after the stores of the parameters in their variables,
+        at the beginning of the function, and return its block together
+        with these variables, or None if they are not found.
+        '''
+        entry = cfg.entry()
+        insts = entry.instructions
+        index = 1
+        while index < len(insts) and insts[index][0].startswith('alloc'):
+            index += 1
+        params = []
+        for i in range(nparams):
+            if (index + i >= len(insts) or not insts[index + i][0].startswith('store')
+                    or insts[index + i][1] != '%' + str(i)):
+                return None
+            params.append(insts[index + i][2])
+        start = Block(cfg.new_label())
+        start.instructions = insts[index + nparams:]
+        entry.instructions = insts[:index + nparams]
+        cfg.blocks.insert(1, start)
+        cfg.label_map[start.label] = start
+        cfg.link()
+        return start, params
+
+
+class DeadFunctionElimination(Optimization):
+    '''
+    Drop the functions that can't be reached from @main, either called
+    directly or through a function pointer, and the globals (variables and
+    string constants) only used by them or not used at all.
+    '''
+    name = 'dfe'
+
+    def run(self, ircode):
+        text, functions = split_functions(ircode)
+        defined = {code[0][1]: code for code in functions}
+        if '@main' not in defined:
+            return ircode
+        live = {'@main'}
+        used = set()
+        stack = ['@main']
+        while stack:
+            for inst in defined[stack.pop()]:
+                for name in global_refs(inst):
+                    used.add(name)
+                    if name in defined and name not in live:
+                        live.add(name)
+                        stack.append(name)
+        code = [inst for inst in text if inst[1] in used]
+        functions = [c for c in functions if c[0][1] in live]
+        self.changes += len(text) - len(code) + len(defined) - len(functions)
+        return join_functions(code, functions)
+
+
+class SimplifyCFG(Optimization):
+    '''
+    Clean up the control flow left by the lowering of if, while, for and
+    assert, and by the other optimizations:
+
+      - jumps (and branches) to a block that only jumps elsewhere go
+        straight to the final target;
+      - unreachable blocks are deleted;
+      - jumps to the next instruction are deleted, and so are the labels
+        nobody jumps to, merging straight-line blocks;
+      - a block only reached through a jump is moved in place of the jump;
+      - a cbranch on a negated condition branches on the condition itself,
+        with its targets swapped, and a cbranch with equal targets becomes
+        a jump.
+
+    Labels reached by falling through them cost a dispatch in the
+    interpreter, while jumps skip them, so all of these reduce the number
+    of instructions executed.
+
+    The blocks are not laid out again otherwise: a cbranch always jumps,
+    to either target, and a label reached by a jump costs nothing, so
+    placing the likely successor after it would save no dispatch.  Moving
+    the target of a jump after it only saves one when its label goes
+    away too, which is the move above.
+    '''
+    name = 'simplify'
+
+    def optimize_function(self, code):
+        while True:
+            cfg = CFG(code)
+            changes = self.changes
+            self._thread(cfg)
+            self._invert(cfg)
+            self._remove_unreachable(cfg)
+            self._merge(cfg)
+            code = cfg.code()
+            if self.changes == changes:
+                return code
+
+    def _forward(self, cfg, label):
+        ''' Follow the chain of blocks that just pass the control along '''
+        seen = set()
+        while label not in seen:
+            seen.add(label)
+            block = cfg.label_map[label]
+            if not block.instructions:
+                index = cfg.blocks.index(block) + 1
+                if index == len(cfg.blocks) or cfg.blocks[index].label is None:
+                    break
+                label = cfg.blocks[index].label
+            elif block.instructions[0][0] == 'jump':
+                label = block.instructions[0][1][1:]
+            else:
+                break
+        return label
+
+    def _thread(self, cfg):
+        for block in cfg.blocks:
+            term = block.terminator()
+            if term is None or term[0] not in {'jump', 'cbranch'}:
+                continue
+            new = term
+            for label in get_targets(term):
+                target = self._forward(cfg, label)
+                if target != label:
+                    new = retarget(new, label, target)
+            if new[0] == 'cbranch' and new[2] == new[3]:
+                new = ('jump', new[2])
+            if new != term:
+                block.instructions[-1] = new
+                self.changes += 1
+        cfg.link()
+
+    def _invert(self, cfg):
+        uses = {}
+        for inst in cfg.instructions():
+            for register in get_uses(inst):
+                uses[register] = uses.get(register, 0) + 1
+        defs = count_defs(cfg)
+        for block in cfg.blocks:
+            term = block.terminator()
+            if term is None or term[0] != 'cbranch' or len(block.instructions) < 2:
+                continue
+            negation = block.instructions[-2]
+            if (negation[0] == 'not_bool' and negation[2] == term[1]
+                    and uses[term[1]] == 1 and defs.get(term[1]) == 1):
+                block.instructions[-2:] = [('cbranch', negation[1], term[3], term[2])]
+                self.changes += 1
+
+    def _remove_unreachable(self, cfg):
+        reachable = cfg.reachable()
+        if len(reachable) < len(cfg.blocks):
+            for block in cfg.blocks:
+                if block not in reachable and block.label is not None:
+                    del cfg.label_map[block.label]
+            self.changes += len(cfg.blocks) - len(reachable)
+            cfg.blocks = [b for b in cfg.blocks if b in reachable]
+            cfg.link()
+
+    def _merge(self, cfg):
+        index = 1
+        while index < len(cfg.blocks):
+            prev, block = cfg.blocks[index - 1], cfg.blocks[index]
+            term = prev.terminator()
+            if term == ('jump', '%' + str(block.label)):
+                # jump to the next instruction
+                prev.instructions.pop()
+                self.changes += 1
+                cfg.link()
+            if block.predecessors == [prev] and prev.falls_through():
+                # the label is only reached falling through it
+                prev.instructions.extend(block.instructions)
+                del cfg.label_map[block.label]
+                del cfg.blocks[index]
+                self.changes += 1
+                cfg.link()
+                continue
+            if term is not None and term[0] == 'jump':
+                target = cfg.label_map[term[1][1:]]
+                after = cfg.blocks.index(target) + 1
+                if (target.predecessors == [prev] and target is not prev
+                        and (not target.falls_through() or after < len(cfg.blocks))):
+                    # move the target of the jump in its place
+                    prev.instructions.pop()
+                    prev.instructions.extend(target.instructions)
+                    if target.falls_through():
+                        prev.instructions.append(('jump', '%' + cfg.blocks[after].label))
+                    del cfg.label_map[target.label]
+                    cfg.blocks.remove(target)
+                    self.changes += 1
+                    cfg.link()
+                    continue
+            index += 1
+
+
+# Optimizations by name, as used by the pipelines below
+passes = {optimization.name: optimization
+          for optimization in (TailCalls, Inliner, DeadFunctionElimination, SimplifyCFG, ValueNumbering,
+                               LoopInvariantCodeMotion, InductionVariables, DeadCodeElimination)}
+
+# Predefined pipelines: -O0 does nothing, -O1 only runs the cheap
+# cleanups and -O2 runs everything.
+pipelines = {
+    'O0': [],
+    'O1': ['dfe', 'simplify', 'cse', 'dce', 'simplify'],
+    'O2': ['tailcall', 'inline', 'dfe', 'simplify', 'cse', 'licm', 'cse', 'iv', 'dce', 'simplify'],
+}
+
+
+class PassManager(object):
+    '''
+    Run a pipeline of optimizations over a program, keeping, for each pass,
+    the time it took, the number of instructions before and after it and
+    the number of changes it performed.
+
+    pipeline is the name of a predefined pipeline ('O0', 'O1', 'O2'), a
+    comma separated list of pass names, or a list of pass names and/or
+    Optimization instances.  With verify=True, the IR is checked after
+    every pass, so that a broken pass is caught right where it happens.
+    '''
+
+    def __init__(self, pipeline='O2', verify=False):
+        if isinstance(pipeline, str):
+            pipeline = pipelines[pipeline] if pipeline in pipelines else pipeline.split(',')
+        self.passes = []
+        for optimization in pipeline:
+            if isinstance(optimization, str):
+                if optimization not in passes:
+                    raise ValueError("Unknown optimization: %s" % optimization)
+                optimization = passes[optimization]()
+            self.passes.append(optimization)
+        self.verify = verify
+        self.stats = []             # (name, seconds, instructions before, after, changes)
+
+    def run(self, ircode):
+        if self.verify:
+            verify(ircode, "code generation")
+        for optimization in self.passes:
+            before = len(ircode)
+            start = time.perf_counter()
+            ircode = optimization.run(ircode)
+            elapsed = time.perf_counter() - start
+            self.stats.append((optimization.name, elapsed, before, len(ircode), optimization.changes))
+            if self.verify:
+                verify(ircode, optimization.name)
+        return ircode
+
+    def report(self, out):
+        ''' Write the statistics of the passes run so far to the file out '''
+        for name, elapsed, before, after, changes in self.stats:
+            out.write("  %-10s %8.2f ms  %6d -> %6d instructions  %4d change(s)\n"
+                      % (name, elapsed * 1000, before, after, changes))
@@ -0,0 +1,433 @@
+'''
+Basic blocks and control flow graphs for the uC intermediate representation.
+
+The uCIR produced by GenerateCode is a flat list of instruction tuples.
+A program starts with its global declarations (the .text section) and is
+followed by one sequence of instructions per function, each one starting
+with a ('define', '@name') instruction:
+
+     ('global_string', '@.str.0', 'hello')
+     ('define', '@main')
+     ('alloc_int', '%1')
+     ...
+     ('9',)                            <- label, referenced as '%9'
+     ('cbranch', '%14', '%10', '%11')
+     ...
+
+This module splits such a list into functions, each function into basic
+blocks, and offers the analyses (dominators, natural loops) the optimizer
+in uc_analysis.py is built upon.  Blocks are always turned back into the
+very same tuple format, so the interpreter never notices the difference.
+'''
+
+# Opcodes that finish a basic block
+terminators = {'jump', 'cbranch', 'return'}
+
+# Binary operations: (op, left, right, target)
+binary_ops = {'add', 'sub', 'mul', 'div', 'mod',
+              'lt', 'le', 'gt', 'ge', 'eq', 'ne', 'and', 'or'}
+
+# Unary operations: (op, source, target)
+unary_ops = {'not', 'sitofp', 'fptosi'}
+
+
+def split_opcode(opcode):
+    '''
+    Split an opcode like 'load_int_10_*' in its operation ('load'),
+    its type ('int') and its modifiers (['10', '*']), the same way
+    Interpreter._extract_operation does.
+    '''
+    _aux = opcode.split('_')
+    if _aux[0] in {'fptosi', 'sitofp', 'jump', 'cbranch', 'define', 'call'}:
+        return _aux[0], None, []
+    if len(_aux) == 1:
+        return _aux[0], None, []
+    return _aux[0], _aux[1], _aux[2:]
+
+
+def is_label(inst):
+    return inst[0].isdigit()
+
+
+def is_deref(opcode):
+    ''' True for load/store opcodes going through a pointer (e.g. store_int_*) '''
+    return opcode.endswith('_*')
+
+
+def def_positions(inst):
+    ''' Return the positions of the operands of inst it writes to '''
+    if is_label(inst):
+        return []
+    op, _, modifiers = split_opcode(inst[0])
+    if op in {'alloc', 'read'}:
+        return [1]
+    elif op in {'literal', 'load', 'get', 'call'} or op in unary_ops:
+        return [2]
+    elif op == 'store':
+        return [] if '*' in modifiers else [2]
+    elif op == 'elem' or op in binary_ops:
+        return [3]
+    return []
+
+
+def use_positions(inst):
+    ''' Return the positions of the operands of inst it reads from '''
+    if is_label(inst):
+        return []
+    op, _, modifiers = split_opcode(inst[0])
+    if op in {'load', 'get', 'param', 'cbranch'} or op in unary_ops:
+        return [1]
+    elif op == 'store':
+        return [1, 2] if '*' in modifiers else [1]
+    elif op == 'elem' or op in binary_ops:
+        return [1, 2]
+    elif op in {'print', 'return'}:
+        return [1] if len(inst) > 1 else []
+    elif op == 'call':
+        return [1] if inst[1].startswith('%') else []
+    return []
+
+
+def get_defs(inst):
+    ''' Return the list of registers (or globals) written by inst '''
+    return [inst[i] for i in def_positions(inst)]
+
+
+def get_uses(inst):
+    ''' Return the list of registers (or globals) read by inst '''
+    return [inst[i] for i in use_positions(inst)]
+
+
+def rename_uses(inst, mapping):
+    ''' Return inst with the registers it reads renamed according to mapping '''
+    positions = [i for i in use_positions(inst) if inst[i] in mapping]
+    if not positions:
+        return inst
+    inst = list(inst)
+    for i in positions:
+        inst[i] = mapping[inst[i]]
+    return tuple(inst)
+
+
+def get_targets(inst):
+    ''' Return the labels (without the '%') inst may jump to '''
+    if inst[0] == 'jump':
+        return [inst[1][1:]]
+    elif inst[0] == 'cbranch':
+        return [inst[2][1:], inst[3][1:]]
+    return []
+
+
+def retarget(inst, old, new):
+    ''' Return inst with every reference to label old replaced by new '''
+    if inst[0] not in {'jump', 'cbranch'}:
+        return inst
+    return tuple('%' + new if i > 0 and arg == '%' + old else arg
+                 for i, arg in enumerate(inst))
+
+
+def split_functions(ircode):
+    '''
+    Split a program in its global section (everything before the first
+    define) and a list with the code of each function.
+    '''
+    text = []
+    functions = []
+    for inst in ircode:
+        if inst[0] == 'define':
+            functions.append([inst])
+        elif functions:
+            functions[-1].append(inst)
+        else:
+            text.append(inst)
+    return text, functions
+
+
+def join_functions(text, functions):
+    ''' Inverse of split_functions '''
+    ircode = list(text)
+    for code in functions:
+        ircode.extend(code)
+    return ircode
+
+
+def call_graph(functions):
+    '''
+    Map the name of each function to the list of functions it calls
+    directly.  functions is a list with the code of each function.
+    '''
+    graph = {}
+    for code in functions:
+        callees = graph.setdefault(code[0][1], [])
+        for inst in code:
+            if inst[0] == 'call' and inst[1].startswith('@') and inst[1] not in callees:
+                callees.append(inst[1])
+    return graph
+
+
+def global_refs(inst):
+    '''
+    Return the globals (variables, strings and functions) inst refers to.
+    A function used as a value, e.g. assigned to a pointer, shows up as an
+    operand like any other global.
+    '''
+    if inst[0] == 'define' or inst[0].startswith(('global', 'literal')):
+        return []
+    return [arg for arg in inst[1:] if isinstance(arg, str) and arg.startswith('@')]
+
+
+def is_name(arg):
+    ''' True if arg names a temporary, a local variable or a label (e.g. '%12') '''
+    return isinstance(arg, str) and arg[:1] == '%' and arg[1:].isdigit()
+
+
+def last_name(code):
+    ''' Return the highest number used by a temporary or label in code '''
+    last = -1
+    for inst in code:
+        if is_label(inst):
+            last = max(last, int(inst[0]))
+        elif not inst[0].startswith('literal'):
+            for arg in inst[1:]:
+                if is_name(arg):
+                    last = max(last, int(arg[1:]))
+    return last
+
+
+class Block(object):
+    '''
+    A basic block: a maximal sequence of instructions that is only entered
+    through its first instruction and only left through its last one.
+    '''
+
+    def __init__(self, label=None):
+        self.label = label          # Label name without the '%' (None for the entry)
+        self.instructions = []      # Instructions in the block, excluding the label
+        self.predecessors = []      # Blocks that may jump or fall into this one
+        self.successors = []        # Blocks this one may jump or fall into
+
+    def __repr__(self):
+        return "Block(%s)" % self.label
+
+    def append(self, insts):
+        ''' Add insts at the end of the block, but before its terminator '''
+        if self.falls_through():
+            self.instructions.extend(insts)
+        else:
+            self.instructions[-1:-1] = insts
+
+    def terminator(self):
+        ''' Return the last instruction if it ends the block, None otherwise '''
+        if self.instructions:
+            op, _, _ = split_opcode(self.instructions[-1][0])
+            if op in terminators:
+                return self.instructions[-1]
+        return None
+
+    def falls_through(self):
+        return self.terminator() is None
+
+
+class Loop(object):
+    '''
+    A natural loop: a header that dominates every block of the body and at
+    least one back edge (latch -> header).
+    '''
+
+    def __init__(self, header, body):
+        self.header = header
+        self.body = body            # Set of blocks, including the header
+
+    def exits(self):
+        ''' Blocks inside the loop with a successor outside of it '''
+        return [b for b in self.body if any(s not in self.body for s in b.successors)]
+
+
+class CFG(object):
+    '''
+    Control flow graph of a single function.  Build it from the code of the
+    function (starting with its define) and get the, possibly transformed,
+    code back with code().
+    '''
+
+    def __init__(self, code):
+        self.fname = code[0][1]
+        self.blocks = []            # Blocks in layout (emission) order
+        self.label_map = {}         # label -> Block
+        self.last_name = None       # Last number used by a temporary or label
+        self._build(code)
+
+    def _build(self, code):
+        block = Block()
+        self.blocks.append(block)
+        for inst in code:
+            if is_label(inst):
+                block = Block(inst[0])
+                self.blocks.append(block)
+                self.label_map[block.label] = block
+            else:
+                if block.terminator() is not None:
+                    block = Block()
+                    self.blocks.append(block)
+                block.instructions.append(inst)
+        self.link()
+
+    def link(self):
+        ''' (Re)compute predecessors and successors from the instructions '''
+        for block in self.blocks:
+            block.predecessors = []
+            block.successors = []
+        for i, block in enumerate(self.blocks):
+            if block.falls_through():
+                if i + 1 < len(self.blocks):
+                    block.successors.append(self.blocks[i + 1])
+            else:
+                for label in get_targets(block.terminator()):
+                    target = self.label_map[label]
+                    if target not in block.successors:
+                        block.successors.append(target)
+            for succ in block.successors:
+                succ.predecessors.append(block)
+
+    def code(self):
+        ''' Emit the blocks back as a list of instruction tuples '''
+        code = []
+        for block in self.blocks:
+            if block.label is not None:
+                code.append((block.label,))
+            code.extend(block.instructions)
+        return code
+
+    def entry(self):
+        return self.blocks[0]
+
+    def reachable(self):
+        ''' Set of blocks reachable from the entry '''
+        seen = {self.entry()}
+        stack = [self.entry()]
+        while stack:
+            for succ in stack.pop().successors:
+                if succ not in seen:
+                    seen.add(succ)
+                    stack.append(succ)
+        return seen
+
+    def instructions(self):
+        for block in self.blocks:
+            for inst in block.instructions:
+                yield inst
+
+    def new_label(self):
+        ''' Return a fresh label name '''
+        if self.last_name is None:
+            self.last_name = last_name(self.code())
+        self.last_name += 1
+        return str(self.last_name)
+
+    def new_temp(self):
+        ''' Return a fresh temporary. Labels and temporaries share their names '''
+        return '%' + self.new_label()
+
+    def preheader(self, loop):
+        '''
+        Return a block that is executed exactly once before entering loop,
+        creating a new one just before the header if there isn't one.
+        '''
+        header = loop.header
+        outside = [p for p in header.predecessors if p not in loop.body]
+        if len(outside) == 1 and outside[0].successors == [header]:
+            return outside[0]
+
+        preheader = Block(self.new_label())
+        index = self.blocks.index(header)
+        prev = self.blocks[index - 1]
+        if prev in loop.body and prev.falls_through():
+            prev.instructions.append(('jump', '%' + header.label))
+        for pred in outside:
+            term = pred.terminator()
+            if term is not None:
+                pred.instructions[-1] = retarget(term, header.label, preheader.label)
+        self.blocks.insert(index, preheader)
+        self.label_map[preheader.label] = preheader
+        self.link()
+        return preheader
+
+    def dominators(self):
+        ''' Map each reachable block to the set of blocks that dominate it '''
+        reachable = self.reachable()
+        blocks = [b for b in self.blocks if b in reachable]
+        entry = self.entry()
+        dom = {b: set(blocks) for b in blocks}
+        dom[entry] = {entry}
+        changed = True
+        while changed:
+            changed = False
+            for block in blocks:
+                if block is entry:
+                    continue
+                preds = [dom[p] for p in block.predecessors if p in reachable]
+                new = set.intersection(*preds) if preds else set()
+                new.add(block)
+                if new != dom[block]:
+                    dom[block] = new
+                    changed = True
+        return dom
+
+    def loops(self, dom=None):
+        ''' Return the natural loops of the function, one per header '''
+        if dom is None:
+            dom = self.dominators()
+        loops = {}
+        for block in dom:
+            for succ in block.successors:
+                if succ in dom[block]:
+                    # block -> succ is a back edge
+                    body = loops.setdefault(succ, {succ})
+                    stack = [block]
+                    while stack:
+                        b = stack.pop()
+                        if b not in body:
+                            body.add(b)
+                            stack.extend(p for p in b.predecessors if p in dom)
+        return [Loop(header, body) for header, body in loops.items()]
+
+
+def verify(ircode, after=None):
+    '''
+    Check the structure of a uCIR program, failing with an AssertionError
+    (reported like any other compiler error) if it is malformed.  after
+    names the step that produced ircode, for the messages.
+    '''
+    where = " after %s" % after if after else ""
+    text, functions = split_functions(ircode)
+    names = set()
+    for inst in text:
+        assert inst[0].startswith('global'), f"Instruction {inst} outside of a function{where}"
+        names.add(inst[1])
+    for code in functions:
+        assert code[0][1] not in names, f"{code[0][1]} defined twice{where}"
+        names.add(code[0][1])
+
+    for code in functions:
+        fname = code[0][1]
+        labels = [inst[0] for inst in code if is_label(inst)]
+        assert len(labels) == len(set(labels)), f"Duplicated label in {fname}{where}"
+        labels = set('%' + label for label in labels)
+        defined = set()
+        used = set()
+        for inst in code[1:]:
+            assert inst[0] != 'define', f"Nested define in {fname}{where}"
+            for label in get_targets(inst):
+                assert '%' + label in labels, f"{inst} jumps to an undefined label in {fname}{where}"
+            for name in global_refs(inst):
+                assert name in names, f"{inst} refers to an undefined global in {fname}{where}"
+            defined.update(r for r in get_defs(inst) if is_name(r))
+            used.update(r for r in get_uses(inst) if is_name(r))
+        assert not (defined | used) & labels, f"Label used as a register in {fname}{where}"
+        # Registers read but never written can only be the parameters,
+        # which come before every other register of the function
+        first = min((int(r[1:]) for r in defined), default=0)
+        for register in used - defined:
+            assert int(register[1:]) < first, f"{register} is used but never defined in {fname}{where}"
+        op, _, _ = split_opcode(code[-1][0])
+        assert op in {'return', 'jump'}, f"{fname} does not end with a return or a jump{where}"
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# ============================================================
+# uc_client.py -- client of the uC compile server
+#
+# Sends a source file to the server started with
+# ./main.py -serve=<socket>, which keeps the compiler loaded
+# between requests (see main.serve), and shows its answer as
+# main.py would. It only imports uc_rpc, so it starts fast.
+# ============================================================
+
+import sys
+
+import uc_rpc
+
+
+def run_client():
+    """ Runs the command-line client. """
+
+    if len(sys.argv) < 2:
+        print("Usage: ./uc_client.py <source-file> [-check] [-no-ir] [-no-run] [-opt]\n"
+              "       [-O0|-O1|-O2] [-passes=p1,p2,...] [-ir-format=tuple|asm]\n"
+              "       [-socket=path] [-shutdown]")
+        sys.exit(1)
+
+    check = False
+    emit_ir = True
+    run_ir = True
+    opt = None
+    ir_format = 'tuple'
+    socket_path = None
+    shutdown = False
+
+    params = sys.argv[1:]
+    files = sys.argv[1:]
+
+    # The optimizations and formats are checked by the server
+    for param in params:
+        if param[0] == '-':
+            if param == '-check':
+                check = True
+            elif param == '-no-ir':
+                emit_ir = False
+            elif param == '-no-run':
+                run_ir = False
+            elif param == '-shutdown':
+                shutdown = True
+            elif param == '-opt':
+                opt = 'O2'
+            elif param in ('-O0', '-O1', '-O2'):
+                opt = param[1:]
+            elif param.startswith('-passes='):
+                opt = param[len('-passes='):]
+            elif param.startswith('-ir-format='):
+                ir_format = param[len('-ir-format='):]
+            elif param.startswith('-socket='):
+                socket_path = param[len('-socket='):]
+            else:
+                print("Unknown option: %s" % param)
+                sys.exit(1)
+            files.remove(param)
+
+    try:
+        client = uc_rpc.Client(socket_path)
+    except OSError:
+        socket_path = socket_path or uc_rpc.default_socket()
+        print("No uC compile server on %s, start it with ./main.py -serve=%s" % (socket_path, socket_path))
+        sys.exit(1)
+
+    retval = 0
+    try:
+        for file in files:
+            source_filename = file if file[-3:] == '.uc' else file + '.uc'
+            with open(source_filename, 'r') as source:
+                code = source.read()
+            if check:
+                result = client.call('check', code=code)
+            elif run_ir:
+                # The program can't read from the terminal through the server
+                program_input = '' if sys.stdin.isatty() else sys.stdin.read()
+                result = client.call('run', code=code, opt=opt, ir_format=ir_format, input=program_input)
+            else:
+                result = client.call('compile', code=code, opt=opt, ir_format=ir_format)
+
+            if emit_ir and 'ir' in result:
+                ir_filename = source_filename[:-3] + '.ir'
+                print("Outputting the uCIR to %s." % ir_filename)
+                with open(ir_filename, 'w') as ir_file:
+                    ir_file.write(result['ir'])
+            sys.stdout.write(result['output'])
+            sys.stdout.flush()
+            for message in result['errors']:
+                sys.stderr.write(message + "\n")
+            if result['errors']:
+                sys.stderr.write("{} error(s) encountered.\n".format(len(result['errors'])))
+                retval = 1
+            elif result.get('status'):
+                retval = result['status']
+        if shutdown:
+            client.call('shutdown')
+    except uc_rpc.RPCError as e:
+        sys.stderr.write("Server error: %s\n" % e.message)
+        retval = 1
+    finally:
+        client.close()
+    sys.exit(retval)
+
+
+if __name__ == '__main__':
+    run_client()
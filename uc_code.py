@@ -5,6 +5,11 @@ from ast import *
 class GenerateCode(NodeVisitor):
     '''
     Node visitor class that creates 3-address encoded instruction sequences.
+
+    Each global declaration and function definition is lowered on its own
+    (see lower() and merge()), and the parts are merged in order.  The
+    result is the same, byte for byte, as lowering the whole program in a
+    single GenerateCode.
     '''
 
     def __init__(self):
@@ -16,6 +21,8 @@ class GenerateCode(NodeVisitor):
         # The generated code (list of tuples)
         self.text = []
         self.code = []
+        # Pool of constants stored in the .text section: (opcode, value) -> name
+        self.constants = {}
         '''
         self.binary_opcodes = {"+": "add", "-": "sub", "*": "mul", "/": "div", "%": "mod",
         "==": "eq", "!=": "ne", "<": "lt", ">": "ht", "<=": "le", ">=": "he", "&&": "and",
@@ -52,11 +59,23 @@ class GenerateCode(NodeVisitor):
         self.versions[self.fname] += 1
         return name
 
-    def new_text(self):
-        name = "@.str." + "%d" % (self.versions['main'])
+    def new_text(self, prefix="@.str."):
+        name = prefix + "%d" % (self.versions['main'])
         self.versions['main'] += 1
         return name
 
+    def new_constant(self, opcode, value, prefix="@.str."):
+        '''
+        Return the global holding a constant value (a string or the data of
+        an initialization list), emitting it only the first time the same
+        value is needed.
+        '''
+        key = (opcode, repr(value))
+        if key not in self.constants:
+            self.constants[key] = self.new_text(prefix)
+            self.text.append((opcode, self.constants[key], value))
+        return self.constants[key]
+
     def visit(self, node):
         method = 'visit_' + node.__class__.__name__
         return getattr(self, method, self.generic_visit)(node)
@@ -115,12 +134,53 @@ class GenerateCode(NodeVisitor):
             self._loadLocal(init)
         elif isinstance(init, UnaryOp) and init.op == '*':
             self._loadRefer(init)
+        elif isinstance(init, InitList):
+            init.gen_location = self.new_constant('global_' + typename, init.value, "@.const.")
         inst = ('store_' + typename, init.gen_location, target)
         self.code.append(inst)
 
+    def lower(self, node):
+        '''
+        Generate the code of a single global declaration or function
+        definition, which must be the only thing this GenerateCode
+        visits, and return its (text, code) to be merged in a program.
+        '''
+        self.visit(node)
+        return self.text, self.code
+
+    def merge(self, text, code, write=None):
+        '''
+        Append the text and code produced by lower() to this program.
+        Its constants are interned in the pool of the program and get
+        the names they would have had if generated here directly.  If
+        write is given, the code is passed to it an instruction at a
+        time instead.
+        '''
+        rename = {}
+        for inst in text:
+            if inst[1].startswith('@.'):
+                prefix = inst[1][:inst[1].rindex('.') + 1]
+                rename[inst[1]] = self.new_constant(inst[0], inst[2], prefix)
+            else:
+                self.text.append(inst)
+        append = write or self.code.append
+        for inst in code:
+            if rename and not inst[0].startswith('literal') and any(arg in rename for arg in inst[1:]):
+                inst = tuple(rename.get(arg, arg) if isinstance(arg, str) else arg for arg in inst)
+            append(inst)
+
+    def stream(self, node, write):
+        '''
+        Generate the code of the Program node as visit() does, but pass
+        it to write as each function is generated, instead of keeping it
+        in self.code.  The text is still in self.text at the end.
+        '''
+        for gdecl in node.gdecls:
+            self.merge(*GenerateCode().lower(gdecl), write=write)
+
     def visit_Program(self, node):
-        for i in node.gdecls:
-            self.visit(i)
+        for gdecl in node.gdecls:
+            self.merge(*GenerateCode().lower(gdecl))
 
     def visit_GlobalDecl(self, node):
         for i in node.decls:
@@ -129,9 +189,7 @@ class GenerateCode(NodeVisitor):
 
     def visit_Constant(self, node):
         if node.rawtype == 'string':
-            target = self.new_text()
-            inst = ('global_string', target, node.value)
-            self.text.append(inst)
+            target = self.new_constant('global_string', node.value)
         else:
             target = self.new_temp()
             inst = ('literal_' + node.rawtype, node.value, target)
@@ -328,11 +386,10 @@ class GenerateCode(NodeVisitor):
         self.code.append(('jump', label_exit))
         self.code.append((label_false[1:],))
 
-        target = self.new_text()
         expressionTemporary = i.coord.split('@')
         temporaryCoord = expressionTemporary[1].split(':')
-        inst = ('global_string', target, "assertion_fail on " + f"{temporaryCoord[0]}:{temporaryCoord[1]}")
-        self.text.append(inst)
+        target = self.new_constant('global_string',
+                                   "assertion_fail on " + f"{temporaryCoord[0]}:{temporaryCoord[1]}")
 
         inst = ('print_string', target)
         self.code.append(inst)
@@ -448,7 +505,7 @@ class GenerateCode(NodeVisitor):
 
     def visit_InitList(self, node):
         node.value = []
-        for i in node.expressions:
+        for i in node.expression:
             if isinstance(i, InitList):
                 self.visit(i)
             node.value.append(i.value)
@@ -0,0 +1,395 @@
+'''
+Incremental compilation of a uC source file that keeps changing, as in
+main.py -watch, one top-level declaration (a function definition or a
+global declaration) at a time.
+
+The source is split, with the lexer, in the text of its top-level
+declarations.  The code generated for each one is kept and reused while
+neither its text nor the declarations of the global names it refers to
+(its dependencies) change.  A declaration that did change is parsed and
+checked again on its own, preceded by the interface of the declarations
+before it (prototypes for the functions), at its original line and
+column so that the messages and the coordinates in the code stay right.
+At the end, the code of all declarations is merged as GenerateCode does,
+so the result is the same as compiling the whole file again.
+
+IncrementalParser does the same for the front end of an editor, which
+reparses on every keystroke: given an edit of the text, only the
+declarations it touches are lexed and parsed again, and their ASTs are
+spliced in the AST of the program.
+'''
+
+import re
+from bisect import bisect_left, bisect_right
+
+from ast import FuncDef, GlobalDecl, Node, Program
+from lexer import FastScanner, TokenArray, UCLexer
+from parser import UCParser
+from uc_code import GenerateCode
+from uc_sema import Visitor
+
+
+class Chunk(object):
+    ''' The source of a top-level declaration '''
+    __slots__ = ('text', 'line', 'column', 'refs', 'interface')
+
+    def __init__(self, text, line, column, refs, interface):
+        self.text = text            # Source text, from its first token to its last one
+        self.line = line            # Position of its first token
+        self.column = column
+        self.refs = refs            # Identifiers it uses
+        self.interface = interface  # What the declarations after it need to know about it
+
+
+class Entry(object):
+    ''' The result of compiling a Chunk '''
+    __slots__ = ('names', 'line', 'text', 'code')
+
+    def __init__(self, names, line, text, code):
+        self.names = names          # Global names it declares
+        self.line = line            # Line of the Chunk when it was compiled
+        self.text = text            # (text, code) generated by GenerateCode.lower()
+        self.code = code
+
+
+class Fallback(Exception):
+    ''' Raised when a change can't be compiled incrementally '''
+    pass
+
+
+# Messages of the asserts, which hold the line they come from
+_assert_message = re.compile(r"^(assertion_fail on\s+)(\d+):(\d+)$")
+
+
+class IncrementalCompiler(object):
+    '''
+    Compile the successive versions of a source file with compile(),
+    regenerating only the declarations that changed since the previous
+    one.  If too much changed, or the change is hard to isolate (e.g. a
+    syntax error), the whole file is compiled again.
+    '''
+
+    # Maximum fraction of the declarations regenerated one by one
+    max_changes = 0.25
+
+    def __init__(self):
+        self.parser = UCParser()
+        self.lexer = UCLexer(self.parser.print_error)
+        self.lexer.build()
+        self.cache = {}             # key of a Chunk -> Entry
+        self.regenerated = 0        # Declarations (re)generated by the last compile()
+        self.total = 0              # Declarations in the last compiled version
+
+    def compile(self, code):
+        '''
+        Compile the source code and return its uCIR.  Semantic errors are
+        raised as AssertionError, like Compiler does.
+        '''
+        chunks = self._split(code)
+        if chunks is None or not self.cache:
+            return self._compile_all(code, chunks)
+        try:
+            return self._compile_changes(chunks)
+        except Fallback:
+            return self._compile_all(code, chunks)
+
+    def _split(self, code):
+        ''' Split code in Chunks, or return None if it can't be done '''
+        self.lexer.reset_lineno()
+        self.lexer.input(code)
+        chunks = []
+        tokens = []
+        depth = 0
+        body = None                 # Index of the token opening a function body
+        while True:
+            tok = self.lexer.token()
+            if tok is None:
+                break
+            tokens.append(tok)
+            if tok.type == 'LBRACE':
+                if depth == 0 and len(tokens) > 1 and tokens[-2].type == 'RPAREN':
+                    body = len(tokens) - 1
+                depth += 1
+            elif tok.type == 'RBRACE':
+                depth -= 1
+                if depth < 0:
+                    return None
+            if depth == 0 and (tok.type == 'SEMI' or (tok.type == 'RBRACE' and body is not None)):
+                chunks.append(self._chunk(code, tokens, body))
+                tokens = []
+                body = None
+        if tokens:
+            return None
+        return chunks
+
+    def _chunk(self, code, tokens, body):
+        first, last = tokens[0], tokens[-1]
+        if body is None:
+            interface = ' '.join(tok.value for tok in tokens)
+        else:
+            interface = ' '.join(tok.value for tok in tokens[:body]) + ' ;'
+        return Chunk(code[first.lexpos:last.lexpos + len(last.value)], first.lineno,
+                     self.lexer.find_tok_column(first),
+                     frozenset(tok.value for tok in tokens if tok.type == 'ID'), interface)
+
+    @staticmethod
+    def _key(chunk, interfaces):
+        deps = tuple(sorted((name, interfaces.get(name)) for name in chunk.refs))
+        return chunk.text, chunk.column, deps
+
+    @staticmethod
+    def _names(gdecl):
+        if isinstance(gdecl, FuncDef):
+            return [gdecl.decl.name.name]
+        return [decl.name.name for decl in gdecl.decls]
+
+    def _compile_all(self, code, chunks):
+        ast = self.parser.parse(code, '', False)
+        assert ast is not None and not self.parser.errors, "Unable to parse the program"
+        Visitor(False).visit(ast)
+        parts = [GenerateCode().lower(gdecl) for gdecl in ast.gdecls]
+        self.cache = {}
+        if chunks is not None and len(chunks) == len(ast.gdecls):
+            interfaces = {}
+            for chunk, gdecl, (text, gen) in zip(chunks, ast.gdecls, parts):
+                entry = Entry(self._names(gdecl), chunk.line, text, gen)
+                self.cache[self._key(chunk, interfaces)] = entry
+                for name in entry.names:
+                    interfaces[name] = chunk.interface
+        self.regenerated = self.total = len(ast.gdecls)
+        return self._merge(parts)
+
+    def _compile_changes(self, chunks):
+        cache = {}
+        parts = []
+        interfaces = {}             # global name -> interface of its last declaration
+        regenerated = 0
+        for index, chunk in enumerate(chunks):
+            key = self._key(chunk, interfaces)
+            entry = self.cache.get(key)
+            if entry is None:
+                regenerated += 1
+                if regenerated > self.max_changes * len(chunks) + 1:
+                    raise Fallback()
+                entry = self._compile_chunk(chunk, chunks[:index])
+            cache[key] = entry
+            parts.append(self._relocate(entry, chunk.line))
+            for name in entry.names:
+                interfaces[name] = chunk.interface
+        self.cache = cache
+        self.regenerated = regenerated
+        self.total = len(chunks)
+        return self._merge(parts)
+
+    def _compile_chunk(self, chunk, previous):
+        '''
+        Parse, check and generate the code of chunk alone.  The interfaces
+        of the previous declarations all go in the first line, so chunk
+        must start after it.
+        '''
+        if previous and chunk.line == 1:
+            raise Fallback()
+        source = (' '.join(c.interface for c in previous) + '\n' * (chunk.line - 1)
+                  + ' ' * (chunk.column - 1) + chunk.text)
+        ast = self.parser.parse(source, '', False)
+        if ast is None or self.parser.errors or len(ast.gdecls) != len(previous) + 1:
+            raise Fallback()
+        Visitor(False).visit(ast)
+        # The code of the functions needs the locations of the globals
+        for gdecl in ast.gdecls[:-1]:
+            if isinstance(gdecl, GlobalDecl):
+                GenerateCode().lower(gdecl)
+        text, code = GenerateCode().lower(ast.gdecls[-1])
+        return Entry(self._names(ast.gdecls[-1]), chunk.line, text, code)
+
+    @staticmethod
+    def _relocate(entry, line):
+        ''' Return the (text, code) of entry, moved to start at line '''
+        delta = line - entry.line
+        if delta == 0:
+            return entry.text, entry.code
+        text = []
+        for inst in entry.text:
+            match = _assert_message.match(inst[2]) if inst[0] == 'global_string' else None
+            if match:
+                inst = (inst[0], inst[1], "%s%d:%s" % (match.group(1), int(match.group(2)) + delta,
+                                                       match.group(3)))
+            text.append(inst)
+        return text, entry.code
+
+    @staticmethod
+    def _merge(parts):
+        gen = GenerateCode()
+        for text, code in parts:
+            gen.merge(text, code)
+        return gen.text + gen.code
+
+
+# Coordinates of the AST nodes, as made by Coord
+_coord = re.compile(r'^(\s*@ )(\d+):(.*)$')
+_line_end = re.compile(r'[ \t]*(\n|$)')
+
+_token_ids = {name: i for i, name in enumerate(UCLexer.tokens)}
+_type_ids = frozenset(_token_ids[name] for name in ('VOID', 'INT', 'FLOAT', 'CHAR'))
+
+
+class IncrementalParser(object):
+    '''
+    Keep the AST of a source up to date while it is edited.  The source
+    is kept split in its top-level declarations, each one ending with the
+    ';' or the '}' of the function body outside of any braces.  An edit
+    is lexed again from the end of the declaration before it, declaration
+    by declaration, until one ends where a declaration ended before the
+    edit: from there on, the tokens are the same, and so are the
+    declarations and their ASTs.  So the work done depends on the size of
+    the edit and of the declarations around it, not on the size of the
+    source, except for the coordinates of the declarations after an edit
+    that adds or removes lines, which are updated.
+    '''
+
+    def __init__(self, text='', parser=None):
+        self.parser = parser or UCParser()
+        self.scanner = FastScanner()
+        self.text = ''
+        self.ends = []              # Offset after the last token of each declaration
+        self.lines = []             # Line of the last token of each declaration
+        self.nodes = []             # AST of each declaration, None if it has errors
+        self.coords = []            # Nodes of each AST with coordinates
+        self.fragile = []           # Whether its tokens depend on the text after it, see edit()
+        self.open = False           # Whether the text ends in the middle of a declaration
+        self.ast = Program([])
+        self.reparsed = 0           # Declarations parsed by the last edit()
+        self.edit(0, 0, text)
+
+    def edit(self, offset, deleted, inserted):
+        '''
+        Replace the deleted characters of the text from offset with the
+        string inserted, and update the AST.  Return the AST of the program
+        (self.ast), which has the declarations without syntax errors.
+        '''
+        text = self.text[:offset] + inserted + self.text[offset + deleted:]
+        delta = len(inserted) - deleted
+        edit_end = offset + len(inserted)
+        first = bisect_right(self.ends, offset)
+        if first == len(self.ends) and self.open:
+            first -= 1              # Its end isn't the end of a declaration
+        # A '/*' or '"' not closed is lexed as a '/' token or an illegal
+        # character, which may change if the edit closes it
+        try:
+            first = self.fragile.index(True, 0, first)
+        except ValueError:
+            pass
+        if first > 0:
+            pos, lineno = self.ends[first - 1], self.lines[first - 1]
+        else:
+            pos, lineno = 0, 1
+        lbrace, rbrace, rparen, semi, equals, divide = (_token_ids[name] for name in
+                                                        ('LBRACE', 'RBRACE', 'RPAREN', 'SEMI', 'EQUALS', 'DIVIDE'))
+
+        ends, lines, nodes, coords, fragile = [], [], [], [], []
+        tokens = []
+        unclosed = False
+        depth = 0
+        body = False                # Whether the declaration has a function body
+        params = False              # Whether it has a declaration list, as in int f(a) int a; {...}
+        resync = None               # Declaration before the edit ending where the last new one does
+        for tok in self.scanner.scan(text, pos, lineno):
+            type_id = tok[0]
+            if type_id < 0:
+                unclosed = unclosed or text[tok[1]] == '"'
+                continue
+            elif type_id == divide:
+                unclosed = unclosed or text.startswith('*', tok[2])
+            if type_id == lbrace:
+                if depth == 0 and not (tokens and tokens[-1][0] == equals):
+                    body = True
+                depth += 1
+            elif type_id == rbrace:
+                depth -= 1
+            elif type_id in _type_ids and depth == 0 and tokens and tokens[-1][0] == rparen:
+                params = True
+            tokens.append(tok)
+            if depth <= 0 and ((type_id == semi and not params) or (type_id == rbrace and body)):
+                ends.append(tok[2])
+                lines.append(tok[3])
+                nodes.append(self._parse(text, tokens))
+                coords.append(_coord_nodes(nodes[-1], [], set()))
+                fragile.append(unclosed)
+                tokens = []
+                unclosed = False
+                depth = 0
+                body = params = False
+                # The next declarations are the old ones, with the same
+                # columns if the line of tok is the same after it
+                if tok[2] >= edit_end and (text.find('\n', edit_end, tok[2]) >= 0 or
+                                           _line_end.match(text, tok[2])):
+                    old = bisect_left(self.ends, tok[2] - delta, first)
+                    if old < len(self.ends) and self.ends[old] == tok[2] - delta:
+                        resync = old
+                        break
+        if tokens:
+            ends.append(tokens[-1][2])
+            lines.append(tokens[-1][3])
+            nodes.append(self._parse(text, tokens))
+            coords.append(_coord_nodes(nodes[-1], [], set()))
+            fragile.append(unclosed)
+
+        if resync is None:
+            last, line_delta = len(self.ends), 0
+            self.open = bool(tokens)
+        else:
+            last, line_delta = resync + 1, lines[-1] - self.lines[resync]
+            self.open = self.open and last < len(self.ends)
+        if line_delta:
+            for nodes_with_coord in self.coords[last:]:
+                for node in nodes_with_coord:
+                    match = _coord.match(node.coord)
+                    node.coord = "%s%d:%s" % (match.group(1), int(match.group(2)) + line_delta, match.group(3))
+        self.text = text
+        self.ends[first:] = ends + [end + delta for end in self.ends[last:]]
+        self.lines[first:] = lines + [line + line_delta for line in self.lines[last:]]
+        self.nodes[first:] = nodes + self.nodes[last:]
+        self.coords[first:] = coords + self.coords[last:]
+        self.fragile[first:] = fragile + self.fragile[last:]
+        self.ast = Program([node for node in self.nodes if node is not None])
+        self.reparsed = len(nodes)
+        return self.ast
+
+    def _parse(self, text, tokens):
+        ''' Parse the tokens of a declaration and return its AST '''
+        # In the whole text, so the columns are found as in a full parse
+        array = TokenArray(text)
+        for type_id, start, stop, line in tokens:
+            array.types.append(type_id)
+            array.starts.append(start)
+            array.lengths.append(stop - start)
+            array.lines.append(line)
+        ast = self.parser.parse(array)
+        if ast is None or self.parser.errors or len(ast.gdecls) != 1:
+            return None
+        return ast.gdecls[0]
+
+
+def _coord_nodes(node, found, seen):
+    '''
+    Add to found the nodes with coordinates among node and all the nodes it
+    refers to, and return it.  It must not have been through the semantic
+    analysis, which links it to the nodes of other declarations.
+    '''
+    if isinstance(node, (list, tuple)):
+        for item in node:
+            _coord_nodes(item, found, seen)
+    elif isinstance(node, dict):
+        for item in node.values():
+            _coord_nodes(item, found, seen)
+    elif isinstance(node, Node) and id(node) not in seen:
+        seen.add(id(node))
+        slots = node.__slots__
+        for name in (slots,) if isinstance(slots, str) else slots:
+            value = getattr(node, name, None)
+            if name == 'coord':
+                if isinstance(value, str) and _coord.match(value):
+                    found.append(node)
+            else:
+                _coord_nodes(value, found, seen)
+    return found
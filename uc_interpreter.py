@@ -104,7 +104,7 @@ class Interpreter(object):
                 break
             if not op[0].isdigit():
                 opcode, modifier = self._extract_operation(op[0])
-                if opcode.startswith('main'):
+                if opcode.startswith('global'):
                     self.globals[op[1]] = self.offset
                     # get the size of global var
                     if not modifier:
@@ -0,0 +1,481 @@
+'''
+Structured, in-memory form of the uC intermediate representation.
+
+GenerateCode emits every instruction as a tuple whose opcode string
+encodes the operation, its type and its modifiers, as in
+
+     ('load_int_10_*', '%3', '%4')
+
+so whoever consumes it (the Interpreter, the optimizations) has to split
+the opcode again every time.  Here each instruction is decoded once into
+an Instruction with:
+
+     op      the operation, an Opcode (Opcode.LOAD)
+     type    the type tag, an IRType (IRType.INT), IRType.NONE if untyped
+     mods    the modifiers as ints: the dimensions, and POINTER for each '*'
+             ((10, POINTER))
+     args    the operands as ints: N for '%N' (temporaries, variables and
+             labels) and a negative id for '@name' (globals and functions),
+             interned by the Program the instruction belongs to ((3, 4))
+     value   the constant of literal_* and global_* instructions
+
+The conversion is loss-free, Program(code).to_tuples() == code, so the
+.ir files written from either form are the same.
+
+A Program can also be saved to, and loaded from, a binary object file
+(.uco), to run a program again without compiling it.  The file holds,
+after a header, the table of global names, the table of constants and
+the instructions, as a sequence of ints:
+
+     op, type, number of mods, mods..., number of args, args..., constant
+
+where constant is the index of the value in the table of constants, or
+-1 if the instruction has none.  All the ints of the file, as the counts
+and the lengths of the tables, are varints: 7 bits in each byte, the
+lowest first, with the high bit set in all the bytes but the last, and
+the ones that may be negative are zigzag encoded first (0, -1, 1, -2...
+as 0, 1, 2, 3...).  So an opcode, a type or an operand below %64 takes a
+single byte.  The Interpreter runs tuples, so a loaded program is
+converted back with to_tuples().
+'''
+
+import re
+import struct
+from enum import IntEnum
+
+
+class Opcode(IntEnum):
+    LABEL = 0
+    DEFINE = 1
+    GLOBAL = 2
+    ALLOC = 3
+    LITERAL = 4
+    LOAD = 5
+    STORE = 6
+    ELEM = 7
+    GET = 8
+    ADD = 9
+    SUB = 10
+    MUL = 11
+    DIV = 12
+    MOD = 13
+    LT = 14
+    LE = 15
+    GT = 16
+    GE = 17
+    EQ = 18
+    NE = 19
+    AND = 20
+    OR = 21
+    NOT = 22
+    SITOFP = 23
+    FPTOSI = 24
+    PARAM = 25
+    CALL = 26
+    RETURN = 27
+    JUMP = 28
+    CBRANCH = 29
+    READ = 30
+    PRINT = 31
+
+
+class IRType(IntEnum):
+    NONE = 0
+    INT = 1
+    FLOAT = 2
+    CHAR = 3
+    BOOL = 4
+    STRING = 5
+    VOID = 6
+
+
+# Modifier standing for a '*' (pointer) in an opcode
+POINTER = 0
+
+# Value of the instructions without a constant
+NOVALUE = type('NoValue', (), {'__repr__': lambda self: 'NOVALUE'})()
+
+# Operations never followed by a type in the opcode
+_untyped = {Opcode.SITOFP, Opcode.FPTOSI, Opcode.JUMP, Opcode.CBRANCH, Opcode.DEFINE, Opcode.CALL}
+
+# Opcodes and types by their value, faster than Opcode(value) when reading
+_opcodes = {op.value: op for op in Opcode}
+_types = {type.value: type for type in IRType}
+
+# Position of the constant in the tuple, for the operations that have one
+_value_position = {Opcode.LITERAL: 1, Opcode.GLOBAL: 2}
+
+# opcode string -> (op, type, mods), filled on demand
+_decoded = {}
+
+
+def decode_opcode(opcode):
+    ''' Split an opcode like 'load_int_10_*' in (Opcode.LOAD, IRType.INT, (10, POINTER)) '''
+    try:
+        return _decoded[opcode]
+    except KeyError:
+        pass
+    _aux = opcode.split('_')
+    op = Opcode[_aux[0].upper()]
+    if len(_aux) == 1:
+        decoded = (op, IRType.NONE, ())
+    elif op in _untyped:
+        raise ValueError("Unexpected type in opcode %r" % opcode)
+    else:
+        mods = tuple(POINTER if mod == '*' else int(mod) for mod in _aux[2:])
+        decoded = (op, IRType[_aux[1].upper()], mods)
+    _decoded[opcode] = decoded
+    return decoded
+
+
+def encode_opcode(op, type, mods):
+    ''' Inverse of decode_opcode '''
+    parts = [op.name.lower()]
+    if type != IRType.NONE:
+        parts.append(type.name.lower())
+    parts.extend('*' if mod == POINTER else str(mod) for mod in mods)
+    return '_'.join(parts)
+
+
+class Instruction(object):
+    '''
+    A decoded uCIR instruction.  Its operands only make sense within the
+    Program it belongs to, which knows the names of the globals.
+    '''
+    __slots__ = ('op', 'type', 'mods', 'args', 'value')
+
+    def __init__(self, op, type=IRType.NONE, mods=(), args=(), value=NOVALUE):
+        self.op = op
+        self.type = type
+        self.mods = mods
+        self.args = args
+        self.value = value
+
+    def __repr__(self):
+        return "Instruction(%s, %s, %r, %r, %r)" % (self.op.name, self.type.name, self.mods, self.args, self.value)
+
+    def __eq__(self, other):
+        return (isinstance(other, Instruction) and self.op == other.op and self.type == other.type
+                and self.mods == other.mods and self.args == other.args and self.value == other.value)
+
+    def dims(self):
+        ''' The dimensions among the modifiers '''
+        return tuple(mod for mod in self.mods if mod != POINTER)
+
+    def is_pointer(self):
+        return POINTER in self.mods
+
+
+class Program(object):
+    '''
+    A whole uCIR program in structured form: the list of its instructions
+    and the table of the global names ('@main', '@.str.0', ...) their
+    operands refer to.  Build it from the tuples generated by GenerateCode
+    and get them back with to_tuples().
+    '''
+    __slots__ = ('names', 'ids', 'instructions')
+
+    def __init__(self, ircode=()):
+        self.names = []             # Global names, the id of names[i] is -(i + 1)
+        self.ids = {}               # Global name -> id
+        self.instructions = []
+        for inst in ircode:
+            self.append(inst)
+
+    def __len__(self):
+        return len(self.instructions)
+
+    def __iter__(self):
+        return iter(self.instructions)
+
+    def __getitem__(self, index):
+        return self.instructions[index]
+
+    def intern(self, name):
+        ''' Return the id of the global name, adding it to the table if new '''
+        try:
+            return self.ids[name]
+        except KeyError:
+            self.names.append(name)
+            self.ids[name] = -len(self.names)
+            return self.ids[name]
+
+    def operand(self, arg):
+        ''' Return the integer id of the operand arg ('%N' or '@name') '''
+        if isinstance(arg, str):
+            if arg[:1] == '%' and arg[1:].isdigit():
+                return int(arg[1:])
+            elif arg[:1] == '@':
+                return self.intern(arg)
+        raise ValueError("Invalid operand %r" % (arg,))
+
+    def name(self, operand):
+        ''' Inverse of operand() '''
+        return '%' + str(operand) if operand >= 0 else self.names[-operand - 1]
+
+    def decode(self, inst):
+        ''' Convert the tuple inst to an Instruction '''
+        if inst[0].isdigit():
+            return Instruction(Opcode.LABEL, args=(int(inst[0]),))
+        op, type, mods = decode_opcode(inst[0])
+        value = NOVALUE
+        args = list(inst[1:])
+        position = _value_position.get(op)
+        if position is not None and position < len(inst):
+            value = args.pop(position - 1)
+        return Instruction(op, type, mods, tuple(self.operand(arg) for arg in args), value)
+
+    def encode(self, inst):
+        ''' Convert the Instruction inst back to a tuple '''
+        if inst.op == Opcode.LABEL:
+            return (str(inst.args[0]),)
+        args = [self.name(arg) for arg in inst.args]
+        if inst.value is not NOVALUE:
+            args.insert(_value_position[inst.op] - 1, inst.value)
+        return (encode_opcode(inst.op, inst.type, inst.mods),) + tuple(args)
+
+    def append(self, inst):
+        ''' Append the instruction inst, given as a tuple '''
+        self.instructions.append(self.decode(inst))
+
+    def to_tuples(self):
+        return [self.encode(inst) for inst in self.instructions]
+
+    def write(self, file):
+        ''' Save the program to the binary file object file '''
+        values = []
+        code = []
+        for inst in self.instructions:
+            code.append(inst.op)
+            code.append(inst.type)
+            code.append(len(inst.mods))
+            code.extend(inst.mods)
+            code.append(len(inst.args))
+            code.extend(inst.args)
+            if inst.value is NOVALUE:
+                code.append(-1)
+            else:
+                code.append(len(values))
+                values.append(inst.value)
+        file.write(MAGIC)
+        _write_strings(file, self.names)
+        _write_uint(file, len(values))
+        for value in values:
+            _write_value(file, value)
+        data = _pack_ints(code)
+        _write_uint(file, len(data))
+        file.write(data)
+
+    @classmethod
+    def read(cls, file):
+        '''
+        Load a program saved by write() from the binary file object file.
+        Raise ValueError if it is not one, or it is truncated or corrupted.
+        '''
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError("Not a uCIR object file (or from another version)")
+        try:
+            return cls._read(file)
+        except (struct.error, IndexError, ValueError) as e:
+            raise ValueError("Corrupted uCIR object file (%s)" % e) from None
+
+    @classmethod
+    def _read(cls, file):
+        program = cls()
+        program.names = _read_strings(file)
+        program.ids = {name: -(i + 1) for i, name in enumerate(program.names)}
+        values = [_read_value(file) for _ in range(_read_uint(file))]
+        code = _unpack_ints(_read_bytes(file, _read_uint(file)))
+        instructions = program.instructions
+        lowest = -len(program.names)
+        i = 0
+        while i < len(code):
+            op, type, nmods = code[i:i + 3]
+            mods = tuple(code[i + 3:i + 3 + nmods])
+            i += 3 + nmods
+            nargs = code[i]
+            args = tuple(code[i + 1:i + 1 + nargs])
+            value = code[i + 1 + nargs]
+            i += 2 + nargs
+            op, type = _opcodes.get(op), _types.get(type)
+            if (op is None or type is None or nmods < 0 or nargs < 0 or (args and min(args) < lowest)
+                    or (value >= 0 and op not in _value_position)):
+                raise ValueError("invalid instruction")
+            instructions.append(Instruction(op, type, mods, args,
+                                            NOVALUE if value < 0 else values[value]))
+        return program
+
+
+class IRWriter(object):
+    '''
+    Write uCIR instructions (tuples) to a text file one at a time, as they
+    come, instead of building the whole listing in memory first.  The file
+    object does the buffering.  Two formats are supported:
+
+         'tuple'   the repr of each tuple, one per line: the .ir format
+         'asm'     a more compact, assembly-like listing:
+
+                        global_string @.str.0 'hello'
+                        define @main
+                          literal_int 1 %2
+                        5:
+                          cbranch %3 %4 %5
+    '''
+    formats = ('tuple', 'asm')
+
+    def __init__(self, file, format='tuple'):
+        if format not in self.formats:
+            raise ValueError("Unknown IR format: %s" % format)
+        self.file = file
+        self.format = format
+
+    def write(self, inst):
+        if self.format == 'tuple':
+            self.file.write("%r\n" % (inst,))
+        elif inst[0].isdigit():
+            self.file.write("%s:\n" % inst[0])
+        else:
+            if inst[0] != 'define' and not inst[0].startswith('global'):
+                self.file.write('  ')
+            self.file.write(inst[0])
+            # The constant is always quoted, even a string like '%d' or '@'
+            position = _value_position.get(Opcode.__members__.get(inst[0].split('_', 1)[0].upper()))
+            for index, arg in enumerate(inst[1:], 1):
+                self.file.write(' ' + (arg if isinstance(arg, str) and index != position else repr(arg)))
+            self.file.write('\n')
+
+    def write_all(self, code):
+        for inst in code:
+            self.write(inst)
+
+
+# First bytes of an object file, followed by the format version
+MAGIC = b'uCIR\x00\x02'
+
+
+def _read_bytes(file, size):
+    ''' Read size bytes, a megabyte at a time, as a corrupted size could be huge '''
+    chunks = []
+    while size > 0:
+        chunk = file.read(min(size, 1 << 20))
+        if not chunk:
+            raise ValueError("truncated")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _pack_ints(values):
+    ''' Return the ints values as zigzag encoded varints '''
+    data = bytearray()
+    for value in values:
+        value = value << 1 if value >= 0 else (-value << 1) - 1
+        while value >= 0x80:
+            data.append(value & 0x7f | 0x80)
+            value >>= 7
+        data.append(value)
+    return bytes(data)
+
+
+def _unpack_ints(data):
+    ''' Inverse of _pack_ints '''
+    # Most ints take a single byte: the runs of them are decoded by a table
+    values = []
+    extend = values.extend
+    single = _single_byte.__getitem__
+    pos = 0
+    for m in _long_varint.finditer(data):
+        start = m.start()
+        if start > pos:
+            extend(map(single, data[pos:start]))
+        value = 0
+        for shift, byte in enumerate(m.group()):
+            value |= (byte & 0x7f) << (7 * shift)
+        values.append((value >> 1) ^ -(value & 1))
+        pos = m.end()
+    if pos < len(data):
+        if data[-1] >= 0x80:
+            raise ValueError("truncated")
+        extend(map(single, data[pos:]))
+    return values
+
+
+# The ints of a single byte, see _unpack_ints, and the varints of more
+_single_byte = [(byte >> 1) ^ -(byte & 1) for byte in range(0x80)]
+_long_varint = re.compile(rb'[\x80-\xff]+[\x00-\x7f]')
+
+
+def _write_uint(file, value):
+    data = bytearray()
+    while value >= 0x80:
+        data.append(value & 0x7f | 0x80)
+        value >>= 7
+    data.append(value)
+    file.write(data)
+
+
+def _read_uint(file):
+    value = shift = 0
+    while True:
+        byte = _read_bytes(file, 1)[0]
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value
+        shift += 7
+
+
+def _read_int(file):
+    value = _read_uint(file)
+    return (value >> 1) ^ -(value & 1)
+
+
+def _write_strings(file, strings):
+    _write_uint(file, len(strings))
+    for string in strings:
+        data = string.encode('utf-8')
+        _write_uint(file, len(data))
+        file.write(data)
+
+
+def _read_strings(file):
+    return [_read_bytes(file, _read_uint(file)).decode('utf-8') for _ in range(_read_uint(file))]
+
+
+def _write_value(file, value):
+    ''' Write a constant: a tag followed by its data '''
+    if value is None:
+        file.write(b'n')
+    elif isinstance(value, bool):
+        file.write(b'b' + struct.pack('<?', value))
+    elif isinstance(value, int):
+        file.write(b'i' + _pack_ints([value]))
+    elif isinstance(value, float):
+        file.write(b'f' + struct.pack('<d', value))
+    elif isinstance(value, str):
+        file.write(b's')
+        _write_strings(file, [value])
+    elif isinstance(value, (list, tuple)):
+        file.write(b'l' if isinstance(value, list) else b't')
+        _write_uint(file, len(value))
+        for item in value:
+            _write_value(file, item)
+    else:
+        raise ValueError("Cannot save the constant %r" % (value,))
+
+
+def _read_value(file):
+    tag = file.read(1)
+    if tag == b'n':
+        return None
+    elif tag == b'b':
+        return struct.unpack('<?', _read_bytes(file, 1))[0]
+    elif tag == b'i':
+        return _read_int(file)
+    elif tag == b'f':
+        return struct.unpack('<d', _read_bytes(file, 8))[0]
+    elif tag == b's':
+        return _read_strings(file)[0]
+    elif tag in {b'l', b't'}:
+        items = [_read_value(file) for _ in range(_read_uint(file))]
+        return items if tag == b'l' else tuple(items)
+    raise ValueError("unknown constant tag %r" % tag)
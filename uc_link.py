@@ -0,0 +1,100 @@
+'''
+Linker for uC translation units compiled separately.
+
+Each .uc file compiles to a uCIR program of its own (usually saved as an
+object file, see uc_ir.Program.write), which exports the functions and
+global variables it defines and refers, by name, to the functions it only
+declares, as in:
+
+     int square(int x);          <- defined in some other unit
+     int main() { return square(3); }
+
+link() puts the units together in a single program for the Interpreter.
+Functions and global variables are shared by name, so each function must
+be defined by exactly one unit.  uC has no extern, so a global variable
+without an initializer, as 'int count;', is a common symbol, as in C: the
+units declaring it with the same type share a single variable, which
+takes the initializer of the one unit, if any, that gives it one.  The
+constants of the units (strings and initialization lists, named
+'@.str.N' and '@.const.N') are private, so they are renamed, merging the
+identical ones.
+'''
+
+from uc_block import global_refs, join_functions, split_functions
+
+
+def exports(code):
+    ''' Return the names of the functions and global variables defined by code '''
+    text, functions = split_functions(code)
+    return [inst[1] for inst in text if not inst[1].startswith('@.')] + [f[0][1] for f in functions]
+
+
+def imports(code):
+    ''' Return the names code refers to without defining them '''
+    defined = set(exports(code))
+    missing = []
+    for inst in code:
+        for name in global_refs(inst):
+            if name not in defined and not name.startswith('@.') and name not in missing:
+                missing.append(name)
+    return missing
+
+
+def _rename(inst, mapping):
+    ''' Return inst with the globals in mapping renamed '''
+    if inst[0].startswith('literal') or not any(arg in mapping for arg in inst[1:] if isinstance(arg, str)):
+        return inst
+    return tuple(mapping.get(arg, arg) if isinstance(arg, str) else arg for arg in inst)
+
+
+def link(units, names=None):
+    '''
+    Link the code of several units (lists of instruction tuples) in a
+    single program and return it.  names are the names of the units, used
+    in the messages.  Fail with an AssertionError if a symbol is defined
+    more than once, a common variable is declared with different types,
+    or a symbol is used but never defined.
+    '''
+    if names is None:
+        names = ["unit %d" % i for i in range(len(units))]
+    text = []
+    functions = []
+    defined = {}                    # symbol -> name of the unit defining it
+    variables = {}                  # global variable -> its index in text
+    constants = {}                  # (opcode, value) -> name of the constant
+    for unit, code in zip(names, units):
+        unit_text, unit_functions = split_functions(code)
+        rename = {}
+        for inst in unit_text:
+            if inst[1].startswith('@.'):
+                key = (inst[0], repr(inst[2]))
+                if key not in constants:
+                    constants[key] = "%s.%d" % (inst[1][:inst[1].rindex('.')], len(constants))
+                    text.append((inst[0], constants[key], inst[2]))
+                rename[inst[1]] = constants[key]
+            elif inst[1] in variables and (len(inst) == 2 or len(text[variables[inst[1]]]) == 2):
+                # A common variable, with the initializer of the unit giving one
+                index = variables[inst[1]]
+                assert text[index][0] == inst[0], \
+                    f"{inst[1]} declared as {text[index][0]} in {defined[inst[1]]} and as {inst[0]} in {unit}"
+                if len(inst) > 2:
+                    text[index] = inst
+                    defined[inst[1]] = unit
+            else:
+                assert inst[1] not in defined, f"{inst[1]} defined in both {defined[inst[1]]} and {unit}"
+                defined[inst[1]] = unit
+                variables[inst[1]] = len(text)
+                text.append(inst)
+        for function in unit_functions:
+            fname = function[0][1]
+            assert fname not in defined, f"{fname} defined in both {defined[fname]} and {unit}"
+            defined[fname] = unit
+            functions.append([_rename(inst, rename) for inst in function])
+
+    assert '@main' in defined, "Undefined reference to @main"
+    for function in functions:
+        for inst in function:
+            for name in global_refs(inst):
+                assert name in defined or name.startswith('@.'), \
+                    f"Undefined reference to {name} in {function[0][1]} ({defined[function[0][1]]})"
+    return join_functions(text, functions)
@@ -0,0 +1,263 @@
+'''
+A driver of the LALR tables of the uC grammar, faster than ply's own.
+
+For each reduction, ply's LRParser allocates a YaccSymbol, slices the stack
+and calls the p_ function through a YaccProduction, whose p[n] is a method
+call.  LRDriver works on the same tables, built by ply from the p_ functions
+of UCParser, but:
+
+  - The actions and the gotos are in a single flat list, indexed by the
+    state plus the integer id of the symbol, where the states are numbered
+    by the offset of their row, and the type ids of the tokens are the
+    ones in the TokenArray, so no dict is looked up.
+  - The rules whose function only passes the value on (p[0] = p[1]), as
+    binary_expression : cast_expression, are reduced by changing the state
+    on the top of the stack, without calling anything, and so are the
+    empty rules whose function does nothing.  The chain of them after a
+    rule, as from primary_expression up to expression, is reduced at once,
+    with the goto of the rule: the state it ends in is only found the
+    first time.
+  - The p passed to the other p_ functions is a Production, a list of the
+    values, so p[n] and len(p) are done in C.  The values are on a stack of
+    their own, with the position of each token on another one, to find the
+    coordinates of p.coord(n).
+
+The tokens come from a TokenArray, whose values are only sliced from the
+text when they are shifted, and the garbage collector is off while the AST
+is built.  The syntax errors are reported and recovered from exactly as ply
+does it, so the ASTs and the messages are the same.
+'''
+
+import gc
+
+from ast import intern_name
+from lexer import UCLexer, _operators
+from ply.yacc import error_count
+
+
+def _unit(self, p):
+    ''' unit : symbol '''
+    p[0] = p[1]
+
+
+def _empty(self, p):
+    ''' empty : '''
+    pass
+
+
+def _same_code(func, model):
+    ''' Whether the function func does what model does, whatever its docstring '''
+    code, model = func.__code__, model.__code__
+    return code.co_code == model.co_code and code.co_consts[1:] == model.co_consts[1:]
+
+
+class Production(list):
+    '''
+    The p passed to the p_ functions by LRDriver, as the YaccProduction of
+    ply: p[0] is set to the value of the rule and p[1:] are the values of
+    its symbols.
+    '''
+    __slots__ = ('positions', 'text', 'starts', 'lines')
+
+    def coord(self, n):
+        ''' Return the coordinates of the n-th symbol as a string, as UCParser._token_coord '''
+        i = self.positions[n - len(self)]
+        if i == -1:
+            return ''               # A nonterminal has no line
+        if i < 0:
+            i = -2 - i              # An error, at the token it was found
+        start = self.starts[i]
+        # As Coord.__str__, the lines of the tokens start at 1
+        return "   @ %d:%d" % (self.lines[i], start - self.text.rfind('\n', 0, start))
+
+
+class LRDriver(object):
+    ''' The LALR tables of the ply LRParser lr, ready for parse() '''
+
+    def __init__(self, lr):
+        terminals = list(UCLexer.tokens) + ['$end', 'error']
+        nonterminals = sorted({prod.name for prod in lr.productions})
+        columns = {name: i for i, name in enumerate(terminals + nonterminals)}
+        self.end = columns['$end']
+        self.error = columns['error']
+        self.width = width = len(columns)
+
+        # (size, left-hand side, function) of each rule, without the function
+        # if it only passes the value on or does nothing
+        self.rules = []
+        for prod in lr.productions:
+            func = prod.callable
+            if func is not None and ((prod.len == 1 and _same_code(func, _unit)) or
+                                     (prod.len == 0 and _same_code(func, _empty))):
+                func = None
+            self.rules.append((prod.len, columns[prod.name], func))
+        units = {state for state, actions in lr.action.items()
+                 if any(action < 0 and self.rules[-action][0] == 1 and self.rules[-action][2] is None
+                        for action in actions.values())}
+
+        # Shifts and gotos are to the offset of the row of the state,
+        # negated for the gotos to a state where a unit rule may be reduced,
+        # see _goto(); reductions are the negated number of the rule and 0
+        # accepts
+        table = [None] * (width * len(lr.action))
+        for state, actions in lr.action.items():
+            row = state * width
+            if state in lr.defaulted_states:
+                # The only action, taken without looking at the next token
+                table[row:row + len(terminals)] = [lr.defaulted_states[state]] * len(terminals)
+                continue
+            for name, action in actions.items():
+                table[row + columns[name]] = action * width if action > 0 else action
+        for state, gotos in lr.goto.items():
+            row = state * width
+            for name, target in gotos.items():
+                table[row + columns[name]] = -target * width if target in units else target * width
+        self.table = table
+
+        # The states returned by _goto(), by the state below plus the
+        # symbol, times the width, plus the lookahead
+        self.gotos = {}
+
+        # The values of the tokens that are always the same text
+        self.fixed = [None] * len(terminals)
+        for text, name in _operators.items():
+            self.fixed[columns[name]] = text
+        for text, name in UCLexer.keyword_map.items():
+            self.fixed[columns[name]] = text
+
+    def _goto(self, below, symbol, la):
+        '''
+        Return the state reached from the state below by the symbol, the
+        left-hand side of a rule just reduced, and then by the unit rules
+        that pass the value on, while one is to be reduced on the lookahead
+        la: all of them only replace the state on the top of the stack.
+        '''
+        table, rules = self.table, self.rules
+        state = abs(table[below + symbol])
+        action = table[state + la]
+        while action is not None and action < 0 and rules[-action][0] == 1 and rules[-action][2] is None:
+            state = abs(table[below + rules[-action][1]])
+            action = table[state + la]
+        self.gotos[(below + symbol) * self.width + la] = state
+        return state
+
+    def _error_token(self, tokens, i):
+        ''' Return the i-th token as the LexToken passed to p_error '''
+        tok = tokens.token(i)
+        tok.column = tok.lexpos - tokens.text.rfind('\n', 0, tok.lexpos)
+        return tok
+
+    def parse(self, tokens, error_func):
+        '''
+        Parse the TokenArray tokens and return the value of the start
+        symbol, calling error_func with each syntax error as p_error.
+        Return None if the errors can't be recovered from.
+        '''
+        # The AST is made of many small objects, but no garbage: with the
+        # collector on, the older ones would be traversed again and again
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self._parse(tokens, error_func)
+        finally:
+            if enabled:
+                gc.enable()
+
+    def _parse(self, tokens, error_func):
+        table, rules, gotos, fixed, width = self.table, self.rules, self.gotos, self.fixed, self.width
+        nonterminal = [-1]
+        end, error, id_id = self.end, self.error, UCLexer.tokens.index('ID')
+        text, starts, lengths = tokens.text, tokens.starts, tokens.lengths
+        types = tokens.types[:]
+        types.append(end)
+        p = Production()
+        states = [0]
+        values = [None]
+        # Of each symbol on the stack: the index of a token, -1 for a
+        # nonterminal, or -2 minus the index of the token of an error
+        positions = [-1]
+        p.positions, p.text, p.starts, p.lines = positions, text, starts, tokens.lines
+        state = 0
+        i = 0                       # The index of the lookahead token
+        la = types[0]               # Its type, or error
+        errors = 0                  # Tokens to shift before reporting errors again
+        while True:
+            action = table[state + la]
+
+            if action is None:
+                if not errors:
+                    error_func(None if la == end else self._error_token(tokens, i))
+                errors = error_count
+                if len(states) == 1 and la != end:
+                    # Nothing to pop, start over after the token
+                    i += 1
+                    la = types[i]
+                elif la == end:
+                    return None
+                elif la != error:
+                    if positions[-1] < -1:
+                        i += 1      # Skip the token, it doesn't follow the error
+                        la = types[i]
+                    else:
+                        la = error
+                else:
+                    # Pop until a state where the error can be shifted
+                    del states[-1], values[-1], positions[-1]
+                    state = states[-1]
+                continue
+
+            if action > 0:
+                state = action
+                states.append(state)
+                if la == error:
+                    values.append(self._error_token(tokens, i))
+                    positions.append(-2 - i)
+                else:
+                    value = fixed[la]
+                    if value is None:
+                        start = starts[i]
+                        value = text[start:start + lengths[i]]
+                        if la == id_id:
+                            value = intern_name(value)
+                    values.append(value)
+                    positions.append(i)
+                    i += 1
+                la = types[i]
+                if errors:
+                    errors -= 1
+
+            elif action < 0:
+                size, goto, func = rules[-action]
+                if func is None:
+                    if size:
+                        # The value stays on the stack, only the state changes
+                        below = states[-2]
+                        state = gotos.get((below + goto) * width + la)
+                        if state is None:
+                            state = self._goto(below, goto, la)
+                        states[-1] = state
+                        positions[-1] = -1
+                        continue
+                    values.append(None)
+                    positions.append(-1)
+                else:
+                    p[:] = values[-size - 1:]
+                    p[0] = None
+                    func(p)
+                    if size:
+                        del states[-size:]
+                        values[-size:] = p[:1]
+                        positions[-size:] = nonterminal
+                    else:
+                        values.append(p[0])
+                        positions.append(-1)
+                below = states[-1]
+                state = table[below + goto]
+                if state < 0:
+                    state = gotos.get((below + goto) * width + la)
+                    if state is None:
+                        state = self._goto(below, goto, la)
+                states.append(state)
+
+            else:
+                return values[-1]
@@ -0,0 +1,160 @@
+'''
+JSON-RPC 2.0 over a stream, used by the compile server of main.py -serve
+and by its client, uc_client.py.
+
+Each message is a JSON object on a line of its own, as in:
+
+    --> {"jsonrpc": "2.0", "id": 1, "method": "check", "params": {"code": "int main() { return 0; }"}}
+    <-- {"jsonrpc": "2.0", "id": 1, "result": {"errors": [], "output": ""}}
+
+The params are always passed by name.  The server answers the requests one
+at a time, in the order they come, on stdin/stdout or on a Unix socket,
+until it gets a "shutdown" request.  Only the standard library is used
+here, so that the client starts fast.
+'''
+
+import json
+import os
+import socket
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RPCError(Exception):
+    ''' An error answered to a request instead of its result '''
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def default_socket():
+    ''' Return the path of the socket of the server of this user '''
+    return os.environ.get('UC_SOCKET') or os.path.join(os.environ.get('TMPDIR', '/tmp'),
+                                                       'uc-%d.sock' % os.getuid())
+
+
+def _call(handlers, request):
+    ''' Return the result of the request (a dict) to one of the handlers '''
+    if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+        raise RPCError(INVALID_REQUEST, "Invalid request")
+    handler = handlers.get(request['method'])
+    if handler is None:
+        raise RPCError(METHOD_NOT_FOUND, "Unknown method: %s" % request['method'])
+    params = request.get('params', {})
+    if not isinstance(params, dict):
+        raise RPCError(INVALID_PARAMS, "The params must be an object")
+    import inspect                  # Only the server needs it
+    try:
+        inspect.signature(handler).bind(**params)
+    except TypeError as e:
+        raise RPCError(INVALID_PARAMS, str(e))
+    try:
+        return handler(**params)
+    except RPCError:
+        raise
+    except Exception as e:
+        raise RPCError(INTERNAL_ERROR, "%s: %s" % (type(e).__name__, e))
+
+
+def serve_stream(rfile, wfile, handlers):
+    '''
+    Answer the requests read from rfile, writing the responses to wfile,
+    until the end of rfile or a "shutdown" request.  handlers maps the
+    name of each method to the function answering it, which takes the
+    params as keyword arguments.  Return whether the server was shut down.
+    '''
+    for line in rfile:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            request, response = None, {'jsonrpc': '2.0', 'id': None,
+                                       'error': {'code': PARSE_ERROR, 'message': str(e)}}
+        else:
+            try:
+                if isinstance(request, dict) and request.get('method') == 'shutdown':
+                    result = None
+                else:
+                    result = _call(handlers, request)
+            except RPCError as e:
+                response = {'jsonrpc': '2.0', 'id': request.get('id') if isinstance(request, dict) else None,
+                            'error': {'code': e.code, 'message': e.message}}
+            else:
+                response = {'jsonrpc': '2.0', 'id': request.get('id'), 'result': result}
+        if not isinstance(request, dict) or 'id' in request:     # Otherwise it's a notification
+            wfile.write(json.dumps(response) + '\n')
+            wfile.flush()
+        if isinstance(request, dict) and request.get('method') == 'shutdown':
+            return True
+    return False
+
+
+def serve_socket(path, handlers):
+    '''
+    Answer the requests of the clients connecting to the Unix socket path,
+    one client at a time, until one of them sends a "shutdown" request.
+    '''
+    if os.path.exists(path):
+        try:
+            Client(path).close()
+        except OSError:
+            os.remove(path)         # Left behind by a server that died
+        else:
+            raise OSError("There is already a server on %s" % path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(path)
+        server.listen()
+        done = False
+        while not done:
+            conn, _ = server.accept()
+            with conn, conn.makefile('r', encoding='utf-8') as rfile, \
+                    conn.makefile('w', encoding='utf-8') as wfile:
+                try:
+                    done = serve_stream(rfile, wfile, handlers)
+                except OSError:
+                    pass            # The client went away
+    finally:
+        server.close()
+        os.remove(path)
+
+
+class Client(object):
+    ''' A connection to the server on the Unix socket path '''
+
+    def __init__(self, path=None):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.sock.connect(path or default_socket())
+        except OSError:
+            self.sock.close()
+            raise
+        self.rfile = self.sock.makefile('r', encoding='utf-8')
+        self.wfile = self.sock.makefile('w', encoding='utf-8')
+        self.next_id = 0
+
+    def call(self, method, **params):
+        ''' Send a request and return its result, raising RPCError on errors '''
+        self.next_id += 1
+        self.wfile.write(json.dumps({'jsonrpc': '2.0', 'id': self.next_id, 'method': method,
+                                     'params': params}) + '\n')
+        self.wfile.flush()
+        line = self.rfile.readline()
+        if not line:
+            raise RPCError(INTERNAL_ERROR, "The server closed the connection")
+        response = json.loads(line)
+        if 'error' in response:
+            raise RPCError(response['error']['code'], response['error']['message'])
+        return response['result']
+
+    def close(self):
+        self.rfile.close()
+        self.wfile.close()
+        self.sock.close()
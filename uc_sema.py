@@ -112,6 +112,7 @@ class UndoStack:
             print(i)
 
 class SymbolTable(dict):
+    """ The symbols of a scope, keyed by their symbol ids (see ast.symbol) """
     def __init__(self, decl=None):
         super().__init__()
         self.decl = decl
@@ -130,7 +131,7 @@ class Environment(object):
         self.stack = []
         self.root = SymbolTable()
         self.stack.append(self.root)
-        self.root.update({
+        self.root.update({symbol(name): type for name, type in {
             'int': IntType,
             'float': FloatType,
             'char': CharType,
@@ -141,7 +142,7 @@ class Environment(object):
             'float_array': ArrayFloatType,
             'ptr': PtrType,
             'void': VoidType
-        })
+        }.items()})
 
     def lookup(self, obj):
         for scope in reversed(self.stack):
@@ -161,7 +162,7 @@ class Environment(object):
         return len(self.stack)-1
 
     def add_local(self, obj, model):
-        self.get().add(obj.name, obj)
+        self.get().add(obj.symbol, obj)
         obj.model = model
         obj.scope = self.scope_nivel()
 
@@ -337,7 +338,7 @@ class Visitor(NodeVisitor):
             assert False, f"Size incompatible on \"{var}\" {line}"
 
     def examArrayRef(self, nodeType, init, var, line):
-        initId = self.environment.lookup(init.name.name)
+        initId = self.environment.lookup(init.name.symbol)
         if isinstance(init.subscript, Constant):
             rtype = initId.type.names[1]
             assert nodeType.type.names[0] == rtype, f"Initialization type incompatible \"{var}\" {line}"
@@ -420,7 +421,7 @@ class Visitor(NodeVisitor):
                 node.names[i] = nodeType
 
     def visit_ID(self, node):
-        var_id = self.environment.lookup(node.name)
+        var_id = self.environment.lookup(node.symbol)
         if var_id is not None:
             node.type = var_id.type
             node.model = var_id.model
@@ -544,9 +545,9 @@ class Visitor(NodeVisitor):
             while isinstance(decl_type, PtrDecl):
                 decl_type = decl_type.type
         if isinstance(decl_type, FuncDecl):
-            assert self.environment.lookup(decl_var) is not None, f"\"{decl_var}\" is not defined {coord}"
+            assert self.environment.lookup(node.name.symbol) is not None, f"\"{decl_var}\" is not defined {coord}"
         else:
-            assert self.environment.find(decl_var) is not None, f"\"{decl_var}\" is not defined"
+            assert self.environment.find(node.name.symbol) is not None, f"\"{decl_var}\" is not defined"
             if node.init is not None:
                 self.examInit(decl_type, node.init, decl_var, coord)
 
@@ -561,7 +562,7 @@ class Visitor(NodeVisitor):
         self.visit(var)
         if isinstance(var, ID):
             coord = f"{var.coord}"
-            assert not self.environment.find(var.name), f"\"{var.name}\" already defined in this scope {coord}"
+            assert not self.environment.find(var.symbol), f"\"{var.name}\" already defined in this scope {coord}"
             self.environment.add_local(var, 'var')
             var.type = node.type
 
@@ -589,7 +590,7 @@ class Visitor(NodeVisitor):
 
     def visit_FuncCall(self, node):
         coord = f"{node.coord}"
-        funcLabel = self.environment.lookup(node.name.name)
+        funcLabel = self.environment.lookup(node.name.symbol)
         assert funcLabel is not None, f"\"{node.name.name}\" is not defined {coord}"
         assert funcLabel.model == "func", f"\"{funcLabel}\" is not a function {coord}"
         node.type = funcLabel.type
@@ -607,7 +608,7 @@ class Visitor(NodeVisitor):
                     self.visit(arg)
                     coord = f"{arg.coord}"
                     if isinstance(arg, ID):
-                        assert self.environment.find(arg.name), f"\"{arg.name}\" is not defined {coord}"
+                        assert self.environment.find(arg.symbol), f"\"{arg.name}\" is not defined {coord}"
                     assert arg.type.names == fpar.type.type.names, f"Type incompatible for \"{fpar.type.declname.name}\" {coord}"
             else:
                 self.visit(node.params)
@@ -619,7 +620,7 @@ class Visitor(NodeVisitor):
 
     def visit_FuncDecl(self, node):
         self.visit(node.type)
-        func = self.environment.lookup(node.type.declname.name)
+        func = self.environment.lookup(node.type.declname.symbol)
         func.model = 'func'
         func.bind = node.params
         self.environment.push(node)
@@ -639,5 +640,5 @@ class Visitor(NodeVisitor):
             for body in node.body:
                 self.visit(body)
         self.environment.pop()
-        func = self.environment.lookup(node.decl.name.name)
+        func = self.environment.lookup(node.decl.name.symbol)
         node.spec = func.type